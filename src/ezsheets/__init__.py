@@ -7,17 +7,34 @@
 # TODO - figure out drive quotas
 # TODO - batch mode?
 
+import atexit
 import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import csv
+import datetime
+import functools
+import importlib
+import itertools
 import json
+import math
 import os.path
 import pickle
 import re
+import string
+import threading
 import time
+import warnings
+import weakref
 import webbrowser
 import http.client
-from urllib.parse import urlparse
+import io
+from urllib.parse import quote, urlparse
 
-from apiclient.http import MediaFileUpload, MediaIoBaseDownload
+from apiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -37,6 +54,13 @@ SCOPES_DRIVE = ["https://www.googleapis.com/auth/drive"]
 DRIVE_SERVICE = None
 IS_INITIALIZED = False
 
+# The credentials that init() logged in with, so that each thread can make its own authorized connection:
+_SHEETS_CREDENTIALS = None
+_DRIVE_CREDENTIALS = None
+_THREAD_LOCAL = threading.local()
+_UNSET = object()  # The default for arguments that weren't given, where None is a meaningful value.
+_BUFFERED_APPEND_SHEETS = weakref.WeakValueDictionary()  # Maps id() to the Sheets with rows waiting in their append buffer.
+
 
 DEFAULT_NEW_ROW_COUNT = 1000  # This is the Google Sheets default for a new Sheet.
 DEFAULT_NEW_COLUMN_COUNT = 26  # This is the Google Sheets default for a new Sheet.
@@ -46,12 +70,76 @@ DEFAULT_HIDE_GRID_LINES = False
 DEFAULT_ROW_GROUP_CONTROL_AFTER = False
 DEFAULT_COLUMN_GROUP_CONTROL_AFTER = False
 
+# How Sheet objects download cell values. With the default FORMATTED_VALUE, every cell is a string
+# like '3.50' or 'TRUE'. With UNFORMATTED_VALUE (or FORMULA), numbers and booleans are ints, floats,
+# and bools, and dates are serial numbers unless DEFAULT_CONVERT_DATES is True, which converts the
+# cells with date formats to datetime objects.
+VALUE_RENDER_OPTIONS = ("FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA")
+DATE_TIME_RENDER_OPTIONS = ("SERIAL_NUMBER", "FORMATTED_STRING")
+DEFAULT_VALUE_RENDER_OPTION = "FORMATTED_VALUE"
+DEFAULT_DATE_TIME_RENDER_OPTION = "SERIAL_NUMBER"
+DEFAULT_CONVERT_DATES = False
+
+# When an update*() call writes past the last row of a sheet, the sheet is enlarged to at least
+# ROW_GROWTH_FACTOR times its current rowCount, or by ROW_GROWTH_CHUNK rows, whichever is larger.
+# The defaults enlarge the sheet to exactly fit the written cells. Raising them means a loop of
+# update() calls walking down new rows doesn't make a resize request for every row.
+ROW_GROWTH_FACTOR = 1.0
+ROW_GROWTH_CHUNK = 0
+
+# If True, writes are sent as batchUpdate requests that also enlarge the sheet if needed, instead of a
+# resize request followed by a values.update request. In this mode every write's values are sent as
+# numbers, booleans, formulas, or strings (whether or not the sheet is resized) rather than parsed by
+# Google Sheets as if the user typed them, so strings like dates and percentages are stored as plain text.
+COMBINE_RESIZE_WITH_WRITES = False
+
+# Buffering for Sheet.appendRows(buffered=True). The buffer is sent when any of these limits is reached:
+APPEND_BUFFER_MAX_ROWS = 1000
+APPEND_BUFFER_MAX_BYTES = 2000000  # Google Sheets API requests should be under about 10 MB.
+APPEND_BUFFER_MAX_SECONDS = 10
+
+# The values accepted by Sheet.format()'s arguments. A numberFormat str that isn't a type is used as a pattern.
+NUMBER_FORMAT_TYPES = ("TEXT", "NUMBER", "PERCENT", "CURRENCY", "DATE", "TIME", "DATE_TIME", "SCIENTIFIC")
+HORIZONTAL_ALIGNMENTS = ("LEFT", "CENTER", "RIGHT")
+VERTICAL_ALIGNMENTS = ("TOP", "MIDDLE", "BOTTOM")
+WRAP_STRATEGIES = ("OVERFLOW_CELL", "LEGACY_WRAP", "CLIP", "WRAP")
+
+# The most sub-requests that _makeBatchRequest() puts in one multipart HTTP batch request. Google's APIs allow
+# up to 100 (Drive) or 1000 (Sheets) per batch, but each sub-request still counts against the quota.
+HTTP_BATCH_MAX_SIZE = 100
+
+# The number of bytes requested at a time by the downloadAs*() methods and iterDownload():
+DOWNLOAD_CHUNK_SIZE = 100 * 1024 * 1024
+
+# upload() sends files in chunks of this many bytes, and retries each chunk this many times:
+UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+UPLOAD_NUM_RETRIES = 5
+
+# The MIME types of the files that upload() can convert to Google Sheets spreadsheets:
+_UPLOAD_MIME_TYPES = {
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".ods": "application/x-vnd.oasis.opendocument.spreadsheet",
+    ".csv": "text/csv",
+    ".tsv": "text/tab-separated-values",
+}
+
+# The MIME types that Google Drive exports spreadsheets as, keyed by file extension:
+_FILE_TYPES = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "ods": "application/x-vnd.oasis.opendocument.spreadsheet",
+    "pdf": "application/pdf",
+    "zip": "application/zip",  # a zip file of html files
+    "tsv": "text/tab-separated-values",
+}
+
 # Quota throttling:
 _READ_REQUESTS = collections.deque()
 _WRITE_REQUESTS = collections.deque()
 READ_QUOTA = 90  # 50 reads per 100 seconds
 WRITE_QUOTA = 90  # 50 writes per 100 seconds
 IGNORE_QUOTA = False
+_QUOTA_LOCK = threading.RLock()  # Lets threads making requests at the same time share the quota deques.
 """ TODO - create a context manager to wrap calls, so that we can do both
 preventative throttling and automated retries if it somehow raises an exception.
 Also, use a sqlite database so that multiple scripts use the same queue.
@@ -74,21 +162,22 @@ def _logWriteRequest():
     By default, WRITE_QUOTA is set to 100 so that only 100 read requests can be
     made in the last 101 seconds.
     """
-    _WRITE_REQUESTS.append(time.time())
-    while _WRITE_REQUESTS[0] < time.time() - 101:  # 101 seconds rather than 100 in case of general inaccuracy
-        _WRITE_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds.
-
-    if IGNORE_QUOTA:
-        return  # Don't throttle.
-
-    # Throttle if necessary:
-    while len(_WRITE_REQUESTS) > (
-        WRITE_QUOTA - 1
-    ):  # pragma: no cover Note that the actual quota is one less than WRITE_QUOTA
-        time.sleep(1)
-        while _WRITE_REQUESTS[0] < time.time() - 101:
+    with _QUOTA_LOCK:
+        _WRITE_REQUESTS.append(time.time())
+        while _WRITE_REQUESTS[0] < time.time() - 101:  # 101 seconds rather than 100 in case of general inaccuracy
             _WRITE_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds.
 
+        if IGNORE_QUOTA:
+            return  # Don't throttle.
+
+        # Throttle if necessary:
+        while len(_WRITE_REQUESTS) > (
+            WRITE_QUOTA - 1
+        ):  # pragma: no cover Note that the actual quota is one less than WRITE_QUOTA
+            time.sleep(1)
+            while _WRITE_REQUESTS[0] < time.time() - 101:
+                _WRITE_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds.
+
 
 def _logReadRequest():
     """
@@ -99,71 +188,189 @@ def _logReadRequest():
     By default, READ_QUOTA is set to 50 so that only 50 read requests can be
     made in the last 101 seconds.
     """
-    _READ_REQUESTS.append(time.time())
-    while _READ_REQUESTS[0] < time.time() - 101:  # 101 seconds rather than 100 in case of general inaccuracy
-        _READ_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds
-
-    if IGNORE_QUOTA:
-        return  # Don't throttle.
-
-    while len(_READ_REQUESTS) > (
-        READ_QUOTA - 1
-    ):  # pragma: no cover Note that the actual quota is one less than READ_QUOTA
-        time.sleep(1)
-        while _READ_REQUESTS[0] < time.time() - 101:
+    with _QUOTA_LOCK:
+        _READ_REQUESTS.append(time.time())
+        while _READ_REQUESTS[0] < time.time() - 101:  # 101 seconds rather than 100 in case of general inaccuracy
             _READ_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds
 
+        if IGNORE_QUOTA:
+            return  # Don't throttle.
+
+        while len(_READ_REQUESTS) > (
+            READ_QUOTA - 1
+        ):  # pragma: no cover Note that the actual quota is one less than READ_QUOTA
+            time.sleep(1)
+            while _READ_REQUESTS[0] < time.time() - 101:
+                _READ_REQUESTS.popleft()  # Get rid of all entries older than 100 seconds
+
+
+def _getThreadHttp(isDrive=False):
+    """
+    Returns an authorized http object for the current thread to pass to a request's execute(), or
+    None to use the service's own http object. The httplib2 objects that the services use aren't
+    thread-safe, so threads other than the main thread each get their own connection.
+    """
+    credentials = _DRIVE_CREDENTIALS if isDrive else _SHEETS_CREDENTIALS
+    if credentials is None or threading.current_thread() is threading.main_thread():
+        return None
+
+    attrName = "driveHttp" if isDrive else "sheetsHttp"
+    if not hasattr(_THREAD_LOCAL, attrName):
+        setattr(_THREAD_LOCAL, attrName, google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http()))
+    return getattr(_THREAD_LOCAL, attrName)
+
+
+def _runInThreads(func, argsList, workers):
+    # Return a list of the return values of calling func with each tuple of arguments in argsList,
+    # using up to `workers` threads. Exceptions raised by func are re-raised.
+    if workers is None or workers <= 1 or len(argsList) <= 1:
+        return [func(*args) for args in argsList]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, *args) for args in argsList]
+        return [future.result() for future in futures]
+
+
+def _getRequest(requestType, **kwargs):
+    # Return the googleapiclient request object for `requestType`, logging it against the read or write quota.
+    # TODO - do some of these requests count as a read AND write?
+    if requestType == "get":
+        request = SHEETS_SERVICE.spreadsheets().get(**kwargs)
+        _logReadRequest()
+    elif requestType == "batchUpdate":
+        request = SHEETS_SERVICE.spreadsheets().batchUpdate(**kwargs)
+        _logWriteRequest()
+    elif requestType == "values.get":
+        request = SHEETS_SERVICE.spreadsheets().values().get(**kwargs)
+        _logReadRequest()
+    elif requestType == "values.batchGet":
+        request = SHEETS_SERVICE.spreadsheets().values().batchGet(**kwargs)
+        _logReadRequest()
+    elif requestType == "values.update":
+        request = SHEETS_SERVICE.spreadsheets().values().update(**kwargs)
+        _logWriteRequest()
+    elif requestType == "values.clear":
+        request = SHEETS_SERVICE.spreadsheets().values().clear(**kwargs)
+        _logWriteRequest()
+    elif requestType == "values.append":
+        request = SHEETS_SERVICE.spreadsheets().values().append(**kwargs)
+        _logWriteRequest()
+    elif requestType == "sheets.copyTo":
+        request = SHEETS_SERVICE.spreadsheets().sheets().copyTo(**kwargs)
+        _logWriteRequest()
+    elif requestType == "create":
+        request = SHEETS_SERVICE.spreadsheets().create(**kwargs)
+        _logWriteRequest()
+    elif requestType == "drive.export":
+        request = DRIVE_SERVICE.files().export(**kwargs)
+        _logReadRequest()
+    elif requestType == "drive.delete":
+        request = DRIVE_SERVICE.files().delete(**kwargs)
+        _logWriteRequest()
+    elif requestType == "drive.update":
+        request = DRIVE_SERVICE.files().update(**kwargs)
+        _logWriteRequest()
+    elif requestType == "drive.get":
+        request = DRIVE_SERVICE.files().get(**kwargs)
+        _logReadRequest()
+    elif requestType == "drive.list":
+        request = DRIVE_SERVICE.files().list(**kwargs)
+        _logReadRequest()
+    elif requestType == "drive.create":
+        request = DRIVE_SERVICE.files().create(**kwargs)
+        _logWriteRequest()
+    else:
+        assert False, "Invalid requestType: %r" % (requestType)
+    return request
+
+
+def _isQuotaError(exc):
+    # Return True if `exc` is the HttpError that Google's APIs raise when the quota has been used up.
+    if not isinstance(exc, HttpError):
+        return False
+    try:
+        errorContent = json.loads(str(exc.content, encoding="utf-8"))
+        return errorContent["error"]["status"] == "RESOURCE_EXHAUSTED"
+    except (ValueError, KeyError, TypeError):
+        return False
+
 
 def _makeRequest(requestType, **kwargs):
     pauseLength = 10
     while True:
-        # TODO - do some of these requests count as a read AND write?
-        if requestType == "get":
-            request = SHEETS_SERVICE.spreadsheets().get(**kwargs)
-            _logReadRequest()
-        elif requestType == "batchUpdate":
-            request = SHEETS_SERVICE.spreadsheets().batchUpdate(**kwargs)
-            _logWriteRequest()
-        elif requestType == "values.get":
-            request = SHEETS_SERVICE.spreadsheets().values().get(**kwargs)
-            _logReadRequest()
-        elif requestType == "values.update":
-            request = SHEETS_SERVICE.spreadsheets().values().update(**kwargs)
-            _logWriteRequest()
-        elif requestType == "sheets.copyTo":
-            request = SHEETS_SERVICE.spreadsheets().sheets().copyTo(**kwargs)
-            _logWriteRequest()
-        elif requestType == "create":
-            request = SHEETS_SERVICE.spreadsheets().create(**kwargs)
-            _logWriteRequest()
-        elif requestType == "drive.export":
-            request = DRIVE_SERVICE.files().export(**kwargs)
-            _logReadRequest()
-        elif requestType == "drive.delete":
-            request = DRIVE_SERVICE.files().delete(**kwargs)
-            _logWriteRequest()
-        elif requestType == "drive.update":
-            request = DRIVE_SERVICE.files().update(**kwargs)
-            _logWriteRequest()
-        elif requestType == "drive.list":
-            request = DRIVE_SERVICE.files().list(**kwargs)
-            _logReadRequest()
-        elif requestType == "drive.create":
-            request = DRIVE_SERVICE.files().create(**kwargs)
-            _logWriteRequest()
-        else:
-            assert False, "Invalid requestType: %r" % (requestType)
+        request = _getRequest(requestType, **kwargs)
+
+        try:
+            return request.execute(http=_getThreadHttp(requestType.startswith("drive.")))
+        except HttpError as e:
+            if not _isQuotaError(e):
+                raise  # Some other, non-quota-related HttpError was raised, so we'll just re-raise it here.
+            if pauseLength == 50:
+                raise  # Throttling doesn't seem to work. Give up, and re-raise the error.
+            time.sleep(pauseLength)
+            pauseLength += 5
+
 
+def _makeMediaRequest(nextChunk, logRequest):
+    # Call `nextChunk` (the next_chunk method of a resumable upload request or a MediaIoBaseDownload) and
+    # return what it returns. If the quota has been used up, the chunk is retried the way _makeRequest()
+    # retries, and `logRequest` (_logReadRequest or _logWriteRequest) is called before each retry.
+    pauseLength = 10
+    while True:
         try:
-            return request.execute()
+            return nextChunk()
         except HttpError as e:
-            errorContent = json.loads(str(e.content, encoding="utf-8"))
-            if errorContent['error']['status'] != 'RESOURCE_EXHAUSTED':
+            if not _isQuotaError(e):
                 raise  # Some other, non-quota-related HttpError was raised, so we'll just re-raise it here.
             if pauseLength == 50:
                 raise  # Throttling doesn't seem to work. Give up, and re-raise the error.
             time.sleep(pauseLength)
             pauseLength += 5
+            logRequest()
+
+
+def _makeBatchRequest(requests):
+    """
+    Send the (requestType, kwargs) tuples in `requests` as multipart HTTP batch requests of up to
+    HTTP_BATCH_MAX_SIZE sub-requests each, and return a list of their responses in the same order. Sheets
+    and Drive requests are sent in separate batches. A sub-request that fails (or is in a batch that fails)
+    has its exception in place of its response. Each sub-request counts against the quota, and sub-requests
+    that fail because the quota is used up are retried in a later batch, the way _makeRequest() retries.
+    """
+    results = [None] * len(requests)
+    pending = list(range(len(requests)))
+    pauseLength = 10
+    while pending:
+        retries = []
+
+        def callback(requestId, response, exception):
+            i = int(requestId)
+            if exception is not None and pauseLength < 50 and _isQuotaError(exception):
+                retries.append(i)
+            else:
+                results[i] = response if exception is None else exception
+
+        for isDrive in (False, True):
+            indexes = [i for i in pending if requests[i][0].startswith("drive.") == isDrive]
+            for start in range(0, len(indexes), HTTP_BATCH_MAX_SIZE):
+                chunk = indexes[start : start + HTTP_BATCH_MAX_SIZE]
+                try:
+                    batch = (DRIVE_SERVICE if isDrive else SHEETS_SERVICE).new_batch_http_request()
+                    for i in chunk:
+                        requestType, kwargs = requests[i]
+                        batch.add(_getRequest(requestType, **kwargs), callback=callback, request_id=str(i))
+                    batch.execute(http=_getThreadHttp(isDrive))
+                except Exception as exc:
+                    # The whole batch failed (for example, the connection dropped), so this exception is the
+                    # result of each of its sub-requests that didn't already get a response.
+                    for i in chunk:
+                        if results[i] is None and i not in retries:
+                            results[i] = exc
+
+        if retries:
+            time.sleep(pauseLength)
+            pauseLength += 5
+        pending = sorted(retries)
+    return results
 
 
 class EZSheetsException(Exception):
@@ -179,15 +386,25 @@ class Spreadsheet:
     contain one or more sheets, also called worksheets.
     """
 
-    def __init__(self, spreadsheetId=None):
+    def __init__(self, spreadsheetId=None, lazy=False):
         """
         Initializer for Spreadsheet objects.
 
         :param spreadsheetId: The ID or URL of the spreadsheet on Google Sheets. E.g. `'https://docs.google.com/spreadsheets/d/10tRbpHZYkfRecHyRHRjBLdQYoq5QWNBqZmH9tt4Tjng/edit#gid=0'` or `'10tRbpHZYkfRecHyRHRjBLdQYoq5QWNBqZmH9tt4Tjng'`
+        :param lazy: If True, no requests are made until an attribute other than the id is first used. The
+            spreadsheetId must be an ID or docs.google.com URL, not a title.
         """
         if not IS_INITIALIZED:
             init()  # Initialize this module if not done so already.
 
+        self._pendingFormatRequests = None  # (GridRange, CellFormat) pairs waiting for a batchFormatting() block to end.
+        if lazy:
+            if spreadsheetId is None:
+                raise ValueError("A spreadsheetId is required for lazily loaded Spreadsheet objects.")
+            self._spreadsheetId = getIdFromUrl(spreadsheetId)
+            self._lazy = True  # __getattr__() calls refresh() when the other attributes are first used.
+            return
+
         if spreadsheetId is None:
             # Create a new spreadsheet.
             ss = createSpreadsheet()
@@ -248,6 +465,23 @@ class Spreadsheet:
         self.sheets = ()
         self.refresh()
 
+    def __getattr__(self, name):
+        # This is only called for attributes that don't exist, such as the ones of a lazily loaded
+        # Spreadsheet object that haven't been loaded yet.
+        if name.startswith("__") or not self.__dict__.get("_lazy"):
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+        unloaded = dict(self.__dict__)
+        self.sheets = ()
+        try:
+            self.refresh()
+        except Exception:
+            # Forget any partly loaded attributes, so that the next attribute use tries loading again:
+            self.__dict__.clear()
+            self.__dict__.update(unloaded)
+            raise
+        self._lazy = False
+        return getattr(self, name)
+
     def refresh(self):
         """
         Updates this Spreadsheet object's Sheet objects with the current data
@@ -336,14 +570,7 @@ class Spreadsheet:
             indexesToDelete = [
                 i for i in range(start, stop, step) if i >= 0 and i < len(self.sheets)
             ]  # Don't include invalid or negative indexes.
-            if len(indexesToDelete) == len(self.sheets):
-                raise ValueError("Cannot delete all sheets; spreadsheets must have at least one sheet")
-
-            if indexesToDelete[0] < indexesToDelete[-1]:
-                indexesToDelete.reverse()  # We want this is descending order.
-
-            for i in indexesToDelete:
-                self.sheets[i].delete()
+            self.deleteSheets(indexesToDelete)  # Raises ValueError if this would delete all the sheets.
 
         else:
             raise TypeError("key must be an int index, str sheet title, or slice object, not %r" % (type(key).__name__))
@@ -437,61 +664,229 @@ class Spreadsheet:
             # Set the index to make this new sheet be the last sheet:
             index = len(self.sheets)
 
-        # request = SHEETS_SERVICE.spreadsheets().batchUpdate(spreadsheetId=self._spreadsheetId,
-        # body={
-        #    'requests': [{'addSheet': {'properties': {'title': title, 'index': index}}}]})
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
+        # The addSheet request sets the grid size too, and the response's spreadsheet properties update
+        # self.sheets without downloading every sheet's data again.
+        return self.createSheets([{"title": title, "index": index, "columnCount": columnCount, "rowCount": rowCount}])[0]
+
+    def iterDownload(self, fileType="csv", chunkSize=None, progressCallback=None):
+        """
+        Export this Spreadsheet from Google Drive and yield the file's contents as bytes objects, one
+        chunk at a time, without writing to disk. `fileType` is one of 'csv', 'xlsx', 'ods', 'pdf', 'zip'
+        (a zip file of HTML files), or 'tsv'. The csv and tsv file types only contain the first sheet.
+
+        :param chunkSize: The number of bytes requested at a time. Defaults to DOWNLOAD_CHUNK_SIZE.
+        :param progressCallback: If given, this is called with the number of bytes downloaded so far and
+            the total size in bytes (or None if Google Drive doesn't report it) after each chunk.
+        """
+        return _iterExport(self._spreadsheetId, fileType, chunkSize, progressCallback)
+
+    def createSheets(self, sheets):
+        """
+        Create several new Sheet objects in this Spreadsheet with a single request, and return a list of them.
+        Each item in `sheets` is a title str or a dict with 'title', 'index', 'columnCount', and 'rowCount' keys,
+        which have the same defaults as createSheet()'s arguments.
+        """
+        requests = []
+        for sheet in sheets:
+            if isinstance(sheet, str):
+                sheet = {"title": sheet}
+            elif not isinstance(sheet, dict):
+                raise TypeError("sheets must contain title strs or dicts, not %s" % (type(sheet).__name__))
+            properties = {
+                "title": sheet.get("title", ""),
+                "gridProperties": {
+                    "rowCount": sheet.get("rowCount", DEFAULT_NEW_ROW_COUNT),
+                    "columnCount": sheet.get("columnCount", DEFAULT_NEW_COLUMN_COUNT),
+                },
+            }
+            if sheet.get("index") is not None:
+                properties["index"] = sheet["index"]
+            requests.append({"addSheet": {"properties": properties}})
+        if not requests:
+            return []
+
+        response = self._batchUpdateSheets(requests)
+        newSheetIds = [reply["addSheet"]["properties"]["sheetId"] for reply in response["replies"]]
+        return [[sheet for sheet in self.sheets if sheet._sheetId == sheetId][0] for sheetId in newSheetIds]
+
+    def deleteSheets(self, sheets):
+        """
+        Delete several sheets from this Spreadsheet with a single request. Each item in `sheets` is a Sheet
+        object, an int index, or a title str.
+        """
+        sheetIds = []
+        for sheet in sheets:
+            if not isinstance(sheet, Sheet):
+                sheet = self[sheet]
+            if sheet._sheetId not in sheetIds:
+                sheetIds.append(sheet._sheetId)
+        if len(sheetIds) == len(self.sheets):
+            raise ValueError("Cannot delete all sheets; spreadsheets must have at least one sheet")
+        if not sheetIds:
+            return
+
+        self._batchUpdateSheets([{"deleteSheet": {"sheetId": sheetId}} for sheetId in sheetIds])
+
+    def _batchUpdateSheets(self, requests):
+        # Send a batchUpdate request that adds, deletes, or changes sheets, and update this Spreadsheet's Sheet
+        # objects from the spreadsheet properties in the response instead of downloading the sheets' data again.
+        response = _makeRequest(
             "batchUpdate",
             **{
                 "spreadsheetId": self._spreadsheetId,
-                "body": {"requests": [{"addSheet": {"properties": {"title": title, "index": index}}}]},
+                "body": {"requests": requests, "includeSpreadsheetInResponse": True, "responseIncludeGridData": False},
             }
         )
+        self._refreshWithSpreadsheetDict(response["updatedSpreadsheet"])
+        return response
 
-        self.refresh()
-        self.sheets[index].resize(columnCount, rowCount)
-        return self.sheets[index]
-
-    def _download(self, filename=None, _fileType="spreadsheet"):
-        fileTypes = {
-            "csv": "text/csv",
-            "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "ods": "application/x-vnd.oasis.opendocument.spreadsheet",
-            "pdf": "application/pdf",
-            "zip": "application/zip",  # a zip file of html files
-            "tsv": "text/tab-separated-values",
-        }
+    @contextlib.contextmanager
+    def batchFormatting(self):
+        """
+        A context manager that holds the formatting from Sheet.format() calls on this Spreadsheet's sheets and
+        sends it in one batchUpdate request when the `with` block ends. Formatting for the same range is merged
+        into one repeatCell request, as is the same formatting for ranges that together form a rectangle.
+        Nothing is sent if the block raises an exception.
+        """
+        if self._pendingFormatRequests is not None:
+            yield self  # Nested blocks send their formatting with the outermost block.
+            return
+
+        self._pendingFormatRequests = []
+        try:
+            yield self
+            pending = self._pendingFormatRequests
+        finally:
+            self._pendingFormatRequests = None
+        self._sendFormatRequests(pending)
+
+    def _queueFormatRequest(self, gridRange, cellFormat):
+        # Hold the formatting until the batchFormatting() block ends, or send it now if there is no block.
+        if self._pendingFormatRequests is None:
+            self._sendFormatRequests([(gridRange, cellFormat)])
+        else:
+            _mergeFormatRequest(self._pendingFormatRequests, gridRange, cellFormat)
+
+    def _sendFormatRequests(self, pending):
+        if not pending:
+            return
+        requests = [_getRepeatCellRequest(gridRange, cellFormat) for gridRange, cellFormat in pending]
+        _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheetId, "body": {"requests": requests}})
+
+    def _refreshWithSpreadsheetDict(self, spreadsheetDict):
+        # Update the title and the tuple of Sheet objects from a Spreadsheet dict in a Google Sheets response.
+        # Existing Sheet objects keep their local data, and Sheet objects for sheets that weren't seen before
+        # are assumed to be new and empty.
+        self._title = spreadsheetDict["properties"]["title"]
+        existingSheets = dict([(sheet._sheetId, sheet) for sheet in self.sheets])
+        replacementSheetsAttr = []
+        for sheetInfo in spreadsheetDict["sheets"]:
+            sheetId = sheetInfo["properties"]["sheetId"]
+            if sheetId in existingSheets:
+                existingSheets[sheetId]._refreshPropertiesWithSheetPropertiesDict(sheetInfo["properties"])
+                replacementSheetsAttr.append(existingSheets[sheetId])
+            else:
+                replacementSheetsAttr.append(Sheet(self, sheetId, properties=sheetInfo["properties"]))
+        self.sheets = tuple(replacementSheetsAttr)
+
+    def _download(self, filename=None, _fileType="spreadsheet", chunkSize=None, progressCallback=None):
+        # `filename` can also be a binary file-like object, which is written to and returned without being closed.
+        if hasattr(filename, "write"):
+            for chunk in self.iterDownload(_fileType, chunkSize, progressCallback):
+                filename.write(chunk)
+            return filename
 
         if filename is None:
             filename = _makeFilenameSafe(self._title) + "." + _fileType
 
-        request = DRIVE_SERVICE.files().export(fileId=self._spreadsheetId, mimeType=fileTypes[_fileType])
-        fh = open(filename, "wb")
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
+        with open(filename, "wb") as fh:
+            for chunk in self.iterDownload(_fileType, chunkSize, progressCallback):
+                fh.write(chunk)
 
         return filename
 
-    def downloadAsCSV(self, filename=None):
-        return self._download(filename, "csv")
+    def downloadAsCSV(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "csv", chunkSize, progressCallback)
 
-    def downloadAsExcel(self, filename=None):
-        return self._download(filename, "xlsx")
+    def downloadAsExcel(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "xlsx", chunkSize, progressCallback)
 
-    def downloadAsODS(self, filename=None):
-        return self._download(filename, "ods")
+    def downloadAsODS(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "ods", chunkSize, progressCallback)
 
-    def downloadAsPDF(self, filename=None):
-        return self._download(filename, "pdf")
+    def downloadAsPDF(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "pdf", chunkSize, progressCallback)
 
-    def downloadAsHTML(self, filename=None):
-        return self._download(filename, "zip")
+    def downloadAsHTML(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "zip", chunkSize, progressCallback)
 
-    def downloadAsTSV(self, filename=None):
-        return self._download(filename, "tsv")
+    def downloadAsTSV(self, filename=None, chunkSize=None, progressCallback=None):
+        return self._download(filename, "tsv", chunkSize, progressCallback)
+
+    def exportAllSheets(self, fileType="csv", dirname=".", workers=1):
+        """
+        Write every sheet in this Spreadsheet to its own CSV or TSV file named after the sheet's title in
+        the `dirname` folder, and return a list of the filenames. Unlike downloadAsCSV(), this doesn't
+        only export the first sheet. The sheets are split into `workers` groups that are each fetched
+        with one values.batchGet request on their own thread.
+        """
+        if fileType not in ("csv", "tsv"):
+            raise ValueError('fileType must be "csv" or "tsv", not %r' % (fileType,))
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive int, not %r" % (workers,))
+
+        sheets = list(self.sheets)
+        groupSize = max(1, int(math.ceil(len(sheets) / workers)))
+        groups = [sheets[i : i + groupSize] for i in range(0, len(sheets), groupSize)]
+
+        os.makedirs(dirname, exist_ok=True)
+
+        def exportGroup(group):
+            response = _makeRequest(
+                "values.batchGet",
+                **{
+                    "spreadsheetId": self._spreadsheetId,
+                    "ranges": ["%s!A1:%s%s" % (sheet.title, getColumnLetterOf(sheet.columnCount), sheet.rowCount) for sheet in group],
+                }
+            )
+            filenames = []
+            for sheet, valueRange in zip(group, response.get("valueRanges", [])):
+                filename = os.path.join(dirname, _makeFilenameSafe(sheet.title) + "." + fileType)
+                _writeDelimitedFile(valueRange.get("values", []), filename, "," if fileType == "csv" else "\t")
+                filenames.append(filename)
+            return filenames
+
+        filenames = []
+        for groupFilenames in _runInThreads(exportGroup, [(group,) for group in groups], workers):
+            filenames.extend(groupFilenames)
+        return filenames
+
+    def snapshotToParquet(self, dirname=".", header=1):
+        """
+        Write every sheet in this Spreadsheet to a Parquet file named after the sheet's title in the
+        `dirname` folder, and return a list of the filenames. All sheets are fetched with a single
+        request, and the numbers and booleans are kept as typed Parquet columns. See `Sheet.toArrow()`
+        for the `header` argument. This requires the pyarrow module.
+        """
+        _importOptional("pyarrow", "snapshotToParquet()")
+        parquet = importlib.import_module("pyarrow.parquet")
+
+        response = _makeRequest(
+            "values.batchGet",
+            **{
+                "spreadsheetId": self._spreadsheetId,
+                "ranges": ["%s!A1:%s%s" % (sheet.title, getColumnLetterOf(sheet.columnCount), sheet.rowCount) for sheet in self.sheets],
+                "valueRenderOption": "UNFORMATTED_VALUE",
+            }
+        )
+
+        os.makedirs(dirname, exist_ok=True)
+        filenames = []
+        for sheet, valueRange in zip(self.sheets, response.get("valueRanges", [])):
+            filename = os.path.join(dirname, _makeFilenameSafe(sheet.title) + ".parquet")
+            parquet.write_table(_convertRowsToArrow(valueRange.get("values", []), header), filename)
+            filenames.append(filename)
+        return filenames
 
     def delete(self, permanent=False):
         if permanent:
@@ -538,9 +933,10 @@ class Sheet:
     are composed of columns and rows of cells, which contain a single string value.
     """
 
-    def __init__(self, spreadsheet, sheetId):
+    def __init__(self, spreadsheet, sheetId, properties=None):
         """
-        TODO
+        Initializer for Sheet objects. If `properties` (a SheetProperties dict from a Google Sheets response)
+        is given, the sheet is assumed to be new and empty, and no requests are made.
         """
         if not IS_INITIALIZED:
             init()  # Initialize this module if not done so already. # This line might not be needed? Sheet objects can only exist when you've already made a Spreadsheet object.
@@ -551,7 +947,21 @@ class Sheet:
         self._cells = (
             {}
         )  # To ease development, internally the local copy of the sheet data is stored in a dict with 1-based (column, row) keys.
-        self.refresh()
+        self._valueIndex = None  # Built by find() and findAll(). Maps _getIndexKey(value) to a set of (column, row) keys.
+        self._rowCellCounts = collections.Counter()  # The number of cells in `_cells` in each row.
+        self._columnCellCounts = collections.Counter()  # The number of cells in `_cells` in each column.
+        self._usedExtent = (0, 0)  # The (column, row) of the last used column and row, or None if it needs recounting.
+        self._appendBuffer = []  # Rows waiting to be sent by flushAppends().
+        self._appendBufferBytes = 0
+        self._appendBufferStartTime = None
+        self._pendingProperties = None  # Property changes waiting for the end of an editProperties() block.
+        self._valueRenderOption = DEFAULT_VALUE_RENDER_OPTION
+        self._dateTimeRenderOption = DEFAULT_DATE_TIME_RENDER_OPTION
+        self._convertDates = DEFAULT_CONVERT_DATES
+        if properties is None:
+            self.refresh()
+        else:
+            self._refreshPropertiesWithSheetPropertiesDict(properties)
 
     # Set up the read-only attributes.
     @property
@@ -561,6 +971,60 @@ class Sheet:
         """
         return self._spreadsheet
 
+    @property
+    def valueRenderOption(self):
+        """
+        How this Sheet downloads cell values: 'FORMATTED_VALUE' (the default) gets every value as the
+        string shown in the browser, 'UNFORMATTED_VALUE' gets numbers and booleans as ints, floats, and
+        bools, and 'FORMULA' is like 'UNFORMATTED_VALUE' but gets formulas instead of their results.
+        Setting this re-downloads the sheet's data.
+        """
+        return self._valueRenderOption
+
+    @valueRenderOption.setter
+    def valueRenderOption(self, value):
+        if value not in VALUE_RENDER_OPTIONS:
+            raise ValueError("valueRenderOption must be one of %r, not %r" % (VALUE_RENDER_OPTIONS, value))
+        if value != self._valueRenderOption:
+            self._valueRenderOption = value
+            self._refreshData()
+
+    @property
+    def dateTimeRenderOption(self):
+        """
+        How this Sheet downloads dates and times when valueRenderOption isn't 'FORMATTED_VALUE':
+        'SERIAL_NUMBER' (the default) gets them as a float number of days since December 30, 1899, and
+        'FORMATTED_STRING' gets them as the string shown in the browser. Setting this re-downloads the
+        sheet's data.
+        """
+        return self._dateTimeRenderOption
+
+    @dateTimeRenderOption.setter
+    def dateTimeRenderOption(self, value):
+        if value not in DATE_TIME_RENDER_OPTIONS:
+            raise ValueError("dateTimeRenderOption must be one of %r, not %r" % (DATE_TIME_RENDER_OPTIONS, value))
+        if value != self._dateTimeRenderOption:
+            self._dateTimeRenderOption = value
+            self._refreshData()
+
+    @property
+    def convertDates(self):
+        """
+        If True, the serial numbers of cells with a date, time, or date-time number format are
+        converted to date, time, or datetime objects. This makes one extra request for the cells'
+        formats each time the sheet's data is downloaded, and only has an effect when
+        valueRenderOption isn't 'FORMATTED_VALUE' and dateTimeRenderOption is 'SERIAL_NUMBER'.
+        Setting this re-downloads the sheet's data.
+        """
+        return self._convertDates
+
+    @convertDates.setter
+    def convertDates(self, value):
+        value = bool(value)
+        if value != self._convertDates:
+            self._convertDates = value
+            self._refreshData()
+
     @property
     def title(self):
         """
@@ -570,30 +1034,7 @@ class Sheet:
 
     @title.setter
     def title(self, value):
-        value = str(value)
-        # request = SHEETS_SERVICE.spreadsheets().batchUpdate(spreadsheetId=self._spreadsheet.spreadsheetId,
-        # body={
-        #    'requests': [{'updateSheetProperties': {'properties': {'sheetId': self._sheetId,
-        #                                                           'title': value},
-        #                                            'fields': 'title'}}]})
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "batchUpdate",
-            **{
-                "spreadsheetId": self._spreadsheet.spreadsheetId,
-                "body": {
-                    "requests": [
-                        {
-                            "updateSheetProperties": {
-                                "properties": {"sheetId": self._sheetId, "title": value},
-                                "fields": "title",
-                            }
-                        }
-                    ]
-                },
-            }
-        )
-        self._title = value
+        self.setProperties(title=value)
 
     @property
     def tabColor(self):
@@ -604,31 +1045,7 @@ class Sheet:
 
     @tabColor.setter
     def tabColor(self, value):
-        tabColorArg = _getTabColorArg(value)
-
-        # request = SHEETS_SERVICE.spreadsheets().batchUpdate(spreadsheetId=self._spreadsheet.spreadsheetId,
-        # body={
-        #    'requests': [{'updateSheetProperties': {'properties': {'sheetId': self._sheetId,
-        #                                                           'tabColor': tabColorArg},
-        #                                            'fields': 'tabColor'}}]})
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "batchUpdate",
-            **{
-                "spreadsheetId": self._spreadsheet.spreadsheetId,
-                "body": {
-                    "requests": [
-                        {
-                            "updateSheetProperties": {
-                                "properties": {"sheetId": self._sheetId, "tabColor": tabColorArg},
-                                "fields": "tabColor",
-                            }
-                        }
-                    ]
-                },
-            }
-        )
-        self._tabColor = tabColorArg
+        self.setProperties(tabColor=value)
 
     @property
     def index(self):
@@ -639,52 +1056,7 @@ class Sheet:
 
     @index.setter
     def index(self, value):
-        if value == self._index:
-            return  # No change needed.
-
-        if not isinstance(value, int):
-            raise TypeError("indices must be integers, not %s" % (type(value).__name__))
-
-        if value < 0:  # Handle negative indexes the way Python lists do.
-            if value < -len(self.spreadsheet.sheets):
-                raise IndexError("%r is out of range (-1 to %d)" % (value, -len(self.spreadsheet.sheets)))
-            value = (
-                len(self.spreadsheet.sheets) + value
-            )  # convert this negative index into its corresponding positive index
-        if value >= len(self.spreadsheet.sheets):
-            raise IndexError("%r is out of range (0 to %d)" % (value, len(self.spreadsheet.sheets) - 1))
-
-        # Update the index:
-        if value > self._index:
-            # Google Sheets uses "before the move" indexes, which is confusing and I don't want to do it here.
-            value += 1
-
-
-        # request = SHEETS_SERVICE.spreadsheets().batchUpdate(spreadsheetId=self._spreadsheet._spreadsheetId,
-        # body={
-        #    'requests': [{'updateSheetProperties': {'properties': {'sheetId': self._sheetId,
-        #                                                           'index': value},
-        #                                            'fields': 'index'}}]})
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "batchUpdate",
-            **{
-                "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "body": {
-                    "requests": [
-                        {
-                            "updateSheetProperties": {
-                                "properties": {"sheetId": self._sheetId, "index": value},
-                                "fields": "index",
-                            }
-                        }
-                    ]
-                },
-            }
-        )
-
-        self._spreadsheet.refresh()  # Update the spreadsheet's tuple of Sheet objects to reflect the new order.
-        # self._index = self._spreadsheet.sheets.index(self) # Update the local Sheet object's index.
+        self.setProperties(index=value)
 
     def __eq__(self, other):
         """
@@ -719,20 +1091,9 @@ class Sheet:
 
     @rowCount.setter
     def rowCount(self, value):
-        # Validate arguments:
         if not isinstance(value, int):
             raise TypeError("value arg must be an int, not %s" % (type(value).__name__))
-        if value < 1:
-            raise TypeError("value arg must be a positive nonzero int, not %r" % (value))
-        if value <= self._frozenRowCount:
-            raise ValueError(
-                "You cannot have all rows on the sheet frozen (sheet %r has %s frozen rows)"
-                % (self.title, self._frozenRowCount)
-            )
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._rowCount = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(rowCount=value)
 
     @property
     def columnCount(self):
@@ -743,20 +1104,9 @@ class Sheet:
 
     @columnCount.setter
     def columnCount(self, value):
-        # Validate arguments:
         if not isinstance(value, int):
             raise TypeError("value arg must be an int, not %s" % (type(value).__name__))
-        if value < 1:
-            raise TypeError("value arg must be a positive nonzero int, not %r" % (value))
-        if value <= self._frozenColumnCount:
-            raise ValueError(
-                "You cannot have all columns on the sheet frozen (sheet %r has %s frozen columns)"
-                % (self.title, self._frozenColumnCount)
-            )
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._columnCount = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(columnCount=value)
 
     @property
     def frozenRowCount(self):
@@ -769,19 +1119,9 @@ class Sheet:
 
     @frozenRowCount.setter
     def frozenRowCount(self, value):
-        # Validate arguments:
         if not isinstance(value, int):
             raise TypeError("value arg must be an int, not %s" % (type(value).__name__))
-        if value < 1:
-            raise TypeError("value arg must be a positive nonzero int, not %r" % (value))
-        if value >= self._rowCount:
-            raise ValueError(
-                "You cannot freeze all rows on the sheet (sheet %r has %s rows)" % (self.title, self._rowCount)
-            )
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._frozenRowCount = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(frozenRowCount=value)
 
     @property
     def frozenColumnCount(self):
@@ -794,19 +1134,9 @@ class Sheet:
 
     @frozenColumnCount.setter
     def frozenColumnCount(self, value):
-        # Validate arguments:
         if not isinstance(value, int):
             raise TypeError("value arg must be an int, not %s" % (type(value).__name__))
-        if value < 1:
-            raise TypeError("value arg must be a positive nonzero int, not %r" % (value))
-        if value >= self._columnCount:
-            raise ValueError(
-                "You cannot freeze all columns on the sheet (sheet %r has %s columns)" % (self.title, self._columnCount)
-            )
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._frozenColumnCount = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(frozenColumnCount=value)
 
     @property
     def hideGridlines(self):
@@ -817,11 +1147,7 @@ class Sheet:
 
     @hideGridlines.setter
     def hideGridlines(self, value):
-        value = bool(value)
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._hideGridlines = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(hideGridlines=bool(value))
 
     @property
     def rowGroupControlAfter(self):
@@ -832,11 +1158,7 @@ class Sheet:
 
     @rowGroupControlAfter.setter
     def rowGroupControlAfter(self, value):
-        value = bool(value)
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._rowGroupControlAfter = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(rowGroupControlAfter=bool(value))
 
     @property
     def columnGroupControlAfter(self):
@@ -847,11 +1169,7 @@ class Sheet:
 
     @columnGroupControlAfter.setter
     def columnGroupControlAfter(self, value):
-        value = bool(value)
-
-        self.refresh()  # Retrieve up-to-date grid properties from Google Sheets.
-        self._columnGroupControlAfter = value  # Change local grid property.
-        self._updateGridProperties()  # Upload grid properties to Google Sheets.
+        self.setProperties(columnGroupControlAfter=bool(value))
 
     def __str__(self):
         """
@@ -940,10 +1258,15 @@ class Sheet:
             row.append(self._cells.get((colNum, rowNum), ""))
         return row
 
-    def getRows(self, startRow=1, stopRow=None):
+    def getRows(self, startRow=1, stopRow=None, trim=False):
+        """
+        Return a list of the row lists from startRow up to but not including stopRow. If `trim` is True,
+        stopRow defaults to the row after the last row with data, and the rows only go up to the last
+        column with data instead of the last column of the sheet.
+        """
         # Validate arguments:
         if stopRow is None:
-            stopRow = self._rowCount + 1
+            stopRow = (self._getUsedExtent()[1] if trim else self._rowCount) + 1
         if not isinstance(startRow, int):
             raise TypeError("startRow arg must be an int, not %s" % (type(startRow).__name__))
         if startRow < 1:
@@ -953,19 +1276,335 @@ class Sheet:
         if stopRow < 1:
             raise ValueError("stopRow arg must be at least 1, not %s" % (stopRow))
 
+        if trim:
+            cells = self._cells
+            columnNums = range(1, self._getUsedExtent()[0] + 1)
+            return [[cells.get((colNum, rowNum), "") for colNum in columnNums] for rowNum in range(startRow, stopRow)]
+
         # Get rows by calling getRow():
         return [self.getRow(rowNum) for rowNum in range(startRow, stopRow)]
 
     def __contains__(self, item):
         """Returns `True` if the `str` representation of `item` is equal to or
         within the `str` representation of a cell in this sheet."""
-        for cell in self._cells:
-            if str(item) in str(cell):
-                return True
-        return False
+        return self.find(item) is not None or self.find(item, substring=True) is not None
+
+    def find(self, value, column=None, substring=False, regex=False):
+        """
+        Return the (column, row) tuple of the first cell (going across each row, top to bottom) in this
+        sheet's local data that contains `value`, or None if there is no such cell.
+
+        :param column: If given, only this column (an int or letters like 'B') is searched.
+        :param substring: If True, find cells whose string contains the string of `value`.
+        :param regex: If True, `value` is a regular expression string or compiled pattern, and cells whose
+            string it matches anywhere are found.
+
+        Exact matches are looked up in an index of the cell values that is built on the first find()
+        or findAll() call and kept up to date as cells change, so they don't check every cell.
+        """
+        cells = self.findAll(value, column, substring, regex)
+        return cells[0] if cells else None
+
+    def findAll(self, value, column=None, substring=False, regex=False):
+        """
+        Return a list of the (column, row) tuples of all the cells in this sheet's local data that contain
+        `value`, going across each row, top to bottom. The arguments are the same as find()'s.
+        """
+        if isinstance(column, str):
+            column = getColumnNumberOf(column)
+        if column is not None and (not isinstance(column, int) or column < 1):
+            raise ValueError("column must be a 1-based int or column letters, not %r" % (column,))
+
+        valueIndex = self._getValueIndex()
+        keys = set()
+        if regex or substring:
+            if regex:
+                pattern = re.compile(value) if isinstance(value, str) else value
+                isMatch = lambda cellValue: pattern.search(_getCachedValue(cellValue)) is not None
+            else:
+                needle = _getCachedValue(value)
+                isMatch = lambda cellValue: needle in _getCachedValue(cellValue)
+            # Check each distinct value once rather than each cell:
+            for indexKey, valueKeys in valueIndex.items():
+                if isMatch(indexKey[1]):
+                    keys.update(valueKeys)
+        else:
+            for candidate in (value, _getCachedValue(value, self._valueRenderOption)):
+                keys.update(valueIndex.get(_getIndexKey(candidate), ()))
+
+        if column is not None:
+            keys = [key for key in keys if key[0] == column]
+        return sorted(keys, key=lambda key: (key[1], key[0]))
+
+    def query(self, where=None, select=None, groupBy=None, agg=None, header=1, pushdown=False):
+        """
+        Filter, select, and aggregate the rows of this sheet's local data, and return the results as a list of
+        dicts that map column names to values. The column names come from the `header` row (a 1-based row
+        number), or are the column letters if `header` is None. Columns can also be named by their letters.
+
+        :param where: A dict that maps column names to the value a row must have in that column (or to a
+            function that is passed the cell's value and returns True to keep the row), or a function that is
+            passed each row as a dict and returns True to keep it. The values in a dict are looked up in the
+            sheet's value index, so rows are filtered without checking every cell.
+        :param select: A list of the column names to return. Defaults to every column.
+        :param groupBy: A column name (or list of column names) to group the rows by. Each group is returned
+            as one dict of the groupBy columns and the `agg` columns.
+        :param agg: A dict that maps column names to 'count', 'sum', 'mean', 'min', 'max', or a function that
+            is passed the list of the group's values in that column. Only numbers (or strings of numbers) are
+            used by 'sum', 'mean', 'min', and 'max'.
+        :param pushdown: If True, a `where` dict of plain values is sent to the Google Visualization query
+            endpoint so that only the matching rows are downloaded, instead of using the local data.
+
+        For example, `sheet.query(where={'Region': 'West'}, groupBy='Product', agg={'Sales': 'sum'})`.
+        """
+        if header is not None and (not isinstance(header, int) or header < 1):
+            raise ValueError("header arg must be a 1-based row number or None, not %r" % (header,))
+        if isinstance(groupBy, str):
+            groupBy = [groupBy]
+        if agg is not None and groupBy is None:
+            groupBy = []  # Aggregate all the rows into one group.
+
+        if pushdown:
+            names, columnNums, rows = self._queryGviz(where, header)
+        else:
+            names, columnNums, rows = self._queryCells(where, header)
+
+        # Apply the filters that couldn't use the value index:
+        if callable(where):
+            rows = [row for row in rows if where(row)]
+        elif isinstance(where, dict):
+            for name, condition in where.items():
+                if callable(condition):
+                    rows = [row for row in rows if condition(row[name])]
+
+        for name in list(select or []) + list(groupBy or []) + list(agg or []):
+            if name not in columnNums:
+                raise ValueError("There is no column named %r. The columns are %r" % (name, names))
+
+        if groupBy is None:
+            select = names if select is None else list(select)
+            return [dict([(name, row[name]) for name in select]) for row in rows]
+
+        groups = collections.OrderedDict()
+        for row in rows:
+            groups.setdefault(tuple([row[name] for name in groupBy]), []).append(row)
+        results = []
+        for groupKey, groupRows in groups.items():
+            result = dict(zip(groupBy, groupKey))
+            for name, func in (agg or {}).items():
+                result[name] = _aggregate([row[name] for row in groupRows], func)
+            results.append(result)
+        return results
+
+    def _getQueryColumns(self, header, columnCount):
+        # Return the list of column names for query() (the values in the header row, or the column letters)
+        # and a dict that maps those names and the column letters to column numbers.
+        names = []
+        for colNum in range(1, columnCount + 1):
+            name = "" if header is None else _getCachedValue(self._cells.get((colNum, header), ""))
+            names.append(name if name != "" else getColumnLetterOf(colNum))
+        columnNums = dict([(getColumnLetterOf(colNum), colNum) for colNum in range(1, columnCount + 1)])
+        columnNums.update([(name, colNum) for colNum, name in enumerate(names, 1)])
+        return names, columnNums
+
+    def _queryCells(self, where, header):
+        # Return the column names, the dict from _getQueryColumns(), and the row dicts of the rows of this
+        # sheet's local data that match the plain values in the `where` dict.
+        usedColumn, usedRow = self._getUsedExtent()
+        names, columnNums = self._getQueryColumns(header, usedColumn)
+        firstRow = 1 if header is None else header + 1
+
+        rowNums = None  # None means every row.
+        if isinstance(where, dict):
+            for name, condition in where.items():
+                if name not in columnNums:
+                    raise ValueError("There is no column named %r. The columns are %r" % (name, names))
+                if callable(condition):
+                    continue
+                matches = set([rowNum for (colNum, rowNum) in self.findAll(condition, column=columnNums[name])])
+                rowNums = matches if rowNums is None else rowNums & matches
+        if rowNums is None:
+            rowNums = range(firstRow, usedRow + 1)
+        else:
+            rowNums = sorted([rowNum for rowNum in rowNums if rowNum >= firstRow])
+
+        cells = self._cells
+        columnItems = list(columnNums.items())
+        rows = [dict([(name, cells.get((colNum, rowNum), "")) for name, colNum in columnItems]) for rowNum in rowNums]
+        return names, columnNums, rows
+
+    def _queryGviz(self, where, header):
+        # Return the same values as _queryCells(), but use the Google Visualization query endpoint so that
+        # only the rows that match the `where` dict are downloaded.
+        if where is not None and not isinstance(where, dict):
+            raise ValueError("pushdown requires where to be a dict of column names and values")
+        if _SHEETS_CREDENTIALS is None:
+            raise EZSheetsException("pushdown requires ezsheets to be initialized with init()")
+
+        names, columnNums = self._getQueryColumns(header, self._getUsedExtent()[0])
+        conditions = []
+        for name, value in (where or {}).items():
+            if name not in columnNums:
+                raise ValueError("There is no column named %r. The columns are %r" % (name, names))
+            if callable(value):
+                raise ValueError("pushdown can't send the function for column %r to Google Sheets" % (name,))
+            letters = getColumnLetterOf(columnNums[name])
+            if isinstance(value, bool):
+                literal = str(value).lower()
+            elif isinstance(value, (int, float)):
+                literal = repr(value)
+            else:
+                value = str(value)
+                if "'" in value and '"' in value:
+                    # The query language has no way to escape quotes in a string literal.
+                    raise ValueError("pushdown can't send a string with both ' and \" quotes for column %r" % (name,))
+                literal = ("'%s'" % value) if "'" not in value else ('"%s"' % value)
+            conditions.append("%s = %s" % (letters, literal))
+        queryString = "select *" + ((" where " + " and ".join(conditions)) if conditions else "")
+
+        url = "https://docs.google.com/spreadsheets/d/%s/gviz/tq?tqx=out:csv&gid=%s&headers=%s&tq=%s" % (
+            self._spreadsheet._spreadsheetId,
+            self._sheetId,
+            0 if header is None else header,
+            quote(queryString),
+        )
+        http = _getThreadHttp() or google_auth_httplib2.AuthorizedHttp(_SHEETS_CREDENTIALS, http=httplib2.Http())
+        _logReadRequest()
+        response, content = http.request(url, "GET")
+        if response.status != 200:
+            raise EZSheetsException("The query %r failed with HTTP status %s" % (queryString, response.status))
+
+        rows = list(csv.reader(io.StringIO(content.decode("utf-8"))))
+        if header is not None:
+            rows = rows[1:]  # The header row is already in `names`.
+        columnItems = list(columnNums.items())
+        rows = [dict([(name, row[colNum - 1] if colNum <= len(row) else "") for name, colNum in columnItems]) for row in rows]
+        return names, columnNums, rows
+
+    def indexBy(self, column):
+        """
+        Return a ColumnIndex object, a dict-like view that maps the values in `column` (an int or letters
+        like 'A') to the row numbers they're in. For example, `sheet.getRow(sheet.indexBy('A')['Alice'])`
+        gets the row with 'Alice' in column A. The view stays in sync with later updates to this sheet.
+        """
+        if isinstance(column, str):
+            column = getColumnNumberOf(column)
+        if not isinstance(column, int) or column < 1:
+            raise ValueError("column must be a 1-based int or column letters, not %r" % (column,))
+        return ColumnIndex(self, column)
+
+    def upsertRows(self, rows, key="A"):
+        """
+        For each row list in `rows`, overwrite the row whose `key` column (an int or letters like 'A') has the
+        same value as the row's own `key` column, or write it after the last row with data if there is no such
+        row. All the rows are written with a single batchUpdate request. The cells past the end of each row list
+        are left unchanged. Returns a list of the row numbers that each row list was written to. Every row
+        list must have a non-blank value in its key column.
+
+        Like COMBINE_RESIZE_WITH_WRITES, the values are sent as numbers, booleans, formulas, or strings rather
+        than parsed by Google Sheets as if the user typed them.
+        """
+        if isinstance(key, str):
+            key = getColumnNumberOf(key)
+        if not isinstance(key, int) or key < 1:
+            raise ValueError("key must be a 1-based int or column letters, not %r" % (key,))
+        if not isinstance(rows, (list, tuple)):
+            raise TypeError("rows arg must be a list/tuple of lists/tuples, not %s" % (type(rows).__name__))
+        for row in rows:
+            if not isinstance(row, (list, tuple)):
+                raise TypeError("rows arg must be a list/tuple of lists/tuples, not a list/tuple of %s" % (type(row).__name__))
+            if len(row) < key or row[key - 1] is None or row[key - 1] == "":
+                # Blank keys aren't in the index, so rows with them would all be written over the same new row.
+                raise ValueError("every row must have a value in the key column, but %r doesn't" % (row,))
+
+        keyIndex = self.indexBy(key)
+        lastRow = self._getUsedExtent()[1]
+        newKeyRows = {}  # Rows written by this call for keys that weren't in the sheet yet.
+        rowNums = []
+        for row in rows:
+            # Look up the key the way the sheet will store it, so a key like '007' matches the 7 in the sheet:
+            keyValue = _getCachedValue(_getStoredValue(_getExtendedValue(row[key - 1])), self._valueRenderOption)
+            if keyValue in keyIndex:
+                rowNums.append(keyIndex[keyValue])
+            elif _getIndexKey(keyValue) in newKeyRows:
+                rowNums.append(newKeyRows[_getIndexKey(keyValue)])
+            else:
+                lastRow += 1
+                newKeyRows[_getIndexKey(keyValue)] = lastRow
+                rowNums.append(lastRow)
+
+        if len(rows) == 0:
+            return rowNums
+
+        requests, newSize = self._getResizeRequests(max([len(row) for row in rows]), max(rowNums))
+        for rowNum, row in zip(rowNums, rows):
+            requests.append(
+                {
+                    "updateCells": {
+                        "start": {"sheetId": self._sheetId, "rowIndex": rowNum - 1, "columnIndex": 0},
+                        "rows": [{"values": [{"userEnteredValue": _getExtendedValue(value)} for value in row]}],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+        _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheet._spreadsheetId, "body": {"requests": requests}})
+        self._columnCount, self._rowCount = newSize
+
+        # Update the local data in `_cells`:
+        for rowNum, row in zip(rowNums, rows):
+            self._setCachedRows(1, rowNum, [row], extendedValues=True)
+        return rowNums
+
+    def _getValueIndex(self):
+        # Build the value index from `_cells` the first time it's needed.
+        if self._valueIndex is None:
+            self._valueIndex = {}
+            for key, value in self._cells.items():
+                self._valueIndex.setdefault(_getIndexKey(value), set()).add(key)
+        return self._valueIndex
+
+    def _setCellValue(self, key, value):
+        # Set the value of the (column, row) `key` in `_cells`, keeping the value index up to date. A blank
+        # string value removes the cell from `_cells`.
+        if self._valueIndex is not None and key in self._cells:
+            indexKey = _getIndexKey(self._cells[key])
+            self._valueIndex[indexKey].discard(key)
+            if not self._valueIndex[indexKey]:
+                del self._valueIndex[indexKey]
 
-    def find(self, needle):
-        pass
+        if value == "":
+            if self._cells.pop(key, "") != "":
+                self._countCell(key, -1)
+        else:
+            if self._cells.get(key, "") == "":
+                self._countCell(key, 1)
+            self._cells[key] = value
+            if self._valueIndex is not None:
+                self._valueIndex.setdefault(_getIndexKey(value), set()).add(key)
+
+    def _countCell(self, key, change):
+        # Add `change` (1 or -1) to the cell counts of the (column, row) `key`'s column and row, keeping the
+        # used extent up to date.
+        column, row = key
+        self._columnCellCounts[column] += change
+        self._rowCellCounts[row] += change
+        if change > 0 and self._usedExtent is not None:
+            self._usedExtent = (max(self._usedExtent[0], column), max(self._usedExtent[1], row))
+        if change < 0:
+            if self._columnCellCounts[column] == 0:
+                del self._columnCellCounts[column]
+            if self._rowCellCounts[row] == 0:
+                del self._rowCellCounts[row]
+            if self._usedExtent is not None and (column not in self._columnCellCounts or row not in self._rowCellCounts):
+                self._usedExtent = None  # The last used column or row may have been emptied, so recount.
+
+    def _replaceCells(self, cells):
+        # Replace all of `_cells` with the dict `cells`. The value index is rebuilt the next time it's needed.
+        self._cells = cells
+        self._valueIndex = None
+        self._columnCellCounts = collections.Counter([key[0] for key, value in cells.items() if value != ""])
+        self._rowCellCounts = collections.Counter([key[1] for key, value in cells.items() if value != ""])
+        self._usedExtent = None
 
     def getColumn(self, colNum):
         # NOTE: getRow() and getCol() do not support negative indexes.
@@ -985,10 +1624,15 @@ class Sheet:
             column.append(self._cells.get((colNum, rowNum), ""))
         return column
 
-    def getColumns(self, startColumn=1, stopColumn=None):
+    def getColumns(self, startColumn=1, stopColumn=None, trim=False):
+        """
+        Return a list of the column lists from startColumn up to but not including stopColumn. If `trim` is
+        True, stopColumn defaults to the column after the last column with data, and the columns only go
+        down to the last row with data instead of the last row of the sheet.
+        """
         # Validate arguments:
         if stopColumn is None:
-            stopColumn = self._columnCount + 1
+            stopColumn = (self._getUsedExtent()[0] if trim else self._columnCount) + 1
         if not isinstance(startColumn, int):
             raise TypeError("startColumn arg must be an int, not %s" % (type(startColumn).__name__))
         if startColumn < 1:
@@ -998,12 +1642,39 @@ class Sheet:
         if stopColumn < 1:
             raise ValueError("stopColumn arg must be at least 1, not %s" % (stopColumn))
 
+        if trim:
+            cells = self._cells
+            rowNums = range(1, self._getUsedExtent()[1] + 1)
+            return [[cells.get((colNum, rowNum), "") for rowNum in rowNums] for colNum in range(startColumn, stopColumn)]
+
         # Get columns by calling getColumn():
         return [self.getColumn(colNum) for colNum in range(startColumn, stopColumn)]
 
-    def refresh(self):
-        self._refreshProperties()
-        self._refreshData()
+    @property
+    def usedRange(self):
+        """
+        A Range object of the cells from A1 to the last column and row with data in this sheet's local data,
+        or None if the sheet is empty.
+        """
+        usedColumn, usedRow = self._getUsedExtent()
+        if usedColumn == 0:
+            return None
+        return Range(self, 1, 1, usedColumn, usedRow)
+
+    def _getUsedExtent(self):
+        # Return the (column, row) of the last column and row with data, or (0, 0) if the sheet is empty.
+        if self._usedExtent is None:
+            self._usedExtent = (max(self._columnCellCounts, default=0), max(self._rowCellCounts, default=0))
+        return self._usedExtent
+
+    def refresh(self, valueRenderOption=None, dateTimeRenderOption=None, convertDates=None):
+        """
+        Download this Sheet's properties and data from Google Sheets. The arguments change the
+        valueRenderOption, dateTimeRenderOption, and convertDates attributes, so that the downloaded data
+        and the values cached by later writes are in the same form.
+        """
+        self._refreshProperties()
+        self._refreshData(valueRenderOption, dateTimeRenderOption, convertDates)
 
     def _refreshProperties(self):
         # Get all the sheet properties:
@@ -1035,7 +1706,21 @@ class Sheet:
         self._rowGroupControlAfter = gridProps.get("rowGroupControlAfter", DEFAULT_ROW_GROUP_CONTROL_AFTER)
         self._columnGroupControlAfter = gridProps.get("columnGroupControlAfter", DEFAULT_COLUMN_GROUP_CONTROL_AFTER)
 
-    def _refreshData(self):
+    def _refreshData(self, valueRenderOption=None, dateTimeRenderOption=None, convertDates=None):
+        if valueRenderOption is None:
+            valueRenderOption = self._valueRenderOption
+        if dateTimeRenderOption is None:
+            dateTimeRenderOption = self._dateTimeRenderOption
+        if convertDates is None:
+            convertDates = self._convertDates
+        if valueRenderOption not in VALUE_RENDER_OPTIONS:
+            raise ValueError("valueRenderOption must be one of %r, not %r" % (VALUE_RENDER_OPTIONS, valueRenderOption))
+        if dateTimeRenderOption not in DATE_TIME_RENDER_OPTIONS:
+            raise ValueError("dateTimeRenderOption must be one of %r, not %r" % (DATE_TIME_RENDER_OPTIONS, dateTimeRenderOption))
+
+        if self._appendBuffer:
+            self.flushAppends()  # Send any buffered rows first so they show up in the refreshed data.
+
         # Get all the sheet data:
         # _logReadRequest(); response = SHEETS_SERVICE.spreadsheets().values().get(
         #    spreadsheetId=self._spreadsheet._spreadsheetId,
@@ -1045,52 +1730,64 @@ class Sheet:
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
                 "range": "%s!A1:%s%s" % (self._title, getColumnLetterOf(self._columnCount), self._rowCount),
+                "valueRenderOption": valueRenderOption,
+                "dateTimeRenderOption": dateTimeRenderOption,
             }
         )
 
         sheetData = response.get("values", [[]])
-        self._cells = {}
+        if convertDates and valueRenderOption != "FORMATTED_VALUE" and dateTimeRenderOption == "SERIAL_NUMBER":
+            sheetData = _decodeSerialDates(sheetData, self._getNumberFormatTypes(), response["majorDimension"] == "COLUMNS")
+        cells = {}
         if response["majorDimension"] == "ROWS":
             for rowNumBase0, row in enumerate(sheetData):
                 for colNumBase0, sheetDatum in enumerate(row):
-                    self._cells[(colNumBase0 + 1, rowNumBase0 + 1)] = sheetDatum
+                    if sheetDatum != "":
+                        cells[(colNumBase0 + 1, rowNumBase0 + 1)] = sheetDatum
         elif response["majorDimension"] == "COLUMNS":
             for colNumBase0, column in enumerate(sheetData):
                 for rowNumBase0, sheetDatum in enumerate(column):
-                    self._cells[(colNumBase0 + 1, rowNumBase0 + 1)] = sheetDatum
-
-    def _updateGridProperties(self):
-        gridProperties = {
-            "rowCount": self._rowCount,
-            "columnCount": self._columnCount,
-            "frozenRowCount": self._frozenRowCount,
-            "frozenColumnCount": self._frozenColumnCount,
-            "hideGridlines": self._hideGridlines,
-            "rowGroupControlAfter": self._rowGroupControlAfter,
-            "columnGroupControlAfter": self._columnGroupControlAfter,
-        }
-        # request = SHEETS_SERVICE.spreadsheets().batchUpdate(spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    body={
-        #    'requests': [{'updateSheetProperties': {'properties': {'sheetId': self._sheetId,
-        #                                                           'gridProperties': gridProperties},
-        #                                            'fields': 'gridProperties'}}]})
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "batchUpdate",
+                    if sheetDatum != "":
+                        cells[(colNumBase0 + 1, rowNumBase0 + 1)] = sheetDatum
+        self._valueRenderOption = valueRenderOption
+        self._dateTimeRenderOption = dateTimeRenderOption
+        self._convertDates = bool(convertDates)
+        self._replaceCells(cells)
+
+    def _getNumberFormatTypes(self):
+        # Return a list of row lists of the number format types (like 'DATE' or 'NUMBER') of this
+        # sheet's cells, getting only that field of the grid data.
+        response = _makeRequest(
+            "get",
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "body": {
-                    "requests": [
-                        {
-                            "updateSheetProperties": {
-                                "properties": {"sheetId": self._sheetId, "gridProperties": gridProperties},
-                                "fields": "gridProperties",
-                            }
-                        }
-                    ]
-                },
+                "ranges": ["%s!A1:%s%s" % (self._title, getColumnLetterOf(self._columnCount), self._rowCount)],
+                "fields": "sheets.data.rowData.values.effectiveFormat.numberFormat.type",
             }
         )
+        formatTypes = []
+        for sheetDict in response.get("sheets", []):
+            for gridData in sheetDict.get("data", []):
+                for rowData in gridData.get("rowData", []):
+                    formatTypes.append(
+                        [
+                            cellData.get("effectiveFormat", {}).get("numberFormat", {}).get("type")
+                            for cellData in rowData.get("values", [])
+                        ]
+                    )
+        return formatTypes
+
+    def _getEnlargedSize(self, requestedColumn, requestedRow, size=None):
+        # Return the (columnCount, rowCount) this sheet needs to include the requested cell. If `size` is
+        # given, it's the (columnCount, rowCount) to enlarge instead of the sheet's current size.
+        currentColumnCount, currentRowCount = (self._columnCount, self._rowCount) if size is None else size
+        columnCount = max(requestedColumn, currentColumnCount)
+        rowCount = currentRowCount
+        if requestedRow > currentRowCount:
+            rowCount = max(
+                requestedRow, int(math.ceil(currentRowCount * ROW_GROWTH_FACTOR)), currentRowCount + ROW_GROWTH_CHUNK
+            )
+        return columnCount, rowCount
 
     def _enlargeIfNeeded(self, requestedColumn=None, requestedRow=None):
         # Increase rowCount or columnCount if needed.
@@ -1100,7 +1797,48 @@ class Sheet:
             requestedRow = self._rowCount
 
         # Enlarge the sheet:
-        self.resize(max(requestedColumn, self._columnCount), max(requestedRow, self._rowCount))
+        self.resize(*self._getEnlargedSize(requestedColumn, requestedRow))
+
+    def _updateCellRange(self, startColumn, startRow, values, majorDimension="ROWS"):
+        # Write the list of lists in `values` (a list of rows, or a list of columns if majorDimension
+        # is "COLUMNS") with its top-left cell at startColumn, startRow, enlarging the sheet if needed.
+        if majorDimension == "COLUMNS":
+            stopColumn = startColumn + len(values) - 1
+            stopRow = startRow + max([len(column) for column in values]) - 1
+        else:
+            stopColumn = startColumn + max([len(row) for row in values]) - 1
+            stopRow = startRow + len(values) - 1
+
+        if COMBINE_RESIZE_WITH_WRITES:
+            # Write the values (and resize the sheet, if needed) with a single batchUpdate request. The values
+            # are sent as ExtendedValues whether or not the sheet is resized, so they're stored the same way.
+            if majorDimension == "COLUMNS":
+                values = [list(row) for row in itertools.zip_longest(*values, fillvalue="")]
+            requests, newSize = self._getResizeRequests(stopColumn, stopRow)
+            requests.append(
+                {
+                    "updateCells": {
+                        "start": {"sheetId": self._sheetId, "rowIndex": startRow - 1, "columnIndex": startColumn - 1},
+                        "rows": [{"values": [{"userEnteredValue": _getExtendedValue(value)} for value in row]} for row in values],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+            _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheet._spreadsheetId, "body": {"requests": requests}})
+            self._columnCount, self._rowCount = newSize
+            return
+
+        self.resize(*self._getEnlargedSize(stopColumn, stopRow))
+        _makeRequest(
+            "values.update",
+            **{
+                "spreadsheetId": self._spreadsheet._spreadsheetId,
+                "range": "%s!%s%s:%s%s"
+                % (self._title, getColumnLetterOf(startColumn), startRow, getColumnLetterOf(stopColumn), stopRow),
+                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
+                "body": {"majorDimension": majorDimension, "values": values},
+            }
+        )
 
     def update(self, *args):
         if len(args) == 3:  # args are column, row like (2, 5)
@@ -1124,45 +1862,11 @@ class Sheet:
             )
 
         if value is None:
-            value == ""  # Pass None or '' for value to delete the cell's content.
-
-        self._enlargeIfNeeded(column, row)
-
-        cellLocation = getColumnLetterOf(column) + str(row)
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!%s:%s' % (self._title, cellLocation, cellLocation),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'ROWS',
-        #        'values': [[value]],
-        #        #'range': '%s!%s:%s' % (self._title, cellLocation, cellLocation),
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "values.update",
-            **{
-                "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "range": "%s!%s:%s" % (self._title, cellLocation, cellLocation),
-                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "ROWS", "values": [[value]]},
-            }
-        )
+            value = ""  # Pass None or '' for value to delete the cell's content.
 
-        if value == "":
-            del self._cells[(column, row)]
-        else:
-            # Google Sheets seem to only store strings (TODO: verify this), but we can't
-            # do a simple str() call here because True and False are stored as 'TRUE' and 'FALSE'
-            # I don't want to have to do a refresh on each setting, so for the _cells cache
-            # I'll just hard code some known rules and we can hunt down the edge cases later.
-            if isinstance(value, bool):
-                value = str(value).upper()
-            else:
-                value = str(value)
+        self._updateCellRange(column, row, [[value]])
 
-            self._cells[(column, row)] = value
+        self._setCellValue((column, row), "" if value == "" else _getCachedValue(value, self._valueRenderOption))
 
     def updateRow(self, row, values):
         if not isinstance(row, int):
@@ -1180,32 +1884,11 @@ class Sheet:
         if len(values) < self._columnCount:
             values.extend([""] * (self._columnCount - len(values)))
 
-        self._enlargeIfNeeded(None, row)
-
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!A%s:%s%s' % (self._title, row, getColumnLetterOf(len(values)), row),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'ROWS',
-        #        'values': [values],
-        #        #'range': '%s!A%s:%s%s' % (self._title, row, getColumnLetterOf(len(values)), row),
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "values.update",
-            **{
-                "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "range": "%s!A%s:%s%s" % (self._title, row, getColumnLetterOf(len(values)), row),
-                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "ROWS", "values": [values]},
-            }
-        )
+        self._updateCellRange(1, row, [values])
 
         # Update the local data in `_cells`:
         for colNumBase1 in range(1, self._columnCount + 1):
-            self._cells[(colNumBase1, row)] = values[colNumBase1 - 1]
+            self._setCellValue((colNumBase1, row), values[colNumBase1 - 1])
 
     def updateColumn(self, column, values):
         if not isinstance(column, (int, str)):
@@ -1228,35 +1911,22 @@ class Sheet:
         if len(values) < self._rowCount:
             values.extend([""] * (self._rowCount - len(values)))
 
-        self._enlargeIfNeeded(column, None)
-
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!%s1:%s%s' % (self._title, getColumnLetterOf(column), getColumnLetterOf(column), len(values)),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'COLUMNS',
-        #        'values': [values],
-        #        #'range': '%s!%s1:%s%s' % (self._title, getColumnLetterOf(column), getColumnLetterOf(column), len(values)),
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "values.update",
-            **{
-                "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "range": "%s!%s1:%s%s"
-                % (self._title, getColumnLetterOf(column), getColumnLetterOf(column), len(values)),
-                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "COLUMNS", "values": [values]},
-            }
-        )
+        self._updateCellRange(column, 1, [values], majorDimension="COLUMNS")
 
         # Update the local data in `_cells`:
         for rowNumBase1 in range(1, self._rowCount + 1):
-            self._cells[(column, rowNumBase1)] = values[rowNumBase1 - 1]
+            self._setCellValue((column, rowNumBase1), values[rowNumBase1 - 1])
+
+    def updateRows(self, rows, startRow=1, bounded=False, clearBelow=False):
+        """
+        Update the rows of this sheet starting at row `startRow` with the lists in `rows`.
 
-    def updateRows(self, rows, startRow=1):
+        By default, every row from `startRow` to the end of the sheet is overwritten, which means
+        the rows below `rows` are cleared by uploading empty strings for them. If `bounded` is
+        `True`, only the rectangle of cells covered by `rows` is uploaded and the rest of the
+        sheet is left alone. If `clearBelow` is `True`, the rectangle is uploaded and the rows
+        below it are cleared with a single `values.clear` request instead of a padded payload.
+        """
         # Argument validation:
         # Ensure that `rows` is a list of lists:
         if not isinstance(rows, (list, tuple)):
@@ -1270,6 +1940,10 @@ class Sheet:
         if startRow < 1:
             raise ValueError("startRow arg is 1-based, and must be 1 or greater, not %r" % (startRow))
 
+        if bounded or clearBelow:
+            self._updateRowsBounded(rows, startRow, clearBelow)
+            return
+
         if startRow > self._rowCount:
             return  # No rows to update, so return.
 
@@ -1286,38 +1960,68 @@ class Sheet:
         ):  # TODO - this could probably be made more performant if we use extend().
             rows.append([""] * self._columnCount)  # pad extra rows
 
-        self._enlargeIfNeeded(None, len(rows) + startRow - 1)
+        self._updateCellRange(1, startRow, rows)
+
+        # Update the local data in `_cells`:
+        for rowNumBase1 in range(startRow, startRow + len(rows)):
+            for colNumBase0 in range(maxColumnCount):
+                self._setCellValue((colNumBase0 + 1, rowNumBase1), rows[rowNumBase1 - startRow][colNumBase0])
+
+    def _updateRowsBounded(self, rows, startRow, clearBelow):
+        # Pad the rows to the width of the widest row (but not to the width of the sheet), without
+        # modifying the caller's lists:
+        width = max([len(row) for row in rows] + [0])
+        rows = [list(row) + [""] * (width - len(row)) for row in rows]
+        stopRow = startRow + len(rows)  # The first row after the updated rectangle.
+
+        if width > 0 and len(rows) > 0:
+            self._updateCellRange(1, startRow, rows)
+            self._setCachedRows(1, startRow, rows)
+
+        if clearBelow:
+            self._clearRowsFrom(stopRow)
+
+    def _setCachedRows(self, startColumn, startRow, rows, extendedValues=False):
+        # Update the local data in `_cells` after the list of row lists `rows` was written with its
+        # top-left cell at startColumn, startRow. If `extendedValues` is True, the rows were sent as
+        # _getExtendedValue() ExtendedValues, so a value like '007' is cached as the 7 the sheet stores.
+        for rowNumBase0, row in enumerate(rows):
+            for colNumBase0, value in enumerate(row):
+                if extendedValues:
+                    value = _getStoredValue(_getExtendedValue(value))
+                if value != "":
+                    value = _getCachedValue(value, self._valueRenderOption)
+                self._setCellValue((startColumn + colNumBase0, startRow + rowNumBase0), value)
+
+    def _clearRowsFrom(self, startRow):
+        # Clear every row from startRow to the end of the sheet with a single values.clear request.
+        if startRow > self._rowCount:
+            return  # There are no rows to clear.
 
-        # Send the API request that updates the Google sheet.
-        # rangeCells = '%s!A%s:%s%s' % (self._title, startRow, getColumnLetterOf(maxColumnCount), stopRow - 1)
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!A%s:%s%s' % (self._title, startRow, getColumnLetterOf(maxColumnCount), startRow + len(rows) - 1),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'ROWS',
-        #        'values': rows,
-        #        #'range': rangeCells,
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
         _makeRequest(
-            "values.update",
+            "values.clear",
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "range": "%s!A%s:%s%s"
-                % (self._title, startRow, getColumnLetterOf(maxColumnCount), startRow + len(rows) - 1),
-                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "ROWS", "values": rows},
+                "range": "%s!A%s:%s%s" % (self._title, startRow, getColumnLetterOf(self._columnCount), self._rowCount),
+                "body": {},
             }
         )
 
         # Update the local data in `_cells`:
-        for rowNumBase1 in range(startRow, startRow + len(rows)):
-            for colNumBase0 in range(maxColumnCount):
-                self._cells[(colNumBase0 + 1, rowNumBase1)] = rows[rowNumBase1 - startRow][colNumBase0]
+        for key in [key for key in self._cells if key[1] >= startRow]:
+            self._setCellValue(key, "")
 
-    def updateColumns(self, columns, startColumn=1):
+    def updateColumns(self, columns, startColumn=1, bounded=False, clearRight=False):
+        """
+        Update the columns of this sheet starting at column `startColumn` with the lists in `columns`.
+
+        By default, every column from `startColumn` to the end of the sheet is overwritten, which
+        means the columns to the right of `columns` are cleared by uploading empty strings for
+        them. If `bounded` is `True`, only the rectangle of cells covered by `columns` is uploaded
+        and the rest of the sheet is left alone. If `clearRight` is `True`, the rectangle is
+        uploaded and the columns to the right of it are cleared with a single `values.clear`
+        request instead of a padded payload.
+        """
         # Argument validation:
         # Ensure that `columns` is a list of lists:
         if not isinstance(columns, (list, tuple)):
@@ -1331,6 +2035,10 @@ class Sheet:
         if startColumn < 1:
             raise ValueError("startColumn arg is 1-based, and must be 1 or greater, not %r" % (startColumn))
 
+        if bounded or clearRight:
+            self._updateColumnsBounded(columns, startColumn, clearRight)
+            return
+
         if startColumn > self._columnCount:
             return  # No rows to update, so return.
 
@@ -1347,41 +2055,130 @@ class Sheet:
         ):  # TODO - this could probably be made more performant if we use extend().
             columns.append([""] * self._rowCount)  # pad extra columns
 
-        self._enlargeIfNeeded(len(columns) + startColumn - 1, None)
+        self._updateCellRange(startColumn, 1, columns, majorDimension="COLUMNS")
 
-        # Send the API request that updates the Google sheet.
-        # rangeCells = '%s!A%s:%s%s' % (self._title, startRow, getColumnLetterOf(maxColumnCount), stopRow - 1)
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!%s1:%s%s' % (self._title, getColumnLetterOf(startColumn), getColumnLetterOf(startColumn + len(columns) - 1), maxRowCount),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'COLUMNS',
-        #        'values': columns,
-        #        #'range': rangeCells,
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "values.update",
+        # Update the local data in `_cells`:
+        for colNumBase1 in range(startColumn, startColumn + len(columns)):
+            for rowNumBase0 in range(maxRowCount):
+                self._setCellValue((colNumBase1, rowNumBase0 + 1), columns[colNumBase1 - startColumn][rowNumBase0])
+
+    def _updateColumnsBounded(self, columns, startColumn, clearRight):
+        # Pad the columns to the height of the tallest column (but not to the height of the sheet),
+        # without modifying the caller's lists:
+        height = max([len(column) for column in columns] + [0])
+        columns = [list(column) + [""] * (height - len(column)) for column in columns]
+        stopColumn = startColumn + len(columns)  # The first column after the updated rectangle.
+
+        if height > 0 and len(columns) > 0:
+            self._updateCellRange(startColumn, 1, columns, majorDimension="COLUMNS")
+
+            # Update the local data in `_cells`:
+            for colNumBase0, column in enumerate(columns):
+                for rowNumBase0, value in enumerate(column):
+                    if value != "":
+                        value = _getCachedValue(value, self._valueRenderOption)
+                    self._setCellValue((startColumn + colNumBase0, rowNumBase0 + 1), value)
+
+        if clearRight and stopColumn <= self._columnCount:
+            _makeRequest(
+                "values.clear",
+                **{
+                    "spreadsheetId": self._spreadsheet._spreadsheetId,
+                    "range": "%s!%s1:%s%s"
+                    % (self._title, getColumnLetterOf(stopColumn), getColumnLetterOf(self._columnCount), self._rowCount),
+                    "body": {},
+                }
+            )
+
+            # Update the local data in `_cells`:
+            for key in [key for key in self._cells if key[0] >= stopColumn]:
+                self._setCellValue(key, "")
+
+    def appendRows(self, rows, buffered=False):
+        """
+        Append `rows` after the last row of data in this sheet, inserting new rows into the sheet as needed.
+
+        This uses a single `values.append` request, so the sheet's data doesn't need to be refreshed
+        first to find where the data ends. If `buffered` is `True`, the rows are held locally and
+        sent in one request once the buffer reaches `APPEND_BUFFER_MAX_ROWS` rows or
+        `APPEND_BUFFER_MAX_BYTES` bytes, or once its oldest row is `APPEND_BUFFER_MAX_SECONDS` seconds
+        old. These limits are only checked during the next `appendRows()` call, so buffered rows wait
+        until then no matter how old they are. Call `flushAppends()` (or use a `bufferedAppends()` block)
+        to send the remaining buffered rows. Rows still buffered when the program exits are sent then.
+        """
+        if not isinstance(rows, (list, tuple)):
+            raise TypeError("rows arg must be a list/tuple of lists/tuples, not %s" % (type(rows).__name__))
+        for row in rows:
+            if not isinstance(row, (list, tuple)):
+                raise TypeError("rows arg contains a non-list/tuple")
+
+        if self._appendBufferStartTime is None:
+            self._appendBufferStartTime = time.time()
+        for row in rows:
+            self._appendBuffer.append(list(row))
+            self._appendBufferBytes += len(json.dumps(row, default=str))
+        if self._appendBuffer:
+            _BUFFERED_APPEND_SHEETS[id(self)] = self  # So _flushBufferedAppends() sends any rows left at exit.
+
+        if (
+            not buffered
+            or len(self._appendBuffer) >= APPEND_BUFFER_MAX_ROWS
+            or self._appendBufferBytes >= APPEND_BUFFER_MAX_BYTES
+            or time.time() - self._appendBufferStartTime >= APPEND_BUFFER_MAX_SECONDS
+        ):
+            self.flushAppends()
+
+    @contextlib.contextmanager
+    def bufferedAppends(self):
+        """
+        A context manager that sends the rows buffered by `appendRows(buffered=True)` calls when the `with`
+        block ends, even if it raises an exception, so that no buffered rows are left unsent.
+        """
+        try:
+            yield self
+        finally:
+            self.flushAppends()
+
+    def flushAppends(self):
+        """
+        Send the rows buffered by `appendRows(buffered=True)` to Google Sheets.
+        """
+        rows = self._appendBuffer
+        if len(rows) == 0:
+            return  # Nothing to append.
+
+        response = _makeRequest(
+            "values.append",
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "range": "%s!%s1:%s%s"
-                % (
-                    self._title,
-                    getColumnLetterOf(startColumn),
-                    getColumnLetterOf(startColumn + len(columns) - 1),
-                    maxRowCount,
-                ),
+                "range": "%s!A1" % (self._title),
                 "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "COLUMNS", "values": columns},
+                "insertDataOption": "INSERT_ROWS",
+                "body": {"majorDimension": "ROWS", "values": rows},
             }
         )
-
-        # Update the local data in `_cells`:
-        for colNumBase1 in range(startColumn, startColumn + len(columns)):
-            for rowNumBase0 in range(maxRowCount):
-                self._cells[(colNumBase1, rowNumBase0 + 1)] = columns[colNumBase1 - startColumn][rowNumBase0]
+        # Only empty the buffer once the rows were sent, so they aren't lost if the request fails:
+        self._appendBuffer = []
+        self._appendBufferBytes = 0
+        self._appendBufferStartTime = None
+        _BUFFERED_APPEND_SHEETS.pop(id(self), None)
+
+        # Update the local data in `_cells` and the grid size from the range Google Sheets wrote to,
+        # since INSERT_ROWS pushes any cells below that range down:
+        startColumn, startRow, stopColumn, stopRow = convertRange(response["updates"]["updatedRange"])
+        shiftedCells = {}
+        for (colNum, rowNum), value in self._cells.items():
+            if rowNum >= startRow:
+                rowNum += len(rows)
+            shiftedCells[(colNum, rowNum)] = value
+        for rowNumBase0, row in enumerate(rows):
+            for colNumBase0, value in enumerate(row):
+                if value != "":
+                    shiftedCells[(startColumn + colNumBase0, startRow + rowNumBase0)] = _getCachedValue(value, self._valueRenderOption)
+        self._replaceCells(shiftedCells)
+
+        self._rowCount += len(rows)
+        self._columnCount = max(self._columnCount, stopColumn)
 
     """
     def updateColumns(self, columns, startColumn=0, stopColumn=None, step=1):
@@ -1424,33 +2221,24 @@ class Sheet:
     """
 
     def clear(self):
-        # request = SHEETS_SERVICE.spreadsheets().values().update(
-        #    spreadsheetId=self._spreadsheet._spreadsheetId,
-        #    range='%s!A1:%s%s' % (self._title, getColumnLetterOf(self._columnCount), self._rowCount),
-        #    valueInputOption='USER_ENTERED', # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-        #    body={
-        #        'majorDimension': 'ROWS',
-        #        'values': [[''] * self._columnCount for i in range(self._rowCount)],
-        #        #'range': rangeCells,
-        #        }
-        #    )
-        # _logWriteRequest(); request.execute()
+        """
+        Clear the values of every cell in this sheet with a single values.clear request. Formatting is kept.
+        """
         _makeRequest(
-            "values.update",
+            "values.clear",
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
                 "range": "%s!A1:%s%s" % (self._title, getColumnLetterOf(self._columnCount), self._rowCount),
-                "valueInputOption": "USER_ENTERED",  # Details at https://developers.google.com/sheets/api/reference/rest/v4/ValueInputOption
-                "body": {"majorDimension": "ROWS", "values": [[""] * self._columnCount for i in range(self._rowCount)]},
+                "body": {},
             }
         )
 
         # Update the local data in `_cells`:
-        self._cells = {}
+        self._replaceCells({})
 
     def copyTo(self, destinationSpreadsheet):
         # NOTE: Don't update this method to allow ID or URL strings to be
-        # passed, because we'll always need to call refresh() on the
+        # passed, because we always need to update the sheets of the
         # spreadsheet object itself.
 
         if not isinstance(destinationSpreadsheet, Spreadsheet):
@@ -1462,7 +2250,7 @@ class Sheet:
         #                                                 sheetId=self._sheetId,
         #                                                 body={'destinationSpreadsheetId': destinationSpreadsheet._spreadsheetId})
         # _logWriteRequest(); request.execute()
-        _makeRequest(
+        response = _makeRequest(
             "sheets.copyTo",
             **{
                 "spreadsheetId": self._spreadsheet._spreadsheetId,
@@ -1470,7 +2258,13 @@ class Sheet:
                 "body": {"destinationSpreadsheetId": destinationSpreadsheet._spreadsheetId},
             }
         )
-        destinationSpreadsheet.refresh()  # Refresh the spreadsheet since its sheets list has changed.
+
+        # The copy is added as the last sheet, so only its data needs to be downloaded rather than
+        # refreshing every sheet in the destination spreadsheet.
+        newSheet = Sheet(destinationSpreadsheet, response["sheetId"], properties=response)
+        newSheet._refreshData()
+        destinationSpreadsheet.sheets = destinationSpreadsheet.sheets + (newSheet,)
+        return newSheet
 
     def delete(self):
         if len(self._spreadsheet.sheets) == 1:
@@ -1480,15 +2274,144 @@ class Sheet:
         #    body={
         #        'requests': [{'deleteSheet': {'sheetId': self._sheetId}}]})
         # _logWriteRequest(); request.execute()
-        _makeRequest(
-            "batchUpdate",
-            **{
-                "spreadsheetId": self._spreadsheet._spreadsheetId,
-                "body": {"requests": [{"deleteSheet": {"sheetId": self._sheetId}}]},
-            }
+        self._spreadsheet._batchUpdateSheets([{"deleteSheet": {"sheetId": self._sheetId}}])
+
+    def setProperties(
+        self,
+        title=_UNSET,
+        tabColor=_UNSET,
+        index=_UNSET,
+        rowCount=_UNSET,
+        columnCount=_UNSET,
+        frozenRowCount=_UNSET,
+        frozenColumnCount=_UNSET,
+        hideGridlines=_UNSET,
+        rowGroupControlAfter=_UNSET,
+        columnGroupControlAfter=_UNSET,
+    ):
+        """
+        Change several of this Sheet's properties with a single updateSheetProperties request whose field
+        mask covers only the given properties. Properties that aren't given are unchanged, and tabColor=None
+        removes the tab color. The values are checked together, so rowCount and frozenRowCount can be changed
+        at the same time.
+        """
+        changes = dict(
+            [
+                (name, value)
+                for name, value in (
+                    ("title", title),
+                    ("tabColor", tabColor),
+                    ("index", index),
+                    ("rowCount", rowCount),
+                    ("columnCount", columnCount),
+                    ("frozenRowCount", frozenRowCount),
+                    ("frozenColumnCount", frozenColumnCount),
+                    ("hideGridlines", hideGridlines),
+                    ("rowGroupControlAfter", rowGroupControlAfter),
+                    ("columnGroupControlAfter", columnGroupControlAfter),
+                )
+                if value is not _UNSET
+            ]
         )
+        if self._pendingProperties is not None:
+            self._pendingProperties.update(changes)
+            return
+
+        properties = {"sheetId": self._sheetId}
+        gridProperties = {}
+        fields = []
+        if "title" in changes:
+            properties["title"] = str(changes["title"])
+            fields.append("title")
+        if "tabColor" in changes:
+            properties["tabColor"] = _getTabColorArg(changes["tabColor"])
+            fields.append("tabColor")
+        if "index" in changes:
+            value = changes["index"]
+            if not isinstance(value, int):
+                raise TypeError("indices must be integers, not %s" % (type(value).__name__))
+            if value < 0:  # Handle negative indexes the way Python lists do.
+                if value < -len(self.spreadsheet.sheets):
+                    raise IndexError("%r is out of range (-1 to %d)" % (value, -len(self.spreadsheet.sheets)))
+                value = len(self.spreadsheet.sheets) + value  # Convert this negative index into its positive index.
+            if value >= len(self.spreadsheet.sheets):
+                raise IndexError("%r is out of range (0 to %d)" % (value, len(self.spreadsheet.sheets) - 1))
+            if value != self._index:
+                if value > self._index:
+                    # Google Sheets uses "before the move" indexes, which is confusing and I don't want to do it here.
+                    value += 1
+                properties["index"] = value
+                fields.append("index")
+
+        for name in ("rowCount", "columnCount", "frozenRowCount", "frozenColumnCount"):
+            if name in changes:
+                if not isinstance(changes[name], int):
+                    raise TypeError("%s arg must be an int, not %s" % (name, type(changes[name]).__name__))
+                if changes[name] < 1:
+                    raise TypeError("%s arg must be a positive nonzero int, not %r" % (name, changes[name]))
+                gridProperties[name] = changes[name]
+        for name in ("hideGridlines", "rowGroupControlAfter", "columnGroupControlAfter"):
+            if name in changes:
+                gridProperties[name] = bool(changes[name])
+
+        newRowCount = gridProperties.get("rowCount", self._rowCount)
+        newColumnCount = gridProperties.get("columnCount", self._columnCount)
+        if gridProperties.get("frozenRowCount", self._frozenRowCount) >= newRowCount:
+            raise ValueError(
+                "You cannot freeze all rows on the sheet (sheet %r would have %s rows and %s frozen rows)"
+                % (self._title, newRowCount, gridProperties.get("frozenRowCount", self._frozenRowCount))
+            )
+        if gridProperties.get("frozenColumnCount", self._frozenColumnCount) >= newColumnCount:
+            raise ValueError(
+                "You cannot freeze all columns on the sheet (sheet %r would have %s columns and %s frozen columns)"
+                % (self._title, newColumnCount, gridProperties.get("frozenColumnCount", self._frozenColumnCount))
+            )
+        if gridProperties:
+            properties["gridProperties"] = gridProperties
+            fields.extend(["gridProperties." + name for name in gridProperties])
+        if not fields:
+            return  # No change needed.
 
-        self._spreadsheet.refresh()  # Refresh the spreadsheet's list of sheets.
+        oldRowCount, oldColumnCount = self._rowCount, self._columnCount
+        request = {"updateSheetProperties": {"properties": properties, "fields": ",".join(fields)}}
+        if "index" in properties:
+            # Moving a sheet changes the other sheets' indexes too, so get the spreadsheet's properties in the
+            # response and update all of the Sheet objects (without downloading any sheet data).
+            self._spreadsheet._batchUpdateSheets([request])
+        else:
+            _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheet._spreadsheetId, "body": {"requests": [request]}})
+
+        if newRowCount < oldRowCount or newColumnCount < oldColumnCount:
+            # Forget the cells that were removed by shrinking the sheet:
+            self._replaceCells(
+                {key: value for key, value in self._cells.items() if key[0] <= newColumnCount and key[1] <= newRowCount}
+            )
+        if "title" in properties:
+            self._title = properties["title"]
+        if "tabColor" in properties:
+            self._tabColor = properties["tabColor"]
+        for name, value in gridProperties.items():
+            setattr(self, "_" + name, value)
+
+    @contextlib.contextmanager
+    def editProperties(self):
+        """
+        A context manager that holds the changes made to this Sheet's properties (by setting attributes like
+        `title`, `tabColor`, `rowCount`, or `frozenRowCount`, or calling setProperties()) and sends them all in
+        one request when the `with` block ends. Nothing is sent if the block raises an exception. The
+        attributes keep their old values until the block ends.
+        """
+        if self._pendingProperties is not None:
+            yield self  # Nested blocks send their changes with the outermost block.
+            return
+
+        self._pendingProperties = {}
+        try:
+            yield self
+            changes = self._pendingProperties
+        finally:
+            self._pendingProperties = None
+        self.setProperties(**changes)
 
     def resize(self, columnCount=None, rowCount=None):
         # NOTE: If you try to specify the rowCount without the columnCount
@@ -1498,9 +2421,8 @@ class Sheet:
         # We have a resize() method so that the user doesn't set the row/column
         # count back to the local setting in this Sheet object when it has
         # been changed on Google Sheets by another user. The rowCount and
-        # columnCount property setters will make a request to get the current
-        # sizes so they don't mistakenly change the other dimension, but
-        # this won't be an atomic operation like resize() is.
+        # columnCount property setters only send their own dimension in the
+        # field mask, so they don't mistakenly change the other dimension.
 
         # As of Feb 2019, Google Sheets has a cell max of 5,000,000, but
         # this could change so ezsheets won't catch it.
@@ -1558,99 +2480,1305 @@ class Sheet:
                 },
             }
         )
+        if rowCount < self._rowCount or columnCount < self._columnCount:
+            # Forget the cells that were removed by shrinking the sheet:
+            self._replaceCells({key: value for key, value in self._cells.items() if key[0] <= columnCount and key[1] <= rowCount})
         self._rowCount = rowCount
         self._columnCount = columnCount
 
-    def __getitem__(self, *key):
-        if isinstance(key[0], str):
-            # Key is assumed to be an address like 'A1'
-            return self.get(key[0])
-        elif len(key[0]) == 2:
-            # Key is assumed to be a tuple of column, row addresses
-            return self.get(*key[0])
-        else:
-            # Let get() handle raising an error.
-            return self.get(*key)
+    def _getValues(self, valueRenderOption="FORMATTED_VALUE"):
+        # Return this sheet's values as a list of row lists straight from a values.get request, without
+        # updating `_cells`. Google Sheets leaves out trailing empty rows and the trailing empty cells of
+        # each row, so the rows can have different lengths.
+        response = _makeRequest(
+            "values.get",
+            **{
+                "spreadsheetId": self._spreadsheet._spreadsheetId,
+                "range": "%s!A1:%s%s" % (self._title, getColumnLetterOf(self._columnCount), self._rowCount),
+                "valueRenderOption": valueRenderOption,
+            }
+        )
+        return response.get("values", [])
 
-    def __setitem__(self, *args):
-        if len(args) < 2:
-            raise TypeError("__setitem__() requires at least two arguments")
-        key = args[:-1]
-        value = args[-1]
+    def toNumpy(self, dtype=object, valueRenderOption="FORMATTED_VALUE"):
+        """
+        Download this sheet's values and return them as a 2D NumPy array, without the trailing
+        empty rows and columns. Empty cells are blank strings. This requires the NumPy module.
+        """
+        numpy = _importOptional("numpy", "toNumpy()")
+        rows = self._getValues(valueRenderOption)
+        width = max([len(row) for row in rows] + [0])
+        if width == 0:
+            return numpy.empty((0, 0), dtype=dtype)
+        return numpy.array([row + [""] * (width - len(row)) for row in rows], dtype=dtype)
+
+    def toDataFrame(self, header=1, dtypes=None, valueRenderOption="FORMATTED_VALUE"):
+        """
+        Download this sheet's values and return them as a pandas DataFrame, without the trailing
+        empty rows and columns. This requires the pandas module.
 
-        if isinstance(key[0], str):
-            # Key is assumed to be an address like 'A1'
-            return self.update(key[0], value)
-        elif len(key[0]) == 2:
-            # Key is assumed to be a tuple of column, row addresses
-            return self.update(*key[0], value)
+        :param header: The 1-based row number with the column names. The rows above it are skipped. Pass
+            None if the sheet has no header row.
+        :param dtypes: A dict of column names to dtypes (or a single dtype) to pass to `DataFrame.astype()`.
+        :param valueRenderOption: Pass 'UNFORMATTED_VALUE' to get numbers and booleans instead of strings.
+
+        Empty cells are None in the DataFrame so that pandas treats them as missing values.
+        """
+        if header is not None and (not isinstance(header, int) or header < 1):
+            raise ValueError("header arg must be a 1-based row number or None, not %r" % (header,))
+        pandas = _importOptional("pandas", "toDataFrame()")
+        rows = self._getValues(valueRenderOption)
+
+        width = max([len(row) for row in rows] + [0])
+        rows = [[None if value == "" else value for value in row] + [None] * (width - len(row)) for row in rows]
+        if header is None:
+            dataFrame = pandas.DataFrame(rows)
         else:
-            # Let update() handle raising an error.
-            return self.update(*key, value)
+            columns = rows[header - 1] if len(rows) >= header else []
+            columns = ["" if name is None else name for name in columns]
+            dataFrame = pandas.DataFrame(rows[header:], columns=columns)
 
-    def __iter__(self):
-        return iter(self.getRows())
+        if dtypes is not None:
+            dataFrame = dataFrame.astype(dtypes)
+        return dataFrame
 
+    def updateFromDataFrame(self, dataFrame, startCell="A1", header=True, index=False, clearBelow=False):
+        """
+        Write a pandas DataFrame to this sheet in a single request, with its top-left cell at
+        `startCell`. If `header` is True, the column names are written in the first row. If `index` is
+        True, the index is written in the first column. If `clearBelow` is True, the rows below the
+        DataFrame are cleared. Missing values are written as empty cells.
+        """
+        startColumn, startRow = convertToColumnRowInts(startCell)
 
-def _getTabColorArg(value):
-    if isinstance(value, str) and value in COLORS:
-        # value is a color string from colorvalues.py, like 'red' or 'black'
-        tabColorArg = {
-            "red": COLORS[value][0],
-            "green": COLORS[value][1],
-            "blue": COLORS[value][2],
-            "alpha": COLORS[value][3],
-        }
+        rows = []
+        if header:
+            columnNames = [_getWritableValue(name) for name in dataFrame.columns]
+            if index:
+                columnNames.insert(0, _getWritableValue(dataFrame.index.name))
+            rows.append(columnNames)
+        indexValues = dataFrame.index.tolist()
+        for i, row in enumerate(dataFrame.itertuples(index=False, name=None)):
+            row = [_getWritableValue(value) for value in row]
+            if index:
+                row.insert(0, _getWritableValue(indexValues[i]))
+            rows.append(row)
 
-    # elif value is None: # TODO - apparently there's no way to reset the color through the api?
-    #    tabColorArg = {} # Reset the color
-    elif isinstance(value, (list, tuple)) and len(value) in (3, 4):
-        # value is a tuple of three or four floats (ranged from 0.0 to 1.0)
-        tabColorArg = {"red": float(value[0]), "green": float(value[1]), "blue": float(value[2])}
-        try:
-            tabColorArg["alpha"] = value[3]
-        except:
-            tabColorArg["alpha"] = 1.0
-    elif value is None:
-        return None  # Represents no tabColor setting.
-    elif type(value) == dict:
-        tabColorArg = value
-    else:
-        raise ValueError(
-            "value argument must be a color string like 'red', a 3- or 4-float tuple for an RGB or RGBA value, or a dict"
-        )
+        width = max([len(row) for row in rows] + [0])
+        if width > 0 and len(rows) > 0:
+            self.updateRange(convertRange(startColumn, startRow, startColumn + width - 1, startRow + len(rows) - 1), rows)
+        if clearBelow:
+            self._clearRowsFrom(startRow + len(rows))
 
-    # Set any remaining unspecified defaults.
-    tabColorArg.setdefault("red", 0.0)
-    tabColorArg.setdefault("green", 0.0)
-    tabColorArg.setdefault("blue", 0.0)
-    tabColorArg.setdefault("alpha", 1.0)
-    tabColorArg["red"] = float(tabColorArg["red"])
-    tabColorArg["green"] = float(tabColorArg["green"])
-    tabColorArg["blue"] = float(tabColorArg["blue"])
-    tabColorArg["alpha"] = float(tabColorArg["alpha"])
-    return tabColorArg
+    def downloadAsCSV(self, filename=None):
+        """
+        Download this sheet's values as a CSV file and return the filename. Unlike
+        Spreadsheet.downloadAsCSV(), this works for any sheet, not just the first one. `filename` can
+        also be a binary file-like object, which is written to and returned without being closed.
+        """
+        return self._downloadDelimited(filename, "csv", ",")
 
+    def downloadAsTSV(self, filename=None):
+        """
+        Download this sheet's values as a TSV file and return the filename. Unlike
+        Spreadsheet.downloadAsTSV(), this works for any sheet, not just the first one. `filename` can
+        also be a binary file-like object, which is written to and returned without being closed.
+        """
+        return self._downloadDelimited(filename, "tsv", "\t")
 
-def convertToColumnRowInts(arg):
-    if not isinstance(arg, str):
-        raise TypeError("argument must be a grid cell str, like 'A1', not of type %s" % (type(arg).__name__))
-    if not arg.isalnum() or not arg[0].isalpha() or not arg[-1].isdecimal():
-        raise ValueError("argument must be a grid cell str, like 'A1', not %r" % (arg))
+    def _downloadDelimited(self, filename, fileType, delimiter):
+        if filename is None:
+            filename = _makeFilenameSafe(self._title) + "." + fileType
+        _writeDelimitedFile(self._getValues(), filename, delimiter)
+        return filename
 
-    for i in range(1, len(arg)):
-        if arg[i].isdecimal():
-            column = getColumnNumberOf(arg[:i])
-            row = int(arg[i:])
-            return (column, row)
+    def toArrow(self, header=1):
+        """
+        Download this sheet's values and return them as a pyarrow Table, without the trailing empty
+        rows and columns. This requires the pyarrow module.
 
-    assert False  # pragma: no cover We know this will always return before this point because arg[-1].isdecimal().
+        :param header: The 1-based row number with the column names. The rows above it are skipped. Pass
+            None if the sheet has no header row, and the columns are named by their letters.
 
+        Columns of only numbers or only booleans get numeric or boolean types. Empty cells are nulls, and
+        columns with a mix of types are converted to strings.
+        """
+        return _convertRowsToArrow(self._getValues("UNFORMATTED_VALUE"), header)
 
-def createSpreadsheet(title="Untitled spreadsheet"):
-    if not IS_INITIALIZED:
-        init()  # Initialize this module if not done so already.
-    # request = SHEETS_SERVICE.spreadsheets().create(body={
+    def loadArrow(self, table, startCell="A1", header=True, clearBelow=False):
+        """
+        Write a pyarrow Table to this sheet in a single request, with its top-left cell at `startCell`.
+        If `header` is True, the column names are written in the first row. If `clearBelow` is True, the
+        rows below the table are cleared. Nulls are written as empty cells.
+        """
+        startColumn, startRow = convertToColumnRowInts(startCell)
+
+        rows = []
+        if header:
+            rows.append([_getWritableValue(name) for name in table.column_names])
+        columns = [table.column(i).to_pylist() for i in range(table.num_columns)]
+        rows.extend([[_getWritableValue(value) for value in row] for row in zip(*columns)])
+
+        width = max([len(row) for row in rows] + [0])
+        if width > 0 and len(rows) > 0:
+            self.updateRange(convertRange(startColumn, startRow, startColumn + width - 1, startRow + len(rows) - 1), rows)
+        if clearBelow:
+            self._clearRowsFrom(startRow + len(rows))
+
+    def getRange(self, a1Range):
+        """
+        Return a Range object for the block of cells in `a1Range`, which is a str like 'A1:C3'.
+        """
+        return Range(self, *convertRange(a1Range))
+
+    def updateRange(self, a1Range, rows):
+        """
+        Update the block of cells in `a1Range`, which is a str like 'A1:C3', with the lists in `rows`
+        using a single request. Any cells in the range not covered by `rows` are cleared.
+        """
+        startColumn, startRow, stopColumn, stopRow = convertRange(a1Range)
+        if not isinstance(rows, (list, tuple)):
+            raise TypeError("rows arg must be a list/tuple of lists/tuples, not %s" % (type(rows).__name__))
+        for row in rows:
+            if not isinstance(row, (list, tuple)):
+                raise TypeError("rows arg contains a non-list/tuple")
+
+        width = stopColumn - startColumn + 1
+        height = stopRow - startRow + 1
+        if len(rows) > height or max([len(row) for row in rows] + [0]) > width:
+            raise ValueError("rows arg is larger than the %s range" % (a1Range))
+
+        # Pad the rows to fill the range, without modifying the caller's lists:
+        rows = [list(row) + [""] * (width - len(row)) for row in rows]
+        rows.extend([[""] * width for i in range(height - len(rows))])
+
+        self._updateCellRange(startColumn, startRow, rows)
+        self._setCachedRows(startColumn, startRow, rows)
+
+    def _getGridRange(self, a1Range):
+        # Return the 1-based, inclusive (startColumn, startRow, stopColumn, stopRow) of `a1Range`, a range str
+        # like 'A1:C3' or a Range object, and its GridRange dict for batchUpdate requests.
+        if isinstance(a1Range, Range):
+            rangeInts = (a1Range.startColumn, a1Range.startRow, a1Range.stopColumn, a1Range.stopRow)
+        else:
+            rangeInts = convertRange(a1Range)
+        startColumn, startRow, stopColumn, stopRow = rangeInts
+        gridRange = {
+            "sheetId": self._sheetId,
+            "startRowIndex": startRow - 1,
+            "endRowIndex": stopRow,  # The end indexes are exclusive.
+            "startColumnIndex": startColumn - 1,
+            "endColumnIndex": stopColumn,
+        }
+        return rangeInts, gridRange
+
+    def _getResizeRequests(self, requestedColumn, requestedRow, size=None):
+        # Return a list with the updateSheetProperties request that enlarges the sheet to fit the requested
+        # cell (or an empty list if it already fits) and the (columnCount, rowCount) the sheet will have. The
+        # sheet's rowCount and columnCount aren't changed, so callers set them once the request succeeds.
+        # If `size` is given, it's the (columnCount, rowCount) to enlarge instead of the sheet's current size.
+        if size is None:
+            size = (self._columnCount, self._rowCount)
+        columnCount, rowCount = self._getEnlargedSize(requestedColumn, requestedRow, size)
+        if (columnCount, rowCount) == size:
+            return [], size
+        return [
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": self._sheetId,
+                        "gridProperties": {"rowCount": rowCount, "columnCount": columnCount},
+                    },
+                    "fields": "gridProperties.rowCount,gridProperties.columnCount",
+                }
+            }
+        ], (columnCount, rowCount)
+
+    def format(
+        self,
+        a1Range,
+        bold=None,
+        italic=None,
+        underline=None,
+        strikethrough=None,
+        fontFamily=None,
+        fontSize=None,
+        foreground=None,
+        background=None,
+        numberFormat=None,
+        horizontalAlignment=None,
+        verticalAlignment=None,
+        wrapStrategy=None,
+    ):
+        """
+        Format the cells in `a1Range` (a range str like 'A1:D10' or a Range object) with a repeatCell request
+        that only changes the given formatting. Arguments left as None are unchanged.
+
+        `foreground` (the text color) and `background` take the same values as tabColor, like 'light yellow'.
+        `numberFormat` is one of NUMBER_FORMAT_TYPES like 'PERCENT', a pattern str like '$#,##0.00' or
+        'yyyy-mm-dd' (whose type is guessed from the pattern), a (type, pattern) tuple like
+        ('DATE', 'yyyy-mm-dd'), or a NumberFormat dict. Inside a Spreadsheet.batchFormatting() block, the
+        request is held and sent with the others when the block ends. This Sheet's cached values aren't
+        changed; call refresh() to get the values shown with a new numberFormat.
+        """
+        cellFormat = _getCellFormat(
+            bold,
+            italic,
+            underline,
+            strikethrough,
+            fontFamily,
+            fontSize,
+            foreground,
+            background,
+            numberFormat,
+            horizontalAlignment,
+            verticalAlignment,
+            wrapStrategy,
+        )
+        if not cellFormat:
+            return  # No change needed.
+
+        gridRange = self._getGridRange(a1Range)[1]
+        self._spreadsheet._queueFormatRequest(gridRange, cellFormat)
+
+    def clearRange(self, a1Range):
+        """
+        Clear the values of the cells in `a1Range` (a range str like 'A1:C3' or a Range object) with a single
+        values.clear request. Formatting is kept.
+        """
+        (startColumn, startRow, stopColumn, stopRow), gridRange = self._getGridRange(a1Range)
+        _makeRequest(
+            "values.clear",
+            **{
+                "spreadsheetId": self._spreadsheet._spreadsheetId,
+                "range": "%s!%s" % (self._title, convertRange(startColumn, startRow, stopColumn, stopRow)),
+                "body": {},
+            }
+        )
+
+        # Update the local data in `_cells`:
+        for key in [key for key in self._cells if startColumn <= key[0] <= stopColumn and startRow <= key[1] <= stopRow]:
+            self._setCellValue(key, "")
+
+    def copyRange(self, source, destination, pasteType="PASTE_NORMAL"):
+        """
+        Copy the cells in `source` (a range str like 'A1:C3' or a Range object) so that their top-left cell
+        is at `destination` (a cell str like 'E1') with a single copyPaste request, without downloading or
+        uploading the values. `pasteType` is a Google Sheets PasteType, such as 'PASTE_VALUES' to only copy
+        values or 'PASTE_FORMAT' to only copy formatting. The sheet is enlarged if needed.
+
+        Copied formulas are adjusted by Google Sheets, so call refresh() if their new results matter.
+        """
+        (startColumn, startRow, stopColumn, stopRow), sourceGridRange = self._getGridRange(source)
+        destinationColumn, destinationRow = convertToColumnRowInts(destination)
+        width = stopColumn - startColumn + 1
+        height = stopRow - startRow + 1
+        destinationGridRange = self._getGridRange(
+            convertRange(destinationColumn, destinationRow, destinationColumn + width - 1, destinationRow + height - 1)
+        )[1]
+
+        requests, newSize = self._getResizeRequests(destinationColumn + width - 1, destinationRow + height - 1)
+        requests.append(
+            {"copyPaste": {"source": sourceGridRange, "destination": destinationGridRange, "pasteType": pasteType}}
+        )
+        _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheet._spreadsheetId, "body": {"requests": requests}})
+        self._columnCount, self._rowCount = newSize
+
+        if pasteType in ("PASTE_NORMAL", "PASTE_VALUES", "PASTE_NO_BORDERS"):
+            # Update the local data in `_cells`:
+            rows = Range(self, startColumn, startRow, stopColumn, stopRow).rows
+            self._setCachedValues(destinationColumn, destinationRow, rows)
+
+    def moveRange(self, source, destination):
+        """
+        Move the cells in `source` (a range str like 'A1:C3' or a Range object) so that their top-left cell
+        is at `destination` (a cell str like 'E1') with a single cutPaste request, without downloading or
+        uploading the values. The source cells are left empty, and the sheet is enlarged if needed.
+        """
+        (startColumn, startRow, stopColumn, stopRow), sourceGridRange = self._getGridRange(source)
+        destinationColumn, destinationRow = convertToColumnRowInts(destination)
+        width = stopColumn - startColumn + 1
+        height = stopRow - startRow + 1
+
+        requests, newSize = self._getResizeRequests(destinationColumn + width - 1, destinationRow + height - 1)
+        requests.append(
+            {
+                "cutPaste": {
+                    "source": sourceGridRange,
+                    "destination": {"sheetId": self._sheetId, "rowIndex": destinationRow - 1, "columnIndex": destinationColumn - 1},
+                    "pasteType": "PASTE_NORMAL",
+                }
+            }
+        )
+        _makeRequest("batchUpdate", **{"spreadsheetId": self._spreadsheet._spreadsheetId, "body": {"requests": requests}})
+        self._columnCount, self._rowCount = newSize
+
+        # Update the local data in `_cells`:
+        rows = Range(self, startColumn, startRow, stopColumn, stopRow).rows
+        for key in [key for key in self._cells if startColumn <= key[0] <= stopColumn and startRow <= key[1] <= stopRow]:
+            self._setCellValue(key, "")
+        self._setCachedValues(destinationColumn, destinationRow, rows)
+
+    def _setCachedValues(self, startColumn, startRow, rows):
+        # Like _setCachedRows(), but for values that are already in the form that `_cells` stores them.
+        for rowNumBase0, row in enumerate(rows):
+            for colNumBase0, value in enumerate(row):
+                self._setCellValue((startColumn + colNumBase0, startRow + rowNumBase0), value)
+
+    def insertRows(self, startRow, count=1):
+        """
+        Insert `count` empty rows so that the first one is row number `startRow`, pushing the rows below them
+        down, with a single insertDimension request. The new rows get the formatting of the row above them.
+        """
+        if not isinstance(startRow, int) or not isinstance(count, int):
+            raise TypeError("startRow and count args must be ints")
+        if startRow < 1 or startRow > self._rowCount + 1:
+            raise ValueError("startRow arg must be between 1 and %s, not %s" % (self._rowCount + 1, startRow))
+        if count < 1:
+            raise ValueError("count arg must be at least 1, not %s" % (count))
+
+        _makeRequest(
+            "batchUpdate",
+            **{
+                "spreadsheetId": self._spreadsheet._spreadsheetId,
+                "body": {
+                    "requests": [
+                        {
+                            "insertDimension": {
+                                "range": {
+                                    "sheetId": self._sheetId,
+                                    "dimension": "ROWS",
+                                    "startIndex": startRow - 1,
+                                    "endIndex": startRow - 1 + count,
+                                },
+                                "inheritFromBefore": startRow > 1,
+                            }
+                        }
+                    ]
+                },
+            }
+        )
+        self._rowCount += count
+
+        # Update the local data in `_cells`:
+        self._replaceCells(dict([((colNum, rowNum + count if rowNum >= startRow else rowNum), value) for (colNum, rowNum), value in self._cells.items()]))
+
+    def deleteRows(self, startRow, count=1):
+        """
+        Delete `count` rows starting at row number `startRow`, pulling the rows below them up, with a single
+        deleteDimension request.
+        """
+        if not isinstance(startRow, int) or not isinstance(count, int):
+            raise TypeError("startRow and count args must be ints")
+        if startRow < 1 or startRow > self._rowCount:
+            raise ValueError("startRow arg must be between 1 and %s, not %s" % (self._rowCount, startRow))
+        if count < 1 or startRow + count - 1 > self._rowCount:
+            raise ValueError("count arg must be between 1 and %s, not %s" % (self._rowCount - startRow + 1, count))
+        if count == self._rowCount:
+            raise ValueError("Cannot delete all rows; sheets must have at least one row")
+
+        _makeRequest(
+            "batchUpdate",
+            **{
+                "spreadsheetId": self._spreadsheet._spreadsheetId,
+                "body": {
+                    "requests": [
+                        {
+                            "deleteDimension": {
+                                "range": {
+                                    "sheetId": self._sheetId,
+                                    "dimension": "ROWS",
+                                    "startIndex": startRow - 1,
+                                    "endIndex": startRow - 1 + count,
+                                }
+                            }
+                        }
+                    ]
+                },
+            }
+        )
+        self._rowCount -= count
+
+        # Update the local data in `_cells`:
+        cells = {}
+        for (colNum, rowNum), value in self._cells.items():
+            if rowNum >= startRow + count:
+                cells[(colNum, rowNum - count)] = value
+            elif rowNum < startRow:
+                cells[(colNum, rowNum)] = value
+        self._replaceCells(cells)
+
+    def __getitem__(self, *key):
+        if isinstance(key[0], str) and ":" in key[0]:
+            # Key is assumed to be a range like 'A1:C3'
+            return self.getRange(key[0])
+        elif isinstance(key[0], str):
+            # Key is assumed to be an address like 'A1'
+            return self.get(key[0])
+        elif len(key[0]) == 2:
+            # Key is assumed to be a tuple of column, row addresses
+            return self.get(*key[0])
+        else:
+            # Let get() handle raising an error.
+            return self.get(*key)
+
+    def __setitem__(self, *args):
+        if len(args) < 2:
+            raise TypeError("__setitem__() requires at least two arguments")
+        key = args[:-1]
+        value = args[-1]
+
+        if isinstance(key[0], str) and ":" in key[0]:
+            # Key is assumed to be a range like 'A1:C3'
+            return self.updateRange(key[0], value)
+        elif isinstance(key[0], str):
+            # Key is assumed to be an address like 'A1'
+            return self.update(key[0], value)
+        elif len(key[0]) == 2:
+            # Key is assumed to be a tuple of column, row addresses
+            return self.update(*key[0], value)
+        else:
+            # Let update() handle raising an error.
+            return self.update(*key, value)
+
+    def __iter__(self):
+        return iter(self.getRows())
+
+
+class Range:
+    """
+    This class represents a rectangular block of cells in a Sheet, such as the cells in 'A1:C3'. Range
+    objects are views of their Sheet's local data, so they reflect later updates to the Sheet. Get them
+    with `sheet['A1:C3']` or `sheet.getRange('A1:C3')`.
+    """
+
+    def __init__(self, sheet, startColumn, startRow, stopColumn, stopRow):
+        """
+        Initializer for Range objects. The start and stop columns and rows are 1-based and inclusive.
+        """
+        if startColumn > stopColumn or startRow > stopRow:
+            raise ValueError("the start of a range must be above and to the left of its end")
+        self._sheet = sheet
+        self._startColumn = startColumn
+        self._startRow = startRow
+        self._stopColumn = stopColumn
+        self._stopRow = stopRow
+
+    @property
+    def sheet(self):
+        """
+        The Sheet object that contains this Range object.
+        """
+        return self._sheet
+
+    @property
+    def startColumn(self):
+        return self._startColumn
+
+    @property
+    def startRow(self):
+        return self._startRow
+
+    @property
+    def stopColumn(self):
+        return self._stopColumn
+
+    @property
+    def stopRow(self):
+        return self._stopRow
+
+    @property
+    def address(self):
+        """
+        The A1 notation str of this Range, such as 'A1:C3'.
+        """
+        return convertRange(self._startColumn, self._startRow, self._stopColumn, self._stopRow)
+
+    @property
+    def rowCount(self):
+        return self._stopRow - self._startRow + 1
+
+    @property
+    def columnCount(self):
+        return self._stopColumn - self._startColumn + 1
+
+    @property
+    def rows(self):
+        """
+        A list of lists of the values in each row of this Range.
+        """
+        cells = self._sheet._cells
+        columnNums = range(self._startColumn, self._stopColumn + 1)
+        rowNums = range(self._startRow, self._stopRow + 1)
+        return [[cells.get((colNum, rowNum), "") for colNum in columnNums] for rowNum in rowNums]
+
+    @property
+    def columns(self):
+        """
+        A list of lists of the values in each column of this Range.
+        """
+        cells = self._sheet._cells
+        columnNums = range(self._startColumn, self._stopColumn + 1)
+        rowNums = range(self._startRow, self._stopRow + 1)
+        return [[cells.get((colNum, rowNum), "") for rowNum in rowNums] for colNum in columnNums]
+
+    @property
+    def values(self):
+        """
+        A flat list of the values in this Range, in row-by-row order.
+        """
+        cells = self._sheet._cells
+        columnNums = range(self._startColumn, self._stopColumn + 1)
+        rowNums = range(self._startRow, self._stopRow + 1)
+        return [cells.get((colNum, rowNum), "") for rowNum in rowNums for colNum in columnNums]
+
+    def toList(self):
+        """
+        Return a list of lists of the values in each row of this Range.
+        """
+        return self.rows
+
+    def toNumpy(self, dtype=object):
+        """
+        Return a 2D NumPy array of the values in this Range. This requires the NumPy module to be installed.
+        """
+        numpy = _importOptional("numpy", "toNumpy()")
+        return numpy.array(self.rows, dtype=dtype)
+
+    def update(self, rows):
+        """
+        Update the cells in this Range with the lists in `rows` using a single request.
+        """
+        self._sheet.updateRange(self.address, rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return self.rowCount
+
+    def __eq__(self, other):
+        """
+        A Range object is only considered equal to Range objects of the same cells in the same Sheet.
+        """
+        if not isinstance(other, Range):
+            return False
+        return self._sheet == other._sheet and self.address == other.address
+
+    def __repr__(self):
+        return "<%s sheetTitle=%r, address=%r>" % (type(self).__name__, self._sheet.title, self.address)
+
+
+class ColumnIndex(collections.abc.Mapping):
+    """
+    This class is a read-only, dict-like view of a Sheet that maps the values in one of its columns to
+    the row numbers they're in, like a primary key. If a value is in the column more than once, it maps
+    to the first row. ColumnIndex objects read the Sheet's local data, so they reflect later updates
+    to the Sheet. Get them with `sheet.indexBy('A')`.
+    """
+
+    def __init__(self, sheet, column):
+        """
+        Initializer for ColumnIndex objects. The column is a 1-based int.
+        """
+        self._sheet = sheet
+        self._column = column
+
+    @property
+    def sheet(self):
+        """
+        The Sheet object that this ColumnIndex object indexes.
+        """
+        return self._sheet
+
+    @property
+    def column(self):
+        return self._column
+
+    def __getitem__(self, key):
+        """
+        Return the row number of the first cell in this column with the value `key`. This uses the Sheet's
+        value index, so it doesn't check every cell in the column.
+        """
+        cell = self._sheet.find(key, column=self._column)
+        if cell is None:
+            raise KeyError(key)
+        return cell[1]
+
+    def _getColumnCells(self):
+        # Return a list of the (row, value) tuples of the non-blank cells in this column, sorted by row.
+        return sorted([(key[1], value) for key, value in self._sheet._cells.items() if key[0] == self._column], key=lambda cell: cell[0])
+
+    def __iter__(self):
+        seen = set()
+        for rowNum, value in self._getColumnCells():
+            if _getIndexKey(value) not in seen:
+                seen.add(_getIndexKey(value))
+                yield value
+
+    def __len__(self):
+        return len(set([_getIndexKey(value) for rowNum, value in self._getColumnCells()]))
+
+    def __repr__(self):
+        return "<%s sheetTitle=%r, column=%r>" % (type(self).__name__, self._sheet.title, getColumnLetterOf(self._column))
+
+
+SessionResult = collections.namedtuple("SessionResult", ("operation", "spreadsheetId", "reply", "error"))
+
+
+class Session:
+    """
+    This class queues changes to the sheets of one or more spreadsheets and sends them all when commit() is
+    called, or when a `with` block using the Session ends without an exception. Each spreadsheet's changes
+    are sent in a single batchUpdate request, and up to `workers` spreadsheets are updated at the same time.
+    If `httpBatch` is True, the spreadsheets' batchUpdate requests are instead combined into multipart HTTP
+    batch requests, which saves a round trip per spreadsheet when many spreadsheets have small changes.
+    """
+
+    def __init__(self, workers=4, httpBatch=False):
+        """
+        Initializer for Session objects.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive int, not %r" % (workers,))
+        self._workers = workers
+        self._httpBatch = bool(httpBatch)
+        self._operations = []  # (operation name, Spreadsheet object, args tuple) tuples in the order they were queued.
+        self.results = None  # The list of SessionResult namedtuples from the last commit.
+
+    def __len__(self):
+        """
+        Return the number of queued changes.
+        """
+        return len(self._operations)
+
+    def __repr__(self):
+        return "<%s operations=%r, workers=%r>" % (type(self).__name__, len(self._operations), self._workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is None:
+            self.commit()
+        else:
+            self._operations = []  # Don't send any of the changes if the block raised an exception.
+        return False
+
+    def update(self, sheet, startCell, values):
+        """
+        Queue writing `values`, a single value or a list of row lists, with its top-left cell at `startCell`
+        (a cell str like 'A1' or a (column, row) tuple) in `sheet`. The sheet is enlarged if needed. Like
+        COMBINE_RESIZE_WITH_WRITES, the values are sent as numbers, booleans, formulas, or strings rather than
+        parsed by Google Sheets as if the user typed them.
+        """
+        if not isinstance(sheet, Sheet):
+            raise TypeError("sheet arg must be a Sheet object, not %s" % (type(sheet).__name__))
+        if isinstance(startCell, str):
+            startColumn, startRow = convertToColumnRowInts(startCell)
+        elif isinstance(startCell, (list, tuple)) and len(startCell) == 2:
+            startColumn, startRow = startCell
+        else:
+            raise TypeError("startCell arg must be a cell str like 'A1' or a (column, row) tuple, not %r" % (startCell,))
+        if not isinstance(startColumn, int) or not isinstance(startRow, int):
+            raise TypeError("startCell's column and row must be ints, not %r" % (startCell,))
+        if startColumn < 1 or startRow < 1:
+            raise IndexError("startCell's column and row are 1-based, and must be 1 or greater, not %r" % (startCell,))
+
+        if not isinstance(values, (list, tuple)):
+            values = [[values]]
+        for row in values:
+            if not isinstance(row, (list, tuple)):
+                raise TypeError("values arg must be a single value or a list/tuple of lists/tuples")
+        rows = [["" if value is None else value for value in row] for row in values]
+        self._operations.append(("update", sheet._spreadsheet, (sheet, startColumn, startRow, rows)))
+
+    def format(self, sheet, a1Range, **formatting):
+        """
+        Queue formatting the cells in `a1Range` of `sheet`. The keyword arguments are the same as Sheet.format()'s.
+        """
+        if not isinstance(sheet, Sheet):
+            raise TypeError("sheet arg must be a Sheet object, not %s" % (type(sheet).__name__))
+        cellFormat = _getCellFormat(**formatting)
+        if cellFormat:
+            self._operations.append(("format", sheet._spreadsheet, (sheet._getGridRange(a1Range)[1], cellFormat)))
+
+    def batchUpdate(self, spreadsheet, request):
+        """
+        Queue a Google Sheets batchUpdate request dict, like {'mergeCells': {...}}, for `spreadsheet` (a
+        Spreadsheet object, or a Sheet object for its spreadsheet). Its reply is in the SessionResult.
+        """
+        if isinstance(spreadsheet, Sheet):
+            spreadsheet = spreadsheet._spreadsheet
+        if not isinstance(spreadsheet, Spreadsheet):
+            raise TypeError("spreadsheet arg must be a Spreadsheet or Sheet object, not %s" % (type(spreadsheet).__name__))
+        if not isinstance(request, dict):
+            raise TypeError("request arg must be a dict, not %s" % (type(request).__name__))
+        self._operations.append(("batchUpdate", spreadsheet, (request,)))
+
+    def commit(self):
+        """
+        Send the queued changes and return a list with a SessionResult namedtuple for each of them, in the
+        order they were queued. A SessionResult has the `operation` name ('update', 'format', or
+        'batchUpdate'), the `spreadsheetId`, the batchUpdate `reply` for the change, and the `error` raised
+        while sending its spreadsheet's changes, or None. Since each spreadsheet's changes are sent in one
+        request, either all or none of them are made, but a failure doesn't stop other spreadsheets' changes.
+        The list is also stored in the `results` attribute.
+        """
+        operations = self._operations
+        self._operations = []
+
+        groups = collections.OrderedDict()  # Maps spreadsheet IDs to lists of indexes in `operations`.
+        for i, (name, spreadsheet, args) in enumerate(operations):
+            groups.setdefault(spreadsheet._spreadsheetId, []).append(i)
+
+        def prepareSpreadsheet(spreadsheetId, operationIndexes):
+            # Return the spreadsheet's batchUpdate requests, the index in them of the request whose reply is
+            # each operation's reply, and a dict that maps sheet IDs to (sheet, (columnCount, rowCount)) for the
+            # sizes the sheets will have once the request succeeds.
+            requests = []
+            replyIndexes = []
+            newSizes = {}
+            for i in operationIndexes:
+                name, spreadsheet, args = operations[i]
+                if name == "update":
+                    sheet, startColumn, startRow, rows = args
+                    stopColumn = startColumn + max([len(row) for row in rows] + [1]) - 1
+                    size = newSizes.get(sheet._sheetId, (sheet, None))[1]
+                    resizeRequests, size = sheet._getResizeRequests(stopColumn, startRow + max(len(rows), 1) - 1, size)
+                    requests.extend(resizeRequests)
+                    newSizes[sheet._sheetId] = (sheet, size)
+                    requests.append(
+                        {
+                            "updateCells": {
+                                "start": {"sheetId": sheet._sheetId, "rowIndex": startRow - 1, "columnIndex": startColumn - 1},
+                                "rows": [{"values": [{"userEnteredValue": _getExtendedValue(value)} for value in row]} for row in rows],
+                                "fields": "userEnteredValue",
+                            }
+                        }
+                    )
+                elif name == "format":
+                    requests.append(_getRepeatCellRequest(*args))
+                else:
+                    requests.append(args[0])
+                replyIndexes.append(len(requests) - 1)
+            return requests, replyIndexes, newSizes
+
+        def finishSpreadsheet(spreadsheetId, operationIndexes, replyIndexes, newSizes, response):
+            # Return the SessionResults for the spreadsheet's operations from its batchUpdate response, which
+            # is the exception raised instead if the request failed.
+            if isinstance(response, Exception):
+                return [SessionResult(operations[i][0], spreadsheetId, None, response) for i in operationIndexes]
+
+            for sheet, size in newSizes.values():
+                sheet._columnCount, sheet._rowCount = size
+
+            replies = response.get("replies", [])
+            results = []
+            for i, replyIndex in zip(operationIndexes, replyIndexes):
+                name, spreadsheet, args = operations[i]
+                if name == "update":
+                    sheet, startColumn, startRow, rows = args
+                    sheet._setCachedRows(startColumn, startRow, rows, extendedValues=True)  # Update the local data in `_cells`.
+                results.append(SessionResult(name, spreadsheetId, replies[replyIndex] if replyIndex < len(replies) else {}, None))
+            return results
+
+        def commitSpreadsheet(spreadsheetId, operationIndexes):
+            # Any exception is returned in the spreadsheet's SessionResults so that it doesn't stop the other
+            # spreadsheets' changes.
+            try:
+                requests, replyIndexes, newSizes = prepareSpreadsheet(spreadsheetId, operationIndexes)
+                response = _makeRequest("batchUpdate", **{"spreadsheetId": spreadsheetId, "body": {"requests": requests}})
+            except Exception as exc:
+                return finishSpreadsheet(spreadsheetId, operationIndexes, None, None, exc)
+            return finishSpreadsheet(spreadsheetId, operationIndexes, replyIndexes, newSizes, response)
+
+        if self._httpBatch:
+            prepared = collections.OrderedDict()  # Maps spreadsheet IDs to prepareSpreadsheet()'s return value.
+            groupResults = {}
+            for spreadsheetId, operationIndexes in groups.items():
+                try:
+                    prepared[spreadsheetId] = prepareSpreadsheet(spreadsheetId, operationIndexes)
+                except Exception as exc:
+                    groupResults[spreadsheetId] = finishSpreadsheet(spreadsheetId, operationIndexes, None, None, exc)
+            responses = _makeBatchRequest(
+                [
+                    ("batchUpdate", {"spreadsheetId": spreadsheetId, "body": {"requests": requests}})
+                    for spreadsheetId, (requests, replyIndexes, newSizes) in prepared.items()
+                ]
+            )
+            for (spreadsheetId, (requests, replyIndexes, newSizes)), response in zip(prepared.items(), responses):
+                groupResults[spreadsheetId] = finishSpreadsheet(
+                    spreadsheetId, groups[spreadsheetId], replyIndexes, newSizes, response
+                )
+            groupResults = [groupResults[spreadsheetId] for spreadsheetId in groups]
+        else:
+            groupResults = _runInThreads(commitSpreadsheet, list(groups.items()), self._workers)
+        results = [None] * len(operations)
+        for operationIndexes, groupResult in zip(groups.values(), groupResults):
+            for i, result in zip(operationIndexes, groupResult):
+                results[i] = result
+        self.results = results
+        return results
+
+
+@atexit.register
+def _flushBufferedAppends():
+    # Send the rows that are still in appendRows(buffered=True) buffers when the program exits, so that
+    # they aren't silently lost.
+    for sheet in list(_BUFFERED_APPEND_SHEETS.values()):
+        try:
+            sheet.flushAppends()
+        except Exception as exc:
+            warnings.warn("The %d buffered rows for sheet %r couldn't be sent: %s" % (len(sheet._appendBuffer), sheet._title, exc))
+
+
+def _getWritableValue(value):
+    # Convert a value from a pandas DataFrame or Arrow table into a value that can be sent to Google Sheets as JSON.
+    if value is None:
+        return ""
+    if hasattr(value, "item") and not isinstance(value, (list, tuple, dict)):
+        value = value.item()  # Convert NumPy scalars like numpy.int64 to Python values.
+    if isinstance(value, float) and math.isnan(value):
+        return ""  # NaN is pandas' missing value.
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if str(value) in ("NaT", "<NA>", "nan"):
+        return ""  # Other pandas missing values.
+    return str(value)
+
+
+def _iterExport(spreadsheetId, fileType, chunkSize=None, progressCallback=None):
+    # Export the spreadsheet with `spreadsheetId` from Google Drive and yield its contents in chunks of
+    # bytes. See Spreadsheet.iterDownload() for the arguments.
+    if fileType not in _FILE_TYPES:
+        raise ValueError("fileType must be one of %r, not %r" % (tuple(_FILE_TYPES), fileType))
+    if chunkSize is None:
+        chunkSize = DOWNLOAD_CHUNK_SIZE
+
+    request = DRIVE_SERVICE.files().export(fileId=spreadsheetId, mimeType=_FILE_TYPES[fileType])
+    threadHttp = _getThreadHttp(isDrive=True)
+    if threadHttp is not None:
+        request.http = threadHttp
+    _logReadRequest()
+    buffer = io.BytesIO()
+    downloader = MediaIoBaseDownload(buffer, request, chunksize=chunkSize)
+    done = False
+    while done is False:
+        status, done = _makeMediaRequest(downloader.next_chunk, _logReadRequest)
+        if progressCallback is not None:
+            progressCallback(status.resumable_progress, status.total_size)
+
+        # Hand over this chunk and empty the buffer for the next one:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        if chunk:
+            yield chunk
+
+
+def _writeDelimitedFile(rows, filename, delimiter=","):
+    # Write a list of row lists to the file `filename` as UTF-8 CSV (or TSV) data. `filename` can also be a
+    # binary file-like object, which isn't closed.
+    text = io.StringIO()
+    csv.writer(text, delimiter=delimiter).writerows(rows)
+    if hasattr(filename, "write"):
+        filename.write(text.getvalue().encode("utf-8"))
+    else:
+        with open(filename, "wb") as fileObj:
+            fileObj.write(text.getvalue().encode("utf-8"))
+
+
+def _convertRowsToArrow(rows, header=1):
+    # Convert a list of row lists from a values.get request made with valueRenderOption='UNFORMATTED_VALUE'
+    # into a pyarrow Table. See Sheet.toArrow() for the `header` argument.
+    pyarrow = _importOptional("pyarrow", "Arrow and Parquet exports")
+    if header is not None and (not isinstance(header, int) or header < 1):
+        raise ValueError("header arg must be a 1-based row number or None, not %r" % (header,))
+
+    width = max([len(row) for row in rows] + [0])
+    if header is None:
+        names = [getColumnLetterOf(i + 1) for i in range(width)]
+    else:
+        headerRow = rows[header - 1] if len(rows) >= header else []
+        names = []
+        for i in range(width):
+            name = headerRow[i] if i < len(headerRow) else ""
+            names.append(getColumnLetterOf(i + 1) if name == "" else _getCachedValue(name))
+        rows = rows[header:]
+
+    arrays = []
+    for i in range(width):
+        values = [None if (i >= len(row) or row[i] == "") else row[i] for row in rows]
+        valueTypes = set([type(value) for value in values if value is not None])
+        if valueTypes == set([bool]):
+            arrays.append(pyarrow.array(values, type=pyarrow.bool_()))
+        elif valueTypes == set([int]):
+            arrays.append(pyarrow.array(values, type=pyarrow.int64()))
+        elif len(valueTypes) > 0 and valueTypes <= set([int, float]):
+            arrays.append(pyarrow.array([None if value is None else float(value) for value in values], type=pyarrow.float64()))
+        else:
+            arrays.append(pyarrow.array([None if value is None else _getCachedValue(value) for value in values], type=pyarrow.string()))
+    return pyarrow.Table.from_arrays(arrays, names=names)
+
+
+def _importOptional(moduleName, featureName):
+    # Import modules like NumPy that only some EZSheets features need.
+    try:
+        return importlib.import_module(moduleName)
+    except ImportError:
+        raise EZSheetsException(
+            "%s requires the %s module. Install it by running `pip install %s`" % (featureName, moduleName, moduleName)
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _getNamedColor(name):
+    # Return the (red, green, blue, alpha) floats of a color string from colorvalues.py, like 'red' or 'black'.
+    # This is cached, since formatting a report can look up the same few colors many times.
+    return tuple(float(component) for component in COLORS[name])
+
+
+def _getTabColorArg(value):
+    if isinstance(value, str) and value in COLORS:
+        # value is a color string from colorvalues.py, like 'red' or 'black'
+        red, green, blue, alpha = _getNamedColor(value)
+        return {"red": red, "green": green, "blue": blue, "alpha": alpha}
+
+    # elif value is None: # TODO - apparently there's no way to reset the color through the api?
+    #    tabColorArg = {} # Reset the color
+    elif isinstance(value, (list, tuple)) and len(value) in (3, 4):
+        # value is a tuple of three or four floats (ranged from 0.0 to 1.0)
+        tabColorArg = {"red": float(value[0]), "green": float(value[1]), "blue": float(value[2])}
+        try:
+            tabColorArg["alpha"] = value[3]
+        except:
+            tabColorArg["alpha"] = 1.0
+    elif value is None:
+        return None  # Represents no tabColor setting.
+    elif type(value) == dict:
+        tabColorArg = value
+    else:
+        raise ValueError(
+            "value argument must be a color string like 'red', a 3- or 4-float tuple for an RGB or RGBA value, or a dict"
+        )
+
+    # Set any remaining unspecified defaults.
+    tabColorArg.setdefault("red", 0.0)
+    tabColorArg.setdefault("green", 0.0)
+    tabColorArg.setdefault("blue", 0.0)
+    tabColorArg.setdefault("alpha", 1.0)
+    tabColorArg["red"] = float(tabColorArg["red"])
+    tabColorArg["green"] = float(tabColorArg["green"])
+    tabColorArg["blue"] = float(tabColorArg["blue"])
+    tabColorArg["alpha"] = float(tabColorArg["alpha"])
+    return tabColorArg
+
+
+def _getCellFormat(
+    bold=None,
+    italic=None,
+    underline=None,
+    strikethrough=None,
+    fontFamily=None,
+    fontSize=None,
+    foreground=None,
+    background=None,
+    numberFormat=None,
+    horizontalAlignment=None,
+    verticalAlignment=None,
+    wrapStrategy=None,
+):
+    # Return the CellFormat dict for Sheet.format()'s arguments, with only the formatting that isn't None.
+    textFormat = {}
+    for name, value in (("bold", bold), ("italic", italic), ("underline", underline), ("strikethrough", strikethrough)):
+        if value is not None:
+            textFormat[name] = bool(value)
+    if fontFamily is not None:
+        textFormat["fontFamily"] = str(fontFamily)
+    if fontSize is not None:
+        if not isinstance(fontSize, int):
+            raise TypeError("fontSize arg must be an int, not %s" % (type(fontSize).__name__))
+        textFormat["fontSize"] = fontSize
+    if foreground is not None:
+        textFormat["foregroundColor"] = _getTabColorArg(foreground)
+
+    cellFormat = {}
+    if textFormat:
+        cellFormat["textFormat"] = textFormat
+    if background is not None:
+        cellFormat["backgroundColor"] = _getTabColorArg(background)
+    if numberFormat is not None:
+        cellFormat["numberFormat"] = _getNumberFormatArg(numberFormat)
+    for name, value, choices in (
+        ("horizontalAlignment", horizontalAlignment, HORIZONTAL_ALIGNMENTS),
+        ("verticalAlignment", verticalAlignment, VERTICAL_ALIGNMENTS),
+        ("wrapStrategy", wrapStrategy, WRAP_STRATEGIES),
+    ):
+        if value is not None:
+            if str(value).upper() not in choices:
+                raise ValueError("%s must be one of %r, not %r" % (name, choices, value))
+            cellFormat[name] = str(value).upper()
+    return cellFormat
+
+
+def _getRepeatCellRequest(gridRange, cellFormat):
+    # Return the repeatCell request that applies `cellFormat` to `gridRange`, with a field mask of only the
+    # formatting in `cellFormat`.
+    fields = []
+    for name, value in cellFormat.items():
+        if name == "textFormat":
+            fields.extend(["userEnteredFormat.textFormat." + textName for textName in value])
+        else:
+            fields.append("userEnteredFormat." + name)
+    return {"repeatCell": {"range": gridRange, "cell": {"userEnteredFormat": cellFormat}, "fields": ",".join(fields)}}
+
+
+def _getNumberFormatArg(value):
+    # Return the NumberFormat dict for Sheet.format()'s numberFormat argument.
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        numberFormatType, pattern = value
+        if not isinstance(numberFormatType, str) or numberFormatType.upper() not in NUMBER_FORMAT_TYPES:
+            raise ValueError("numberFormat type must be one of %r, not %r" % (NUMBER_FORMAT_TYPES, numberFormatType))
+        return {"type": numberFormatType.upper(), "pattern": str(pattern)}
+    if not isinstance(value, str):
+        raise TypeError("numberFormat must be a str, (type, pattern) tuple, or dict, not %s" % (type(value).__name__))
+    if value.upper() in NUMBER_FORMAT_TYPES:
+        return {"type": value.upper()}
+    return {"type": _guessNumberFormatType(value), "pattern": value}
+
+
+def _guessNumberFormatType(pattern):
+    # Return the NumberFormat type (like 'DATE' or 'PERCENT') that a pattern str like 'yyyy-mm-dd' or
+    # '$#,##0.00' is for. Quoted text, backslash-escaped characters, and colors like [Red] are ignored.
+    pattern = re.sub(r'"[^"]*"|\\.|\[(black|blue|cyan|green|magenta|red|white|yellow|color\d+)\]', "", pattern.lower())
+    isDate = "y" in pattern or "d" in pattern
+    isTime = "h" in pattern or "s" in pattern or "am/pm" in pattern
+    if isDate and isTime:
+        return "DATE_TIME"
+    if isDate:
+        return "DATE"
+    if isTime:
+        return "TIME"
+    if "@" in pattern:
+        return "TEXT"
+    if "e+" in pattern or "e-" in pattern:
+        return "SCIENTIFIC"
+    if "%" in pattern:
+        return "PERCENT"
+    if any([symbol in pattern for symbol in "$\u20ac\u00a3\u00a5"]):
+        return "CURRENCY"
+    return "NUMBER"
+
+
+def _gridRangesOverlap(gridRange1, gridRange2):
+    return (
+        gridRange1["sheetId"] == gridRange2["sheetId"]
+        and gridRange1["startRowIndex"] < gridRange2["endRowIndex"]
+        and gridRange2["startRowIndex"] < gridRange1["endRowIndex"]
+        and gridRange1["startColumnIndex"] < gridRange2["endColumnIndex"]
+        and gridRange2["startColumnIndex"] < gridRange1["endColumnIndex"]
+    )
+
+
+def _getGridRangeUnion(gridRange1, gridRange2):
+    # Return the GridRange of exactly the cells in both GridRanges, or None if those cells aren't a rectangle.
+    if gridRange1["sheetId"] != gridRange2["sheetId"]:
+        return None
+    rows1 = (gridRange1["startRowIndex"], gridRange1["endRowIndex"])
+    rows2 = (gridRange2["startRowIndex"], gridRange2["endRowIndex"])
+    columns1 = (gridRange1["startColumnIndex"], gridRange1["endColumnIndex"])
+    columns2 = (gridRange2["startColumnIndex"], gridRange2["endColumnIndex"])
+
+    if rows1[0] <= rows2[0] and rows2[1] <= rows1[1] and columns1[0] <= columns2[0] and columns2[1] <= columns1[1]:
+        return gridRange1  # gridRange1 contains gridRange2.
+    if rows2[0] <= rows1[0] and rows1[1] <= rows2[1] and columns2[0] <= columns1[0] and columns1[1] <= columns2[1]:
+        return gridRange2  # gridRange2 contains gridRange1.
+    if columns1 == columns2 and rows1[0] <= rows2[1] and rows2[0] <= rows1[1]:
+        union = dict(gridRange1)
+        union["startRowIndex"], union["endRowIndex"] = min(rows1[0], rows2[0]), max(rows1[1], rows2[1])
+        return union
+    if rows1 == rows2 and columns1[0] <= columns2[1] and columns2[0] <= columns1[1]:
+        union = dict(gridRange1)
+        union["startColumnIndex"], union["endColumnIndex"] = min(columns1[0], columns2[0]), max(columns1[1], columns2[1])
+        return union
+    return None
+
+
+def _mergeFormatRequest(pending, gridRange, cellFormat):
+    # Add the (gridRange, cellFormat) pair to the `pending` list, merging it into an earlier pair for the same
+    # range, or for a range with the same format that forms a rectangle with gridRange. Pairs can only be
+    # merged past later pairs whose ranges don't overlap gridRange, so the formatting is applied in the same order.
+    for i in range(len(pending) - 1, -1, -1):
+        pendingRange, pendingFormat = pending[i]
+        if pendingRange == gridRange:
+            mergedFormat = dict(pendingFormat)
+            for name, value in cellFormat.items():
+                if name == "textFormat" and name in mergedFormat:
+                    mergedFormat[name] = dict(mergedFormat[name], **value)
+                else:
+                    mergedFormat[name] = value
+            pending[i] = (pendingRange, mergedFormat)
+            return
+        if pendingFormat == cellFormat:
+            union = _getGridRangeUnion(pendingRange, gridRange)
+            if union is not None:
+                pending[i] = (union, pendingFormat)
+                return
+        if _gridRangesOverlap(pendingRange, gridRange):
+            break
+    pending.append((gridRange, cellFormat))
+
+
+@functools.lru_cache(maxsize=65536)
+def convertToColumnRowInts(arg):
+    """convertToColumnRowInts('A1') => (1, 1), convertToColumnRowInts('AA10') => (27, 10)"""
+    if not isinstance(arg, str):
+        raise TypeError("argument must be a grid cell str, like 'A1', not of type %s" % (type(arg).__name__))
+    match = _CELL_ADDRESS_REGEX.fullmatch(arg)
+    if match is None:
+        raise ValueError("argument must be a grid cell str, like 'A1', not %r" % (arg))
+    return (getColumnNumberOf(match.group(1)), int(match.group(2)))
+
+
+_CELL_ADDRESS_REGEX = re.compile(r"([A-Za-z]+)([0-9]+)")
+
+
+def _getCachedValue(value, valueRenderOption="FORMATTED_VALUE"):
+    # Google Sheets seem to only store strings (TODO: verify this), but we can't
+    # do a simple str() call here because True and False are stored as 'TRUE' and 'FALSE'
+    # I don't want to have to do a refresh on each setting, so for the _cells cache
+    # I'll just hard code some known rules and we can hunt down the edge cases later.
+    if valueRenderOption != "FORMATTED_VALUE":
+        # Keep numbers and booleans native, the way an UNFORMATTED_VALUE refresh would return them.
+        if isinstance(value, str):
+            if value.upper() in ("TRUE", "FALSE"):
+                return value.upper() == "TRUE"
+            if _NUMBER_REGEX.match(value) is None:
+                return value
+            value = float(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, (bool, int, float)):
+            return value
+    if isinstance(value, bool):
+        return str(value).upper()
+    return str(value)
+
+
+def _getNumber(value):
+    # Return `value` as an int or float if it's a number or a string of a number, otherwise return None.
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and _NUMBER_REGEX.match(value) is not None:
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    return None
+
+
+def _aggregate(values, func):
+    # Apply the query() aggregate function `func` (a name like 'sum', or a function) to the list `values`.
+    if callable(func):
+        return func(values)
+    if func == "count":
+        return len([value for value in values if value != ""])
+    numbers = [number for number in map(_getNumber, values) if number is not None]
+    if func == "sum":
+        return sum(numbers)
+    if func == "mean":
+        return sum(numbers) / len(numbers) if numbers else None
+    if func == "min":
+        return min(numbers) if numbers else None
+    if func == "max":
+        return max(numbers) if numbers else None
+    raise ValueError("agg functions must be 'count', 'sum', 'mean', 'min', 'max', or a function, not %r" % (func,))
+
+
+def _getIndexKey(value):
+    # Return the key for `value` in a Sheet's value index. Since True == 1 and False == 0 in Python, the
+    # key includes whether the value is a bool so that these don't share a key.
+    return (isinstance(value, bool), value)
+
+
+_SERIAL_DATE_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def convertSerialDate(serialNumber, numberFormatType="DATE_TIME"):
+    """
+    Convert a Google Sheets serial number (the number of days since December 30, 1899, with the time
+    of day as the fraction) to a datetime object, or to a date or time object if numberFormatType is
+    'DATE' or 'TIME'. For example, 43831.5 is noon on January 1, 2020.
+    """
+    value = _SERIAL_DATE_EPOCH + datetime.timedelta(days=serialNumber)
+    if numberFormatType == "DATE":
+        return value.date()
+    if numberFormatType == "TIME":
+        return value.time()
+    return value
+
+
+def _decodeSerialDates(sheetData, formatTypes, isColumnMajor=False):
+    # Return a copy of the list of row (or column) lists `sheetData` with the serial numbers in the cells
+    # that `formatTypes` (a list of row lists of number format types) marks as dates converted by
+    # convertSerialDate(). Cells that aren't dates are copied over unchanged.
+    decodedData = []
+    for i, values in enumerate(sheetData):
+        decodedValues = list(values)
+        for j, value in enumerate(values):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            row, column = (j, i) if isColumnMajor else (i, j)
+            if row < len(formatTypes) and column < len(formatTypes[row]):
+                numberFormatType = formatTypes[row][column]
+                if numberFormatType in ("DATE", "TIME", "DATE_TIME"):
+                    decodedValues[j] = convertSerialDate(value, numberFormatType)
+        decodedData.append(decodedValues)
+    return decodedData
+
+
+_NUMBER_REGEX = re.compile(r"^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$")
+
+
+def _getExtendedValue(value):
+    # Convert a Python value into the ExtendedValue JSON that batchUpdate's updateCells request uses:
+    # https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/other#ExtendedValue
+    # This approximates how the USER_ENTERED value input option parses numbers, booleans, and formulas.
+    if value is None or value == "":
+        return {}  # An empty ExtendedValue clears the cell.
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, (int, float)):
+        return {"numberValue": value}
+
+    value = str(value)
+    if value.startswith("="):
+        return {"formulaValue": value}
+    if value.upper() in ("TRUE", "FALSE"):
+        return {"boolValue": value.upper() == "TRUE"}
+    if _NUMBER_REGEX.match(value):
+        return {"numberValue": float(value)}
+    return {"stringValue": value}
+
+
+def _getStoredValue(extendedValue):
+    # Return the Python value that Google Sheets stores for an ExtendedValue dict from _getExtendedValue(),
+    # the way an UNFORMATTED_VALUE refresh reads it (except that formulas are kept as formula strings).
+    if not extendedValue:
+        return ""
+    value = list(extendedValue.values())[0]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def createSpreadsheet(title="Untitled spreadsheet"):
+    if not IS_INITIALIZED:
+        init()  # Initialize this module if not done so already.
+    # request = SHEETS_SERVICE.spreadsheets().create(body={
     #    'properties': {'title': title}
     #    })
     # _logWriteRequest(); response = request.execute()
@@ -1673,6 +3801,17 @@ def getIdFromUrl(url):
     return spreadsheetId
 
 
+# Google Sheets allows up to 18,278 columns (A to ZZZ), so the letters for every possible column are
+# precomputed. _COLUMN_LETTERS[1] is 'A' and _COLUMN_NUMBERS['A'] is 1.
+MAX_COLUMN_COUNT = 18278
+_COLUMN_LETTERS = [""] + [
+    "".join(letters)
+    for length in (1, 2, 3)
+    for letters in itertools.product(string.ascii_uppercase, repeat=length)
+]
+_COLUMN_NUMBERS = {letters: number for number, letters in enumerate(_COLUMN_LETTERS) if number > 0}
+
+
 def getColumnLetterOf(columnNumber):
     """getColumnLetterOf(1) => 'A', getColumnLetterOf(27) => 'AA'"""
     if not isinstance(columnNumber, int):
@@ -1680,6 +3819,9 @@ def getColumnLetterOf(columnNumber):
     if columnNumber < 1:
         raise ValueError("columnNumber must be an int value of at least 1")
 
+    if columnNumber <= MAX_COLUMN_COUNT:
+        return _COLUMN_LETTERS[columnNumber]
+
     letters = []
     while columnNumber > 0:
         columnNumber, remainder = divmod(columnNumber, 26)
@@ -1698,18 +3840,14 @@ def getColumnNumberOf(columnLetter):
         raise ValueError("columnLetter must be composed of only letters")
 
     columnLetter = columnLetter.upper()
-    digits = []
-
-    while columnLetter:
-        digits.append(ord(columnLetter[0]) - 64)
-        columnLetter = columnLetter[1:]
+    try:
+        return _COLUMN_NUMBERS[columnLetter]
+    except KeyError:
+        pass  # The column is past ZZZ, so calculate the number.
 
     number = 0
-    place = 0
-    for digit in reversed(digits):
-        number += digit * (26**place)
-        place += 1
-
+    for letter in columnLetter:
+        number = number * 26 + (ord(letter) - 64)
     return number
 
 
@@ -1734,13 +3872,73 @@ def convertAddress(*address):
     raise TypeError('The address argument must be a singe string like "A1" or a tuple of two 1-based integers.')
 
 
+def convertAddresses(addresses):
+    """
+    Convert a list of addresses with convertAddress(). Strings like 'A2' are converted to (column, row)
+    tuples like (1, 2), and (column, row) pairs are converted to strings. `addresses` can be any iterable,
+    including a NumPy array of shape (n, 2).
+
+    convertAddresses(['A2', 'B1']) => [(1, 2), (2, 1)], convertAddresses([(1, 2), (2, 1)]) => ['A2', 'B1']
+    """
+    if hasattr(addresses, "tolist"):
+        addresses = addresses.tolist()  # Convert NumPy arrays (and their NumPy ints) to lists of Python ints.
+
+    converted = []
+    for address in addresses:
+        if isinstance(address, str):
+            converted.append(convertToColumnRowInts(address))
+        elif (
+            isinstance(address, (tuple, list))
+            and len(address) == 2
+            and isinstance(address[0], int)
+            and isinstance(address[1], int)
+            and 0 < address[0] <= MAX_COLUMN_COUNT
+            and address[1] > 0
+        ):
+            converted.append(_COLUMN_LETTERS[address[0]] + str(address[1]))
+        else:
+            converted.append(convertAddress(address))  # Let convertAddress() handle other cases and errors.
+    return converted
+
+
+@functools.lru_cache(maxsize=4096)
+def _convertToRangeInts(a1Range):
+    if not isinstance(a1Range, str):
+        raise TypeError("argument must be a range str, like 'A1:C3', not of type %s" % (type(a1Range).__name__))
+    a1Range = a1Range[a1Range.rfind("!") + 1 :]  # Remove the sheet title, if there is one.
+    if a1Range.count(":") > 1:
+        raise ValueError("argument must be a range str, like 'A1:C3', not %r" % (a1Range))
+    startCell, _, stopCell = a1Range.partition(":")
+    if stopCell == "":
+        stopCell = startCell  # A single cell like 'B2' is the range 'B2:B2'.
+    return convertToColumnRowInts(startCell) + convertToColumnRowInts(stopCell)
+
+
+def convertRange(*args):
+    """
+    Convert between a range str and a tuple of its 1-based (startColumn, startRow, stopColumn, stopRow)
+    coordinates, where the stop coordinates are inclusive. Any sheet title in the range str is ignored.
+
+    convertRange('A1:C3') => (1, 1, 3, 3), convertRange("'Sheet 1'!B2:C10") => (2, 2, 3, 10)
+    convertRange(1, 1, 3, 3) => 'A1:C3', convertRange((1, 1, 3, 3)) => 'A1:C3'
+    """
+    if len(args) == 1 and isinstance(args[0], str):
+        return _convertToRangeInts(args[0])
+
+    if len(args) == 1 and isinstance(args[0], (tuple, list)):
+        args = tuple(args[0])
+    if len(args) != 4 or not all([isinstance(arg, int) and arg > 0 for arg in args]):
+        raise TypeError("The range argument must be a single string like 'A1:C3' or four 1-based integers.")
+    return "%s%s:%s%s" % (getColumnLetterOf(args[0]), args[1], getColumnLetterOf(args[2]), args[3])
+
+
 def init(
     credentialsFile='.',
     sheetsTokenFile="token-sheets.pickle",
     driveTokenFile="token-drive.pickle",
     _raiseException=True,
 ):
-    global SHEETS_SERVICE, DRIVE_SERVICE, IS_INITIALIZED
+    global SHEETS_SERVICE, DRIVE_SERVICE, IS_INITIALIZED, _SHEETS_CREDENTIALS, _DRIVE_CREDENTIALS
 
     # Set this to False, in case module was initialized before but this current initialization fails.
     IS_INITIALIZED = False
@@ -1800,6 +3998,7 @@ def init(
                 pickle.dump(creds, token)
 
         SHEETS_SERVICE = build("sheets", "v4", credentials=creds)
+        _SHEETS_CREDENTIALS = creds
 
         # Log in to Google Drive API to generate token-drive.pickle.
         creds = None
@@ -1821,6 +4020,7 @@ def init(
                 pickle.dump(creds, token)
 
         DRIVE_SERVICE = build("drive", "v3", credentials=creds)
+        _DRIVE_CREDENTIALS = creds
 
         IS_INITIALIZED = True
         return IS_INITIALIZED
@@ -1859,40 +4059,220 @@ def listSpreadsheets():
     return spreadsheets
 
 
-def upload(filename):
+def getValuesMany(ranges, valueRenderOption="FORMATTED_VALUE"):
+    """
+    Get the values of many ranges, in the same or different spreadsheets, with multipart HTTP batch requests
+    that combine up to HTTP_BATCH_MAX_SIZE values.get requests each, instead of one round trip per range.
+    Each range still counts against the read quota.
+
+    :param ranges: An iterable of (spreadsheet, a1Range) tuples, where spreadsheet is an ID, URL, or
+        Spreadsheet object, and a1Range is a range str like 'Sheet1!A1:C10'.
+    :param valueRenderOption: One of VALUE_RENDER_OPTIONS.
+
+    Returns a list with a list of row lists for each range, in the same order, or the exception raised
+    while getting that range.
+    """
+    if not IS_INITIALIZED:
+        init()
+    if valueRenderOption not in VALUE_RENDER_OPTIONS:
+        raise ValueError("valueRenderOption must be one of %r, not %r" % (VALUE_RENDER_OPTIONS, valueRenderOption))
+
+    requests = []
+    for spreadsheet, a1Range in ranges:
+        if isinstance(spreadsheet, Spreadsheet):
+            spreadsheetId = spreadsheet._spreadsheetId  # Don't load a lazy Spreadsheet object.
+        else:
+            spreadsheetId = getIdFromUrl(spreadsheet)
+        requests.append(
+            ("values.get", {"spreadsheetId": spreadsheetId, "range": a1Range, "valueRenderOption": valueRenderOption})
+        )
+    return [
+        response if isinstance(response, Exception) else response.get("values", [])
+        for response in _makeBatchRequest(requests)
+    ]
+
+
+def getMetadataMany(spreadsheetIds, fields="id, name, modifiedTime"):
+    """
+    Get the Google Drive metadata of many spreadsheets with multipart HTTP batch requests that combine up
+    to HTTP_BATCH_MAX_SIZE files.get requests each, instead of one round trip per spreadsheet. Each
+    spreadsheet still counts against the read quota.
+
+    :param spreadsheetIds: An iterable of spreadsheet IDs or URLs.
+    :param fields: The Drive file fields to get, like 'id, name, modifiedTime, owners'.
+
+    Returns a dict with the spreadsheet IDs as keys. The values are dicts of the metadata fields, or the
+    exception raised while getting that spreadsheet's metadata.
+    """
+    if not IS_INITIALIZED:
+        init()
+
+    spreadsheetIds = [getIdFromUrl(spreadsheetId) for spreadsheetId in spreadsheetIds]
+    responses = _makeBatchRequest(
+        [("drive.get", {"fileId": spreadsheetId, "fields": fields}) for spreadsheetId in spreadsheetIds]
+    )
+    return dict(zip(spreadsheetIds, responses))
+
+
+def exportMany(spreadsheetIds, fileType="xlsx", outDir=".", workers=4, manifest=None, chunkSize=None):
+    """
+    Export many spreadsheets from Google Drive at once, without the requests that creating Spreadsheet
+    objects makes. Each spreadsheet is saved in the `outDir` folder as its ID followed by the `fileType`
+    extension, e.g. '1lRyPHuaLIgqYwkCTJYexbZUO1dcWeunm69B0L7L4ZQ8.xlsx'. Up to `workers` downloads run at
+    the same time, and they all share the read quota.
+
+    :param spreadsheetIds: An iterable of spreadsheet IDs or URLs.
+    :param manifest: The filename of a JSON file that records the finished exports. Spreadsheets already in
+        the manifest (whose file still exists) are skipped, so an interrupted exportMany() call can be
+        resumed by calling it again with the same manifest.
+
+    Returns a dict with the spreadsheet IDs as keys. The values are the filenames of the exported files,
+    or the exception raised while exporting that spreadsheet.
+    """
+    if not IS_INITIALIZED:
+        init()
+    if fileType not in _FILE_TYPES:
+        raise ValueError("fileType must be one of %r, not %r" % (tuple(_FILE_TYPES), fileType))
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive int, not %r" % (workers,))
+
+    spreadsheetIds = [getIdFromUrl(spreadsheetId) for spreadsheetId in spreadsheetIds]
+    os.makedirs(outDir, exist_ok=True)
+
+    finished = {}
+    if manifest is not None and os.path.exists(manifest):
+        with open(manifest, encoding="utf-8") as fileObj:
+            finished = json.load(fileObj)
+    manifestLock = threading.Lock()
+
+    def exportOne(spreadsheetId):
+        filename = os.path.join(outDir, spreadsheetId + "." + fileType)
+        if finished.get(spreadsheetId) == filename and os.path.exists(filename):
+            return filename  # This spreadsheet was exported by an earlier call.
+
+        try:
+            # Write to a temporary file so that an interrupted download never looks finished:
+            with open(filename + ".part", "wb") as fileObj:
+                for chunk in _iterExport(spreadsheetId, fileType, chunkSize):
+                    fileObj.write(chunk)
+            os.replace(filename + ".part", filename)
+        except Exception as exc:
+            if os.path.exists(filename + ".part"):
+                os.remove(filename + ".part")
+            return exc
+
+        if manifest is not None:
+            with manifestLock:
+                finished[spreadsheetId] = filename
+                with open(manifest + ".part", "w", encoding="utf-8") as fileObj:
+                    json.dump(finished, fileObj, indent=2)
+                os.replace(manifest + ".part", manifest)
+        return filename
+
+    results = _runInThreads(exportOne, [(spreadsheetId,) for spreadsheetId in spreadsheetIds], workers)
+    return dict(zip(spreadsheetIds, results))
+
+
+def upload(filename, name=None, lazy=True, chunkSize=None, progressCallback=None, folderId=None):
+    """
+    Upload a .xlsx, .ods, .csv, or .tsv file to Google Drive as a new Google Sheets spreadsheet, and
+    return a Spreadsheet object for it.
+
+    :param filename: The filename of the file to upload, or a binary file-like object or bytes object with
+        its contents.
+    :param name: The name of the file on Google Drive. This is required for bytes and for file-like objects
+        without a `name` attribute, as its extension determines the file type. Defaults to the filename.
+    :param lazy: If True, the returned Spreadsheet object doesn't download the uploaded data until one of
+        its attributes is first used.
+    :param chunkSize: The file is sent in resumable chunks of this many bytes, each retried up to
+        UPLOAD_NUM_RETRIES times. Defaults to UPLOAD_CHUNK_SIZE.
+    :param progressCallback: If given, this is called with the number of bytes uploaded so far and the total
+        size in bytes after each chunk.
+    :param folderId: The ID of the Google Drive folder to put the spreadsheet in. Defaults to the top folder.
+    """
     if not IS_INITIALIZED:
         init()
-    # TODO - be able to pass a file object for `filename`, not just a string name of a file on the hard drive.
-
-    if filename.lower().endswith(".xlsx"):
-        mimeType = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    elif filename.lower().endswith(".ods"):
-        mimeType = "application/x-vnd.oasis.opendocument.spreadsheet"
-    elif filename.lower().endswith(".csv"):
-        mimeType = "text/csv"
-    elif filename.lower().endswith(".tsv"):
-        mimeType = "text/tab-separated-values"
+    if chunkSize is None:
+        chunkSize = UPLOAD_CHUNK_SIZE
+
+    if isinstance(filename, (bytes, bytearray)):
+        fileObj = io.BytesIO(filename)
+    elif hasattr(filename, "read"):
+        fileObj = filename
+        if name is None and isinstance(getattr(filename, "name", None), str):
+            name = os.path.basename(filename.name)
     else:
+        fileObj = None
+        if name is None:
+            name = os.path.basename(filename)
+    if name is None:
+        raise ValueError("The name argument is required when uploading bytes or file-like objects.")
+
+    mimeType = _UPLOAD_MIME_TYPES.get(os.path.splitext(name)[1].lower())
+    if mimeType is None:
         raise ValueError(
             "File to upload must be a .xlsx (Excel), .ods (OpenOffice), .csv (Comma-separated), or .tsv (Tab-separated) file type."
         )
 
-    if not os.path.exists(filename):
-        raise FileNotFoundError("Unable to find a file named %s" % (os.path.abspath(filename)))
+    if fileObj is None:
+        if not os.path.exists(filename):
+            raise FileNotFoundError("Unable to find a file named %s" % (os.path.abspath(filename)))
+        media = MediaFileUpload(filename, mimetype=mimeType, chunksize=chunkSize, resumable=True)
+    else:
+        media = MediaIoBaseUpload(fileObj, mimetype=mimeType, chunksize=chunkSize, resumable=True)
 
-    media = MediaFileUpload(filename, mimetype=mimeType)
     # file = DRIVE_SERVICE.files().create(body={'name': filename, 'mimeType': 'application/vnd.google-apps.spreadsheet'},
     #                                    media_body=media,
     #                                    fields='id').execute()
-    file = _makeRequest(
-        "drive.create",
-        **{
-            "body": {"name": os.path.basename(filename), "mimeType": "application/vnd.google-apps.spreadsheet"},
-            "media_body": media,
-            "fields": "id",
-        }
-    )
-    return Spreadsheet(file.get("id"))
+    body = {"name": name, "mimeType": "application/vnd.google-apps.spreadsheet"}
+    if folderId is not None:
+        body["parents"] = [folderId]
+    request = DRIVE_SERVICE.files().create(body=body, media_body=media, fields="id")
+    _logWriteRequest()
+    file = None
+    while file is None:
+        status, file = _makeMediaRequest(
+            lambda: request.next_chunk(http=_getThreadHttp(isDrive=True), num_retries=UPLOAD_NUM_RETRIES),
+            _logWriteRequest,
+        )
+        if progressCallback is not None and status is not None:
+            progressCallback(status.resumable_progress, status.total_size)
+    if progressCallback is not None:
+        progressCallback(media.size(), media.size())
+    return Spreadsheet(file.get("id"), lazy=lazy)
+
+
+def uploadMany(filenames, workers=4, folderId=None, progressCallback=None):
+    """
+    Upload many .xlsx, .ods, .csv, or .tsv files as new Google Sheets spreadsheets at once. Up to `workers`
+    resumable uploads run at the same time, and they all share the write quota. The uploaded spreadsheets
+    aren't downloaded.
+
+    :param folderId: The ID of the Google Drive folder to put the spreadsheets in.
+    :param progressCallback: If given, this is called with the filename, the number of bytes uploaded so far,
+        and the total size in bytes after each chunk of each file.
+
+    Returns a dict with the filenames as keys. The values are the IDs of the new spreadsheets, or the
+    exception raised while uploading that file.
+    """
+    if not IS_INITIALIZED:
+        init()
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive int, not %r" % (workers,))
+    filenames = list(filenames)
+
+    def uploadOne(filename):
+        if progressCallback is None:
+            fileProgressCallback = None
+        else:
+            fileProgressCallback = lambda uploaded, total: progressCallback(filename, uploaded, total)
+        try:
+            return upload(filename, lazy=True, progressCallback=fileProgressCallback, folderId=folderId).id
+        except Exception as exc:
+            return exc
+
+    results = _runInThreads(uploadOne, [(filename,) for filename in filenames], workers)
+    return dict(zip(filenames, results))
 
 
 init(_raiseException=False)
@@ -1,6 +1,11 @@
 from __future__ import division, print_function
+import datetime
+import io
+import os
 import random
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
 import ezsheets
 
 #now = time.time()
@@ -56,6 +61,8 @@ def test_getColumnLetterOf():
     assert ezsheets.getColumnLetterOf(26) == 'Z'
     assert ezsheets.getColumnLetterOf(27) == 'AA'
     assert ezsheets.getColumnLetterOf(702) == 'ZZ'
+    assert ezsheets.getColumnLetterOf(18278) == 'ZZZ'
+    assert ezsheets.getColumnLetterOf(18279) == 'AAAA'
 
     with pytest.raises(TypeError):
         ezsheets.getColumnLetterOf('invalid arg')
@@ -72,6 +79,9 @@ def test_getColumnNumberOf():
     assert ezsheets.getColumnNumberOf('Z') == 26
     assert ezsheets.getColumnNumberOf('AA') == 27
     assert ezsheets.getColumnNumberOf('ZZ') == 702
+    assert ezsheets.getColumnNumberOf('zz') == 702
+    assert ezsheets.getColumnNumberOf('ZZZ') == 18278
+    assert ezsheets.getColumnNumberOf('AAAA') == 18279
 
     with pytest.raises(TypeError):
         ezsheets.getColumnNumberOf(1)
@@ -81,7 +91,7 @@ def test_getColumnNumberOf():
 
 
 def test_columnNumberLetterTranslation():
-    for i in range(1, 5000):
+    for i in range(1, 20000):
         assert ezsheets.getColumnNumberOf(ezsheets.getColumnLetterOf(i)) == i
 
 
@@ -121,6 +131,132 @@ def test__getTabColorArg():
         ezsheets._getTabColorArg('invalid value')
 
 
+def test__mergeFormatRequest():
+    def gridRange(startColumn, startRow, stopColumn, stopRow, sheetId=0):
+        return {'sheetId': sheetId, 'startRowIndex': startRow - 1, 'endRowIndex': stopRow,
+                'startColumnIndex': startColumn - 1, 'endColumnIndex': stopColumn}
+    BOLD = {'textFormat': {'bold': True}}
+
+    pending = []
+    for row in range(1, 11):  # Formatting row by row makes a single request.
+        ezsheets._mergeFormatRequest(pending, gridRange(1, row, 4, row), BOLD)
+    assert pending == [(gridRange(1, 1, 4, 10), BOLD)]
+    ezsheets._mergeFormatRequest(pending, gridRange(2, 2, 3, 3), BOLD)  # Already covered.
+    ezsheets._mergeFormatRequest(pending, gridRange(1, 1, 4, 10), {'textFormat': {'italic': True}, 'wrapStrategy': 'WRAP'})
+    assert pending == [(gridRange(1, 1, 4, 10), {'textFormat': {'bold': True, 'italic': True}, 'wrapStrategy': 'WRAP'})]
+
+    # Formatting isn't merged past an overlapping range, so it's still applied in the same order:
+    ezsheets._mergeFormatRequest(pending, gridRange(1, 1, 1, 1), {'textFormat': {'bold': False}})
+    ezsheets._mergeFormatRequest(pending, gridRange(1, 1, 4, 10), {'horizontalAlignment': 'CENTER'})
+    assert len(pending) == 3
+
+    # Ranges on other sheets don't overlap:
+    ezsheets._mergeFormatRequest(pending, gridRange(1, 1, 4, 10, sheetId=1), BOLD)
+    ezsheets._mergeFormatRequest(pending, gridRange(1, 1, 4, 10), {'horizontalAlignment': 'RIGHT'})
+    assert len(pending) == 4
+    assert pending[2] == (gridRange(1, 1, 4, 10), {'horizontalAlignment': 'RIGHT'})
+
+
+def test__isQuotaError():
+    assert ezsheets._isQuotaError(HttpError(httplib2.Response({'status': 429}), b'{"error": {"status": "RESOURCE_EXHAUSTED"}}'))
+    assert not ezsheets._isQuotaError(HttpError(httplib2.Response({'status': 404}), b'{"error": {"status": "NOT_FOUND"}}'))
+    assert not ezsheets._isQuotaError(HttpError(httplib2.Response({'status': 502}), b'<html>Bad Gateway</html>'))
+    assert not ezsheets._isQuotaError(KeyError('not an HttpError'))
+
+
+class _StubRequest:
+    # Stands in for a googleapiclient request object in test__makeBatchRequest().
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class _StubBatch:
+    # Stands in for googleapiclient's BatchHttpRequest. Sub-requests for the 'quota' range fail with a
+    # quota error the first time, and sub-requests for the 'missing' spreadsheet fail with a 404.
+    def __init__(self, batchSizes, quotaFailures):
+        self.batchSizes = batchSizes
+        self.quotaFailures = quotaFailures
+        self.items = []
+
+    def add(self, request, callback, request_id):
+        self.items.append((request, callback, request_id))
+
+    def execute(self, http=None):
+        self.batchSizes.append(len(self.items))
+        for request, callback, requestId in self.items:
+            kwargs = request.kwargs
+            if kwargs.get('range') == 'quota' and self.quotaFailures[0] > 0:
+                self.quotaFailures[0] -= 1
+                callback(requestId, None, HttpError(httplib2.Response({'status': 429}), b'{"error": {"status": "RESOURCE_EXHAUSTED"}}'))
+            elif 'missing' in (kwargs.get('spreadsheetId'), kwargs.get('fileId')):
+                callback(requestId, None, HttpError(httplib2.Response({'status': 404}), b'{"error": {"status": "NOT_FOUND"}}'))
+            elif 'fileId' in kwargs:
+                callback(requestId, {'id': kwargs['fileId'], 'name': 'Title of ' + kwargs['fileId']}, None)
+            else:
+                callback(requestId, {'values': [[kwargs['spreadsheetId'], kwargs['range']]]}, None)
+
+
+class _StubService:
+    # Stands in for the Sheets and Drive service objects in test__makeBatchRequest().
+    def __init__(self, batchSizes, quotaFailures):
+        self.batchSizes = batchSizes
+        self.quotaFailures = quotaFailures
+
+    def new_batch_http_request(self):
+        return _StubBatch(self.batchSizes, self.quotaFailures)
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def files(self):
+        return self
+
+    def get(self, **kwargs):
+        return _StubRequest(**kwargs)
+
+
+def test_upsertRows_blankKey():
+    sheet = object.__new__(ezsheets.Sheet)  # The rows are checked before the Sheet object is used.
+    with pytest.raises(ValueError):
+        sheet.upsertRows([['', 'x'], ['', 'y']])  # These rows would otherwise both be written over one new row.
+    with pytest.raises(ValueError):
+        sheet.upsertRows([['a', 'x'], [None, 'y']])
+    with pytest.raises(ValueError):
+        sheet.upsertRows([['x']], key='B')
+
+
+def test__makeBatchRequest(monkeypatch):
+    batchSizes = []
+    quotaFailures = [1]
+    service = _StubService(batchSizes, quotaFailures)
+    monkeypatch.setattr(ezsheets, 'SHEETS_SERVICE', service)
+    monkeypatch.setattr(ezsheets, 'DRIVE_SERVICE', service)
+    monkeypatch.setattr(ezsheets, 'IS_INITIALIZED', True)
+    monkeypatch.setattr(ezsheets, 'IGNORE_QUOTA', True)
+    monkeypatch.setattr(ezsheets, 'HTTP_BATCH_MAX_SIZE', 2)
+    monkeypatch.setattr(ezsheets.time, 'sleep', lambda seconds: None)
+
+    # Five values.get requests are split into batches of two, and the one that hit the quota is retried:
+    readCount = len(ezsheets._READ_REQUESTS)
+    results = ezsheets.getValuesMany([('ss1', 'A1'), ('ss2', 'quota'), ('missing', 'A1'), ('ss3', 'B2'), ('ss4', 'C3')])
+    assert batchSizes == [2, 2, 1, 1]
+    assert len(ezsheets._READ_REQUESTS) - readCount == 6  # Each sub-request, including the retry, is logged.
+    assert results[0] == [['ss1', 'A1']]
+    assert results[1] == [['ss2', 'quota']]
+    assert isinstance(results[2], HttpError)  # A failed sub-request doesn't stop the others.
+    assert results[3:] == [[['ss3', 'B2']], [['ss4', 'C3']]]
+
+    # Drive metadata requests are sent in their own batches:
+    del batchSizes[:]
+    metadata = ezsheets.getMetadataMany(['ss1', 'missing', 'ss2'])
+    assert batchSizes == [2, 1]
+    assert metadata['ss1'] == {'id': 'ss1', 'name': 'Title of ss1'}
+    assert isinstance(metadata['missing'], HttpError)
+
+
 @pytest.fixture(scope='module')
 def init():
     global TEST_SS
@@ -172,6 +308,23 @@ def test_createSheet_deleteSheet(init, checkPreAndPostCondition):
     newSheet2.delete()
 
 
+def test_createSheets_deleteSheets(init, checkPreAndPostCondition):
+    newSheets = TEST_SS.createSheets(['New Sheet 1', {'title': 'New Sheet 2', 'index': 0, 'columnCount': 3, 'rowCount': 4}])
+    assert [sheet.title for sheet in newSheets] == ['New Sheet 1', 'New Sheet 2']
+    assert TEST_SS.sheetTitles == ('New Sheet 2', 'Sheet1', 'New Sheet 1')
+    assert (newSheets[1].columnCount, newSheets[1].rowCount) == (3, 4)
+    assert TEST_SS[1].index == 1  # The existing sheets' properties are updated too.
+    assert newSheets[0].getRows(trim=True) == []
+
+    TEST_SS.deleteSheets([newSheets[1], 'New Sheet 1'])
+    assert TEST_SS.sheetTitles == ('Sheet1',)
+    assert TEST_SS[0].index == 0
+
+    with pytest.raises(ValueError):
+        TEST_SS.deleteSheets(['Sheet1'])
+    assert TEST_SS.createSheets([]) == []
+
+
 def test_getitem_delitem(init, checkPreAndPostCondition):
     assert TEST_SS['Sheet1'].title == 'Sheet1'
 
@@ -311,6 +464,19 @@ def test_changeSheetIndex(init, checkPreAndPostCondition):
     newSheet2.delete()
 
 
+def test_copyTo(init, checkPreAndPostCondition):
+    TEST_SS[0].updateRow(1, ['copied', 'data'])
+    copiedSheet = TEST_SS[0].copyTo(TEST_SS)
+    assert TEST_SS.sheets[1] is copiedSheet
+    assert copiedSheet.title == 'Copy of Sheet1'
+    assert copiedSheet.index == 1
+    assert copiedSheet.getRow(1)[:2] == ['copied', 'data']
+
+    copiedSheet.delete()
+    assert TEST_SS.sheetTitles == ('Sheet1',)
+    TEST_SS[0].clear()
+
+
 def test_iter(init, checkPreAndPostCondition):
     TEST_SS.createSheet(title='New Sheet 1')
     TEST_SS.createSheet(title='New Sheet 2')
@@ -378,6 +544,155 @@ def test_eq(init, checkPreAndPostCondition):
     assert TEST_SS[0] != 'some misc value'
 
 
+def test_download(init, checkPreAndPostCondition, tmp_path):
+    chunks = list(TEST_SS.iterDownload('csv', chunkSize=256 * 1024))
+    assert len(chunks) > 0
+
+    fileObj = io.BytesIO()
+    progress = []
+    assert TEST_SS.downloadAsCSV(fileObj, progressCallback=lambda downloaded, total: progress.append(downloaded)) is fileObj
+    assert fileObj.getvalue() == b''.join(chunks)
+    assert progress[-1] == len(fileObj.getvalue())
+
+    filename = TEST_SS.downloadAsCSV(str(tmp_path / 'test.csv'))
+    with open(filename, 'rb') as fileObj:
+        assert fileObj.read() == b''.join(chunks)
+
+    with pytest.raises(ValueError):
+        list(TEST_SS.iterDownload('invalid'))
+
+
+def test_exportAllSheets(init, checkPreAndPostCondition, tmp_path):
+    newSheet1 = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    newSheet2 = TEST_SS.createSheet(title='New Sheet 2', columnCount=3, rowCount=3)
+    newSheet1.updateRows([['a', 'b,c'], ['1', '2']], bounded=True)
+    newSheet2.updateRows([['x'], ['', 'y']], bounded=True)
+
+    assert newSheet2.downloadAsCSV(str(tmp_path / 'sheet2.csv')) == str(tmp_path / 'sheet2.csv')
+    with open(str(tmp_path / 'sheet2.csv'), encoding='utf-8') as fileObj:
+        assert fileObj.read() == 'x\n,y\n'
+
+    filenames = TEST_SS.exportAllSheets('tsv', str(tmp_path), workers=2)
+    assert [os.path.basename(filename) for filename in filenames] == ['Sheet1.tsv', 'New_Sheet_1.tsv', 'New_Sheet_2.tsv']
+    with open(filenames[1], encoding='utf-8') as fileObj:
+        assert fileObj.read() == 'a\tb,c\n1\t2\n'
+
+    with pytest.raises(ValueError):
+        TEST_SS.exportAllSheets('pdf', str(tmp_path))
+
+    newSheet1.delete()
+    newSheet2.delete()
+
+
+def test_exportMany(init, checkPreAndPostCondition, tmp_path):
+    manifest = str(tmp_path / 'manifest.json')
+    results = ezsheets.exportMany([TEST_SS.id, 'doesNotExist'], 'csv', str(tmp_path), workers=2, manifest=manifest)
+    assert results[TEST_SS.id] == os.path.join(str(tmp_path), TEST_SS.id + '.csv')
+    assert isinstance(results['doesNotExist'], Exception)
+    with open(results[TEST_SS.id], 'rb') as fileObj:
+        assert fileObj.read() == b''.join(TEST_SS.iterDownload('csv'))
+
+    # Finished exports in the manifest are skipped when resuming:
+    os.utime(results[TEST_SS.id], (0, 0))
+    assert ezsheets.exportMany([TEST_SS.id], 'csv', str(tmp_path), manifest=manifest) == {TEST_SS.id: results[TEST_SS.id]}
+    assert os.path.getmtime(results[TEST_SS.id]) == 0
+
+
+def test_upload(init, tmp_path):
+    uploaded = ezsheets.upload(b'a,b\r\n1,2\r\n', name='Delete Me Upload.csv')
+    assert uploaded.title == 'Delete Me Upload.csv'  # Using an attribute loads the lazy Spreadsheet object.
+    uploaded.delete(permanent=True)
+
+    lazySS = ezsheets.Spreadsheet(uploaded.id, lazy=True)
+    for i in range(2):
+        with pytest.raises(Exception):
+            lazySS.sheets  # The spreadsheet was deleted, so loading fails each time it's tried.
+
+    uploaded = ezsheets.upload(io.BytesIO(b'a,b\r\n'), name='Delete Me Upload.csv', lazy=False)
+    assert len(uploaded) == 1
+    uploaded.delete(permanent=True)
+
+    with pytest.raises(ValueError):
+        ezsheets.upload(b'a,b\r\n')  # The name argument is required for bytes.
+    with pytest.raises(ValueError):
+        ezsheets.upload(b'a,b\r\n', name='upload.txt')
+    with pytest.raises(FileNotFoundError):
+        ezsheets.upload(str(tmp_path / 'doesNotExist.csv'))
+
+
+def test_uploadMany(init, tmp_path):
+    filenames = []
+    for i in range(3):
+        filenames.append(str(tmp_path / ('Delete Me Upload %s.csv' % (i))))
+        with open(filenames[-1], 'w') as fileObj:
+            fileObj.write('a,b\n%s,%s\n' % (i, i))
+    filenames.append(str(tmp_path / 'doesNotExist.csv'))
+
+    progress = []
+    results = ezsheets.uploadMany(filenames, workers=2, progressCallback=lambda filename, uploaded, total: progress.append(filename))
+    assert isinstance(results[filenames[-1]], FileNotFoundError)
+    assert set(progress) == set(filenames[:3])
+    for filename in filenames[:3]:
+        uploaded = ezsheets.Spreadsheet(results[filename])
+        assert uploaded.title == os.path.basename(filename)
+        uploaded.delete(permanent=True)
+
+
+def test_Session(init, checkPreAndPostCondition):
+    otherSS = ezsheets.createSpreadsheet(title='Delete Me Session')
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    deletedSheet = TEST_SS.createSheet(title='New Sheet 2')
+    deletedSheet.delete()
+
+    with ezsheets.Session(workers=2) as session:
+        for sheet in (newSheet, otherSS[0]):
+            session.update(sheet, 'A1', [['Summary', 42], ['Total', 84.0]])
+            session.update(sheet, (2, 5), 'enlarged')
+            session.format(sheet, 'A1:B1', bold=True, background='light yellow')
+        session.batchUpdate(TEST_SS, {'updateSheetProperties': {'properties': {'sheetId': newSheet.id, 'gridProperties': {'hideGridlines': True}},
+                                                                'fields': 'gridProperties.hideGridlines'}})
+        session.update(deletedSheet, 'A1', 'fails')
+        assert len(session) == 8
+    results = session.results
+    assert [result.operation for result in results] == ['update', 'update', 'format', 'update', 'update', 'format', 'batchUpdate', 'update']
+
+    # The update to the deleted sheet made all of TEST_SS's changes fail, but not otherSS's:
+    assert [result.error is None for result in results] == [False, False, False, True, True, True, False, False]
+    assert results[3].spreadsheetId == otherSS.id
+    assert newSheet.get('A1') == '' and newSheet.rowCount == 3
+    assert otherSS[0].getRow(1)[:2] == ['Summary', '42']
+    assert otherSS[0].get('B5') == 'enlarged'
+    otherSS[0].refresh()
+    assert otherSS[0].getRow(2)[:2] == ['Total', '84']
+
+    with pytest.raises(ZeroDivisionError):
+        with ezsheets.Session() as session:
+            session.update(newSheet, 'A1', 'not sent')
+            1 / 0
+    assert session.results is None
+    newSheet.refresh()
+    assert newSheet.get('A1') == ''
+
+    # Both spreadsheets' batchUpdate requests are sent in one multipart HTTP request:
+    with ezsheets.Session(httpBatch=True) as session:
+        session.update(newSheet, 'A1', 'batched')
+        session.update(otherSS[0], 'A1', 'batched')
+    assert [result.error for result in session.results] == [None, None]
+    newSheet.refresh()
+    assert newSheet.get('A1') == otherSS[0].get('A1') == 'batched'
+
+    # commit() also sets `results`, and the cached values match what the sheet stores:
+    session = ezsheets.Session()
+    session.update(newSheet, 'A2', [['007', 'true', '1.50']])
+    assert session.commit() == session.results
+    assert newSheet.getRow(2)[:3] == ['7', 'TRUE', '1.5']
+    newSheet.refresh()
+    assert newSheet.getRow(2)[:3] == ['7', 'TRUE', '1.5']
+
+    newSheet.delete()
+    otherSS.delete(permanent=True)
+
+
 def test_sheet_attrs(init, checkPreAndPostCondition):
     sheet1 = TEST_SS[0]
     assert sheet1.rowCount == 1000
@@ -514,6 +829,372 @@ def test_updateColumns(init, checkPreAndPostCondition):
     newSheet.delete()
 
 
+def test_updateRows_updateColumns_bounded(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=4, rowCount=5)
+    newSheet.updateRows([['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i'], ['j', 'k', 'l']])
+
+    # A bounded update only changes the cells covered by the given rows:
+    rows = [['x', 'y'], ['z']]
+    newSheet.updateRows(rows, startRow=2, bounded=True)
+    assert rows == [['x', 'y'], ['z']] # The rows arg isn't modified.
+    assert newSheet.getRows() == [['a', 'b', 'c', ''], ['x', 'y', 'f', ''], ['z', '', 'i', ''], ['j', 'k', 'l', ''], ['', '', '', '']]
+    newSheet.refresh()
+    assert newSheet.getRows() == [['a', 'b', 'c', ''], ['x', 'y', 'f', ''], ['z', '', 'i', ''], ['j', 'k', 'l', ''], ['', '', '', '']]
+
+    # clearBelow clears the rows after the given rows:
+    newSheet.updateRows([['q']], startRow=2, clearBelow=True)
+    assert newSheet.getRows() == [['a', 'b', 'c', ''], ['q', 'y', 'f', ''], ['', '', '', ''], ['', '', '', ''], ['', '', '', '']]
+    newSheet.refresh()
+    assert newSheet.getRows() == [['a', 'b', 'c', ''], ['q', 'y', 'f', ''], ['', '', '', ''], ['', '', '', ''], ['', '', '', '']]
+
+    # clearRight clears the columns after the given columns:
+    newSheet.updateColumns([['1', '2']], startColumn=2, clearRight=True)
+    assert newSheet.getColumns() == [['a', 'q', '', '', ''], ['1', '2', '', '', ''], ['', '', '', '', ''], ['', '', '', '', '']]
+    newSheet.refresh()
+    assert newSheet.getColumns() == [['a', 'q', '', '', ''], ['1', '2', '', '', ''], ['', '', '', '', ''], ['', '', '', '', '']]
+
+    # A bounded update past the end of the sheet enlarges the sheet:
+    newSheet.updateRows([['r']], startRow=7, bounded=True)
+    assert newSheet.rowCount == 7
+    assert newSheet.get('A7') == 'r'
+
+    newSheet.delete()
+
+
+def test_appendRows(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    newSheet.updateRows([['a', 'b'], ['c', 'd']], bounded=True)
+
+    newSheet.appendRows([['e', 'f'], ['g', 'h', 'i', 'j']])
+    assert newSheet.rowCount == 5
+    assert newSheet.columnCount == 4
+    assert newSheet.getColumn(1) == ['a', 'c', 'e', 'g', '']
+    newSheet.refresh()
+    assert newSheet.getColumn(1) == ['a', 'c', 'e', 'g', '']
+
+    # Buffered rows aren't sent until the buffer is flushed:
+    newSheet.appendRows([['k']], buffered=True)
+    assert newSheet.rowCount == 5
+    newSheet.flushAppends()
+    assert newSheet.rowCount == 6
+    assert newSheet.getColumn(1) == ['a', 'c', 'e', 'g', 'k', '']
+
+    # A bufferedAppends() block sends the buffered rows when it ends:
+    with newSheet.bufferedAppends():
+        newSheet.appendRows([['l']], buffered=True)
+        assert newSheet.rowCount == 6
+    assert newSheet.rowCount == 7
+
+    # Rows still buffered when the program exits are sent by the atexit handler:
+    newSheet.appendRows([['m']], buffered=True)
+    assert id(newSheet) in ezsheets._BUFFERED_APPEND_SHEETS
+    ezsheets._flushBufferedAppends()
+    assert newSheet.rowCount == 8
+    assert id(newSheet) not in ezsheets._BUFFERED_APPEND_SHEETS
+
+    with pytest.raises(TypeError):
+        newSheet.appendRows('not a list or tuple')
+    with pytest.raises(TypeError):
+        newSheet.appendRows(['inner value not a list or tuple'])
+
+    newSheet.delete()
+
+    # Buffered rows are kept if sending them fails:
+    newSheet.appendRows([['l', 'm']], buffered=True)
+    with pytest.raises(Exception):
+        newSheet.flushAppends()  # The sheet was deleted, so this request fails.
+    assert newSheet._appendBuffer == [['l', 'm']]
+    newSheet._appendBuffer = []  # Don't try sending them again at exit.
+
+
+def test_toNumpy_toDataFrame(init, checkPreAndPostCondition):
+    pandas = pytest.importorskip('pandas')
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=5, rowCount=6)
+    newSheet.updateRows([['name', 'count'], ['a', '1'], ['b', ''], ['c', '3', 'x']], bounded=True)
+
+    array = newSheet.toNumpy()
+    assert array.shape == (4, 3)  # Trailing empty rows and columns are trimmed.
+    assert array.tolist()[2] == ['b', '', '']
+
+    dataFrame = newSheet.toDataFrame()
+    assert list(dataFrame.columns) == ['name', 'count', '']
+    assert dataFrame['name'].tolist() == ['a', 'b', 'c']
+    assert dataFrame['count'].isna().tolist() == [False, True, False]
+    with pytest.raises(ValueError):
+        newSheet.toDataFrame(header=0)
+
+    dataFrame = pandas.DataFrame({'x': [1, 2], 'y': [1.5, float('nan')], 'z': [True, False]})
+    newSheet.updateFromDataFrame(dataFrame, clearBelow=True)
+    assert newSheet.getRows(stopRow=5) == [['x', 'y', 'z', '', ''], ['1', '1.5', 'TRUE', '', ''], ['2', '', 'FALSE', '', ''], ['', '', '', '', '']]
+    newSheet.refresh()
+    assert newSheet.getRows(stopRow=5) == [['x', 'y', 'z', '', ''], ['1', '1.5', 'TRUE', '', ''], ['2', '', 'FALSE', '', ''], ['', '', '', '', '']]
+
+    newSheet.delete()
+
+
+def test_toArrow_loadArrow(init, checkPreAndPostCondition, tmp_path):
+    pyarrow = pytest.importorskip('pyarrow')
+    parquet = pytest.importorskip('pyarrow.parquet')
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=4, rowCount=5)
+    newSheet.updateRows([['name', 'count', 'ok', ''], ['a', 1, 'TRUE', 'x'], ['b', '', 'FALSE', 2], ['c', 2.5, '', '']], bounded=True)
+
+    table = newSheet.toArrow()
+    assert table.column_names == ['name', 'count', 'ok', 'D']
+    assert table.column('count').type == pyarrow.float64()
+    assert table.column('count').to_pylist() == [1.0, None, 2.5]
+    assert table.column('ok').to_pylist() == [True, False, None]
+    assert table.column('D').to_pylist() == ['x', '2', None]  # Mixed-type columns become strings.
+
+    filenames = TEST_SS.snapshotToParquet(str(tmp_path))
+    assert len(filenames) == len(TEST_SS.sheets)
+    assert parquet.read_table(filenames[-1]).equals(table)
+
+    newSheet.loadArrow(pyarrow.table({'x': [1, 2], 'y': ['p', None]}), clearBelow=True)
+    assert newSheet.getColumn(1) == ['x', '1', '2', '', '']
+    assert newSheet.getColumn(2) == ['y', 'p', '', '', '']
+
+    newSheet.delete()
+
+
+def test_valueRenderOption(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    newSheet.updateRows([['a', '1', '2.5'], [True, 4, 'FALSE']], bounded=True)
+    assert newSheet.getRow(2) == ['TRUE', '4', 'FALSE']
+
+    newSheet.valueRenderOption = 'UNFORMATTED_VALUE'
+    assert newSheet.getRow(1) == ['a', 1, 2.5]
+    assert newSheet.getRow(2) == [True, 4, False]
+
+    newSheet.update('C3', '7')  # Values are cached the way Google Sheets will return them.
+    assert newSheet.get('C3') == 7
+    newSheet.refresh()
+    assert newSheet.get('C3') == 7
+
+    newSheet.refresh(valueRenderOption='FORMATTED_VALUE')  # This changes the setting.
+    assert newSheet.get('C3') == '7'
+    assert newSheet.valueRenderOption == 'FORMATTED_VALUE'
+    newSheet.update('C3', 8)  # Later writes are cached the same way as the refreshed data.
+    assert newSheet.get('C3') == '8'
+
+    with pytest.raises(ValueError):
+        newSheet.valueRenderOption = 'invalid'
+    with pytest.raises(ValueError):
+        newSheet.dateTimeRenderOption = 'invalid'
+
+    newSheet.delete()
+
+
+def test_format(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    newSheet.updateRows([[45000, 45001, 'text'], [45000, 45001, 1]], bounded=True)
+
+    with TEST_SS.batchFormatting():
+        newSheet.format('A1', numberFormat='DATE')
+        newSheet.format('B1', numberFormat='date')  # Merged into one request with the previous one.
+        newSheet.format('A1:C1', bold=True, background='light yellow', foreground=(0.5, 0.5, 0.5))
+        newSheet.format('C1:C3', horizontalAlignment='center', numberFormat='0.00', fontSize=14)
+        newSheet.format('A2', numberFormat='yyyy-mm-dd')  # Sent as a DATE format, not a NUMBER format.
+        newSheet.format('B2', numberFormat=('DATE', 'yyyy-mm-dd'))
+
+    newSheet.refresh()
+    assert newSheet.getRow(1)[2] == 'text'  # The number format doesn't change text...
+    assert newSheet.getRow(2) == ['2023-03-15', '2023-03-16', '1.00']  # ...but changes how numbers are shown.
+
+    newSheet.valueRenderOption = 'UNFORMATTED_VALUE'
+    newSheet.convertDates = True
+    assert newSheet.getRow(1) == [datetime.date(2023, 3, 15), datetime.date(2023, 3, 16), 'text']
+    assert newSheet.getRow(2)[:2] == [datetime.date(2023, 3, 15), datetime.date(2023, 3, 16)]
+
+    newSheet.format(newSheet['A2:B2'], italic=True)  # Sent right away outside of a block.
+    with pytest.raises(ValueError):
+        newSheet.format('A1', horizontalAlignment='sideways')
+    with pytest.raises(ValueError):
+        newSheet.format('A1', background='invalid color')
+    with pytest.raises(TypeError):
+        newSheet.format('A1', fontSize='big')
+
+    newSheet.delete()
+
+
+def test_find_findAll(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=4)
+    newSheet.updateRows([['apple', 'banana', 'cherry'], ['banana', 1, 'apple pie'], ['', 'banana', '']], bounded=True)
+
+    assert newSheet.find('banana') == (2, 1)
+    assert newSheet.findAll('banana') == [(2, 1), (1, 2), (2, 3)]
+    assert newSheet.findAll('banana', column='B') == [(2, 1), (2, 3)]
+    assert newSheet.find(1) == (2, 2)
+    assert newSheet.find('grape') is None
+    assert newSheet.findAll('apple', substring=True) == [(1, 1), (3, 2)]
+    assert newSheet.findAll(r'^b.n', regex=True, column=1) == [(1, 2)]
+
+    # The index is kept up to date as cells change:
+    newSheet['A1'] = 'banana'
+    newSheet['B3'] = ''
+    assert newSheet.findAll('banana') == [(1, 1), (2, 1), (1, 2)]
+    assert newSheet.find('apple') is None
+
+    assert 'cherry' in newSheet
+    assert 'pie' in newSheet
+    assert 'grape' not in newSheet
+    assert (1, 1) not in newSheet  # Cell coordinates aren't cell values.
+
+    newSheet.delete()
+
+
+def test_indexBy_upsertRows(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=3)
+    newSheet.updateRows([['id', 'name'], ['1', 'Alice'], ['2', 'Bob']], bounded=True)
+
+    index = newSheet.indexBy('A')
+    assert index['2'] == 3
+    assert dict(index) == {'id': 1, '1': 2, '2': 3}
+    assert 'not an id' not in index
+    newSheet['A3'] = '3'  # The index stays in sync with updates.
+    assert '2' not in index
+    assert index['3'] == 3
+
+    assert newSheet.upsertRows([['1', 'Alicia'], ['4', 'Dan'], ['5', 'Eve', 'extra']]) == [2, 4, 5]
+    assert newSheet.rowCount == 5
+    assert newSheet.columnCount == 3
+    assert newSheet.getColumn(2) == ['name', 'Alicia', 'Bob', 'Dan', 'Eve']
+    assert index['5'] == 5
+    newSheet.refresh()
+    assert newSheet.getColumn(1) == ['id', '1', '3', '4', '5']
+    assert newSheet.getColumn(2) == ['name', 'Alicia', 'Bob', 'Dan', 'Eve']
+    assert newSheet.getColumn(3) == ['', '', '', '', 'extra']
+
+    # The key is matched the way the sheet stores it, so '007' still matches the 7 after a refresh:
+    assert newSheet.upsertRows([['007', 'Bond']]) == [6]
+    assert newSheet.upsertRows([['007', 'James Bond']]) == [6]
+    newSheet.refresh()
+    assert newSheet.upsertRows([['007', 'Bond, James Bond']]) == [6]
+    assert newSheet.getRow(6)[:2] == ['7', 'Bond, James Bond']
+
+    newSheet.delete()
+
+
+def test_trim_usedRange(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=5, rowCount=6)
+    assert newSheet.usedRange is None
+    assert newSheet.getRows(trim=True) == []
+
+    newSheet.updateRows([['a', '', 'c'], ['', 'e']], bounded=True)
+    assert newSheet.getRows(trim=True) == [['a', '', 'c'], ['', 'e', '']]
+    assert newSheet.getColumns(trim=True) == [['a', ''], ['', 'e'], ['c', '']]
+    assert newSheet.usedRange.address == 'A1:C2'
+
+    newSheet['D4'] = 'x'
+    assert newSheet.usedRange.address == 'A1:D4'
+    newSheet['D4'] = ''
+    assert newSheet.usedRange.address == 'A1:C2'
+    newSheet.refresh()
+    assert newSheet.usedRange.address == 'A1:C2'
+    assert newSheet.getRows(startRow=2, trim=True) == [['', 'e', '']]
+
+    newSheet.delete()
+
+
+def test_query(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=6)
+    newSheet.updateRows([['Region', 'Product', 'Sales'],
+                         ['West', 'Apples', '10'],
+                         ['East', 'Apples', '5'],
+                         ['West', 'Pears', '7'],
+                         ['West', 'Apples', '3']], bounded=True)
+
+    assert newSheet.query(where={'Region': 'East'}) == [{'Region': 'East', 'Product': 'Apples', 'Sales': '5'}]
+    assert newSheet.query(where={'Region': 'West', 'C': lambda sales: int(sales) > 5}, select=['Product']) == [{'Product': 'Apples'}, {'Product': 'Pears'}]
+    assert newSheet.query(where=lambda row: row['Product'] == 'Pears', select=['Sales']) == [{'Sales': '7'}]
+    assert newSheet.query(where={'Region': 'West'}, groupBy='Product', agg={'Sales': 'sum'}) == [{'Product': 'Apples', 'Sales': 13}, {'Product': 'Pears', 'Sales': 7}]
+    assert newSheet.query(agg={'Sales': 'max', 'Region': 'count'}) == [{'Sales': 10, 'Region': 4}]
+    assert len(newSheet.query(header=None)) == 5
+    with pytest.raises(ValueError):
+        newSheet.query(select=['Not a column'])
+
+    assert newSheet.query(where={'Region': 'East'}, select=['Product'], pushdown=True) == [{'Product': 'Apples'}]
+    with pytest.raises(ValueError):
+        newSheet.query(where={'Product': 'Bob\'s "Apples"'}, pushdown=True)  # Quotes can't be escaped.
+
+    newSheet.delete()
+
+
+def test_rangeOperations(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=4)
+    newSheet.updateRows([['a', 'b', 'c'], ['d', 'e', 'f'], ['g', 'h', 'i']], bounded=True)
+
+    newSheet.clearRange('B2:C3')
+    assert newSheet.getRows(trim=True) == [['a', 'b', 'c'], ['d', '', ''], ['g', '', '']]
+
+    newSheet.copyRange('A1:B1', 'B3')
+    assert newSheet.getRow(3) == ['g', 'a', 'b']
+
+    newSheet.moveRange('A1:A2', 'C4')
+    assert newSheet.rowCount == 5
+    assert newSheet.getColumn(1) == ['', '', 'g', '', '']
+    assert newSheet.getColumn(3) == ['c', '', 'b', 'a', 'd']
+
+    newSheet.copyRange(newSheet['A3:C3'], 'C5')  # Copying past the edge of the sheet enlarges it.
+    assert (newSheet.columnCount, newSheet.rowCount) == (5, 5)
+    assert newSheet.getRow(5) == ['', '', 'g', 'a', 'b']
+
+    newSheet.insertRows(2, count=2)
+    assert newSheet.rowCount == 7
+    assert newSheet.getColumn(3) == ['c', '', '', '', 'b', 'a', 'g']
+    newSheet.deleteRows(1, count=3)
+    assert newSheet.rowCount == 4
+    assert newSheet.getColumn(3) == ['', 'b', 'a', 'g']
+
+    expected = newSheet.getRows()
+    newSheet.refresh()
+    assert newSheet.getRows() == expected
+
+    newSheet.clear()
+    assert newSheet.usedRange is None
+    newSheet.refresh()
+    assert newSheet.usedRange is None
+
+    with pytest.raises(ValueError):
+        newSheet.deleteRows(1, count=4)
+
+    newSheet.delete()
+    with pytest.raises(Exception):
+        newSheet.copyRange('A1:A1', 'A100')  # The sheet was deleted, so this request fails...
+    assert newSheet.rowCount == 4  # ...and the local grid size isn't changed.
+
+
+def test_enlargeGrowth(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=3, rowCount=4)
+
+    try:
+        ezsheets.ROW_GROWTH_FACTOR = 2.0
+        newSheet.update(1, 5, 'a')
+        assert newSheet.rowCount == 8 # The sheet doubled in size instead of growing by one row.
+        newSheet.update(1, 6, 'b')
+        assert newSheet.rowCount == 8
+
+        ezsheets.COMBINE_RESIZE_WITH_WRITES = True
+        newSheet.update(4, 9, 'c')
+        assert newSheet.rowCount == 16
+        assert newSheet.columnCount == 4
+        newSheet.refresh()
+        assert newSheet.rowCount == 16
+        assert newSheet.columnCount == 4
+        assert newSheet.getColumn(1)[4:6] == ['a', 'b']
+        assert newSheet.get(4, 9) == 'c'
+
+        # Writes that don't resize the sheet send their values the same way, so '$5' stays a string
+        # instead of being parsed into the currency value 5 (which would read as '$5.00'):
+        newSheet.update(2, 1, '$5')
+        newSheet.refresh()
+        assert newSheet.get(2, 1) == '$5'
+    finally:
+        ezsheets.ROW_GROWTH_FACTOR = 1.0
+        ezsheets.COMBINE_RESIZE_WITH_WRITES = False
+
+    newSheet.delete()
+
+
 def test_update_and_get(init, checkPreAndPostCondition):
     newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=4, rowCount=4)
 
@@ -664,6 +1345,43 @@ def test_sheet_getitem_setitem(init, checkPreAndPostCondition):
     newSheet.delete()
 
 
+def test_sheet_getitem_setitem_range(init, checkPreAndPostCondition):
+    newSheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=4, rowCount=4)
+
+    newSheet['A1:C2'] = [['a', 'b', 'c'], ['d', 'e', 'f']]
+    cellRange = newSheet['A1:C2']
+    assert cellRange == newSheet.getRange('A1:C2')
+    assert cellRange.address == 'A1:C2'
+    assert (cellRange.rowCount, cellRange.columnCount) == (2, 3)
+    assert cellRange.rows == [['a', 'b', 'c'], ['d', 'e', 'f']]
+    assert cellRange.toList() == [['a', 'b', 'c'], ['d', 'e', 'f']]
+    assert cellRange.columns == [['a', 'd'], ['b', 'e'], ['c', 'f']]
+    assert cellRange.values == ['a', 'b', 'c', 'd', 'e', 'f']
+    assert list(cellRange) == [['a', 'b', 'c'], ['d', 'e', 'f']]
+
+    # Cells in the range that aren't covered by the new rows are cleared:
+    newSheet['B2:C3'] = [['x']]
+    assert cellRange.rows == [['a', 'b', 'c'], ['d', 'x', '']] # Range objects are views of the sheet.
+    newSheet.refresh()
+    assert newSheet['A1:D4'].rows == [['a', 'b', 'c', ''], ['d', 'x', '', ''], ['', '', '', ''], ['', '', '', '']]
+
+    # Updating a range past the end of the sheet enlarges the sheet:
+    newSheet.getRange('D5:E5').update([['y', 'z']])
+    assert (newSheet.rowCount, newSheet.columnCount) == (5, 5)
+    assert newSheet['D5:E5'].rows == [['y', 'z']]
+
+    with pytest.raises(ValueError):
+        newSheet['A1:B1'] = [['too', 'many', 'columns']]
+    with pytest.raises(ValueError):
+        newSheet['A1:B1'] = [['too'], ['many'], ['rows']]
+    with pytest.raises(TypeError):
+        newSheet['A1:B1'] = 'not a list or tuple'
+    with pytest.raises(ValueError):
+        newSheet['C3:A1']
+
+    newSheet.delete()
+
+
 def test_gridProperties_settersGetters(init, checkPreAndPostCondition):
     # Test rowCount
     sheet = TEST_SS[0]
@@ -760,6 +1478,61 @@ def test_gridProperties_settersGetters(init, checkPreAndPostCondition):
     assert sheet.columnGroupControlAfter == False
 
 
+def test_setProperties_editProperties(init, checkPreAndPostCondition):
+    sheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=5, rowCount=5)
+
+    # The new rowCount is checked along with the new frozenRowCount:
+    sheet.setProperties(title='Renamed', tabColor='red', rowCount=20, frozenRowCount=10, hideGridlines=True)
+    assert (sheet.title, sheet.rowCount, sheet.frozenRowCount, sheet.hideGridlines) == ('Renamed', 20, 10, True)
+    assert sheet.tabColor == {'red': 1.0, 'green': 0.0, 'blue': 0.0, 'alpha': 1.0}
+    with pytest.raises(ValueError):
+        sheet.setProperties(rowCount=5, frozenRowCount=5)
+    with pytest.raises(TypeError):
+        sheet.setProperties(columnCount='invalid')
+
+    # Setting tabColor to None removes the tab color:
+    sheet.tabColor = None
+    assert sheet.tabColor is None
+    assert sheet.title == 'Renamed'  # The properties that weren't given are unchanged.
+    TEST_SS.refresh()
+    assert TEST_SS['Renamed'].tabColor is None
+
+    with sheet.editProperties():
+        sheet.title = 'Edited'
+        sheet.index = 0
+        sheet.frozenColumnCount = 2
+        assert sheet.title == 'Renamed'  # Nothing is sent until the block ends.
+    assert (sheet.title, sheet.index, sheet.frozenColumnCount) == ('Edited', 0, 2)
+    assert TEST_SS.sheetTitles == ('Edited', 'Sheet1')
+
+    with pytest.raises(ZeroDivisionError):
+        with sheet.editProperties():
+            sheet.title = 'Not Sent'
+            1 / 0
+    assert sheet.title == 'Edited'
+    TEST_SS.refresh()
+    assert TEST_SS[0].title == 'Edited'
+
+    TEST_SS[0].delete()
+
+
+def test_gridProperties_setterFieldMask(init, checkPreAndPostCondition):
+    sheet = TEST_SS.createSheet(title='New Sheet 1', columnCount=5, rowCount=5)
+    sheet.updateRow(1, ['kept'])
+
+    # Change the column count through another Sheet object, leaving `sheet` out of date:
+    otherSheet = ezsheets.Spreadsheet(TEST_SS.id)['New Sheet 1']
+    otherSheet.columnCount = 7
+
+    # Setting rowCount doesn't send the out of date columnCount or read the sheet first:
+    sheet.rowCount = 6
+    assert sheet.getRow(1)[0] == 'kept'
+    otherSheet.refresh()
+    assert (otherSheet.columnCount, otherSheet.rowCount) == (7, 6)
+
+    sheet.delete()
+
+
 def test_updateRow_updateColumn(init, checkPreAndPostCondition):
     sheet = TEST_SS[0]
 
@@ -834,6 +1607,47 @@ def test_convertAddress():
 
 
 
+def test_convertAddresses():
+    assert ezsheets.convertAddresses(['A2', 'B1']) == [(1, 2), (2, 1)]
+    assert ezsheets.convertAddresses([(1, 2), (2, 1)]) == ['A2', 'B1']
+    assert ezsheets.convertAddresses([[1, 2], 'B1']) == ['A2', (2, 1)]
+    assert ezsheets.convertAddresses(iter(['ZZZ10'])) == [(18278, 10)]
+    assert ezsheets.convertAddresses([(18279, 1)]) == ['AAAA1']
+    assert ezsheets.convertAddresses([]) == []
+
+    with pytest.raises(ValueError):
+        ezsheets.convertAddresses(['A1', 'A'])
+    with pytest.raises(TypeError):
+        ezsheets.convertAddresses([(0, 1)])
+
+
+def test_convertRange():
+    assert ezsheets.convertRange('A1:C3') == (1, 1, 3, 3)
+    assert ezsheets.convertRange('B2') == (2, 2, 2, 2)
+    assert ezsheets.convertRange('Sheet1!B2:C10') == (2, 2, 3, 10)
+    assert ezsheets.convertRange("'Sheet 1'!B2:C10") == (2, 2, 3, 10)
+    assert ezsheets.convertRange(1, 1, 3, 3) == 'A1:C3'
+    assert ezsheets.convertRange((2, 2, 3, 10)) == 'B2:C10'
+
+    with pytest.raises(ValueError):
+        ezsheets.convertRange('A:C')
+    with pytest.raises(ValueError):
+        ezsheets.convertRange('A1:B2:C3')
+    with pytest.raises(TypeError):
+        ezsheets.convertRange(1, 1, 3)
+    with pytest.raises(TypeError):
+        ezsheets.convertRange(0, 1, 3, 3)
+
+
+def test_convertSerialDate():
+    assert ezsheets.convertSerialDate(43831.5) == datetime.datetime(2020, 1, 1, 12, 0)
+    assert ezsheets.convertSerialDate(43831, 'DATE') == datetime.date(2020, 1, 1)
+    assert ezsheets.convertSerialDate(0.25, 'TIME') == datetime.time(6, 0)
+    assert ezsheets.convertSerialDate(0) == datetime.datetime(1899, 12, 30)
+
+    assert ezsheets._decodeSerialDates([['x', 43831, 43831], [True]], [[None, 'DATE', 'NUMBER'], ['DATE']]) == [['x', datetime.date(2020, 1, 1), 43831], [True]]
+
+
 def test_getitem(init, checkPreAndPostCondition):
     pass # TODO LEFT OFF
 